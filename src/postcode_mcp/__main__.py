@@ -1,10 +1,180 @@
-from postcode_mcp.server import mcp
+from __future__ import annotations
 
+import argparse
+import json
+import logging
+
+from postcode_mcp.app.logger import configure_logging
+
+
+def _ingest_juso(args: argparse.Namespace) -> None:
+    from postcode_mcp.infra.providers.juso_local import ingest
+
+    counts = ingest(
+        args.db,
+        road_files=args.road,
+        eng_files=args.eng,
+        detail_files=args.detail,
+        encoding=args.encoding,
+        batch_size=args.batch_size,
+    )
+    print(f"ingested into {args.db}: {counts}")
+
+
+def _batch(args: argparse.Namespace) -> None:
+    from postcode_mcp.app.batch import run_batch_sync
+    from postcode_mcp.app.container import build_container
+
+    container = build_container()
+    try:
+        stats = run_batch_sync(
+            container,
+            input_path=args.input,
+            output_path=args.output,
+            fmt=args.format,
+            query_field=args.query_field,
+            hint_city=args.hint_city,
+            max_candidates=args.max_candidates,
+            chunk_size=args.chunk_size,
+            concurrency=args.concurrency,
+            checkpoint_path=args.checkpoint,
+            restart=args.restart,
+        )
+        out = stats.to_dict()
+        if container.fixtures is not None:
+            # HTTP_FIXTURE_MODE=record/replay: 기록/재생/누락 응답 수
+            out["fixtures"] = container.fixtures.stats()
+    finally:
+        # 디스크 캐시/fixture 저장소 flush
+        container.close()
+    print(json.dumps(out, ensure_ascii=False))
+
+
+def _loadtest(args: argparse.Namespace) -> None:
+    import asyncio
+
+    from postcode_mcp.app.loadtest import DEFAULT_TOOLS, UpstreamProfile, compare, run_loadtest
+
+    report = asyncio.run(
+        run_loadtest(
+            tools=tuple(args.tools or DEFAULT_TOOLS),
+            requests=args.requests,
+            concurrency=args.concurrency,
+            distinct_queries=args.distinct_queries,
+            profile=UpstreamProfile(
+                latency_ms=args.latency_ms,
+                latency_sigma=args.latency_sigma,
+                error_rate=args.error_rate,
+                api_error_rate=args.api_error_rate,
+                seed=args.seed,
+            ),
+        )
+    )
+    report.save(args.output)
+    summary = {t.tool: {"rps": t.throughput_rps, **t.latency_ms, "errors": t.errors} for t in report.tools}
+    print(json.dumps(summary, ensure_ascii=False))
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(report.to_dict(), json.load(f), tolerance=args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            raise SystemExit(1)
+
+
+def _startup_bench(args: argparse.Namespace) -> None:
+    from postcode_mcp.app.startup import measure_startup
+
+    result = measure_startup(runs=args.runs, budget_ms=args.budget_ms)
+    print(json.dumps(result, ensure_ascii=False))
+    if not result["within_budget"]:
+        raise SystemExit(1)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m postcode_mcp")
+    sub = parser.add_subparsers(dest="command")
+
+    ingest = sub.add_parser(
+        "ingest-juso",
+        help="행안부 도로명주소 전체분 파일(한글/영문/상세주소)로 로컬 주소 인덱스(JUSO_LOCAL_DB) 생성",
+    )
+    ingest.add_argument("--db", required=True, help="생성/갱신할 인덱스 파일 경로")
+    ingest.add_argument("--road", nargs="*", default=[], help="도로명주소 한글 전체분 파일들")
+    ingest.add_argument("--eng", nargs="*", default=[], help="도로명주소 영문 전체분 파일들")
+    ingest.add_argument("--detail", nargs="*", default=[], help="상세주소 DB 파일들")
+    ingest.add_argument("--encoding", default="cp949")
+    ingest.add_argument("--batch-size", type=int, default=10_000)
+
+    batch = sub.add_parser(
+        "batch",
+        help="CSV/JSONL 주소 파일을 정규화해 결과 파일로 저장 (checkpoint로 중단 지점부터 재개)",
+    )
+    batch.add_argument("input", help="입력 파일 (.csv 또는 .jsonl)")
+    batch.add_argument("output", help="출력 파일 (입력과 같은 형식)")
+    batch.add_argument("--format", choices=["csv", "jsonl"], default=None, help="기본: 입력 확장자로 판단")
+    batch.add_argument("--query-field", default="query", help="주소 문자열이 들어있는 컬럼/키")
+    batch.add_argument("--hint-city", default=None)
+    batch.add_argument("--max-candidates", type=int, default=1)
+    batch.add_argument("--chunk-size", type=int, default=500, help="한 번에 읽고 checkpoint하는 행 수")
+    batch.add_argument("--concurrency", type=int, default=None, help="기본: BATCH_CONCURRENCY")
+    batch.add_argument("--checkpoint", default=None, help="기본: <output>.ckpt")
+    batch.add_argument("--restart", action="store_true", help="checkpoint를 무시하고 처음부터 다시 처리")
+
+    loadtest = sub.add_parser(
+        "loadtest",
+        help="가짜 Juso 서버로 tool들을 HTTP transport로 부하 테스트하고 결과를 JSON으로 저장 (실제 API 호출 없음)",
+    )
+    loadtest.add_argument("--tools", nargs="+", default=None, help="기본: resolve_postcode_auto 등 주요 tool 4개")
+    loadtest.add_argument("--requests", type=int, default=200, help="tool별 호출 수")
+    loadtest.add_argument("--concurrency", type=int, default=16, help="동시 MCP session 수")
+    loadtest.add_argument("--distinct-queries", type=int, default=0, help="서로 다른 검색어 수 (0: 전부 다름)")
+    loadtest.add_argument("--latency-ms", type=float, default=30.0, help="가짜 upstream 응답시간 중앙값")
+    loadtest.add_argument("--latency-sigma", type=float, default=0.5, help="log-normal 분산 (0: 고정)")
+    loadtest.add_argument("--error-rate", type=float, default=0.0, help="HTTP 503 비율")
+    loadtest.add_argument("--api-error-rate", type=float, default=0.0, help="errorCode=-999 응답 비율")
+    loadtest.add_argument("--seed", type=int, default=None)
+    loadtest.add_argument("--output", default="loadtest-results.json")
+    loadtest.add_argument("--baseline", default=None, help="비교할 이전 결과 JSON (회귀 시 exit 1)")
+    loadtest.add_argument("--tolerance", type=float, default=0.2, help="회귀로 보는 변화 비율")
+
+    startup = sub.add_parser(
+        "startup-bench",
+        help="새 프로세스에서 서버 import → 첫 tools/list까지 시간을 재고 예산을 넘으면 exit 1",
+    )
+    startup.add_argument("--runs", type=int, default=5, help="측정 횟수 (중앙값 사용)")
+    startup.add_argument("--budget-ms", type=float, default=300.0)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "ingest-juso":
+        configure_logging()
+        _ingest_juso(args)
+        return
+
+    if args.command == "batch":
+        configure_logging()
+        _batch(args)
+        return
+
+    if args.command == "loadtest":
+        configure_logging()
+        # 요청마다 찍히는 HTTP client 로그가 측정값에 섞이지 않도록
+        for name in ("httpx", "httpx2", "mcp"):
+            logging.getLogger(name).setLevel(logging.WARNING)
+        _loadtest(args)
+        return
+
+    if args.command == "startup-bench":
+        _startup_bench(args)
+        return
+
+    # 기본: MCP 서버 실행
+    from postcode_mcp.server import mcp
 
-def main() -> None:
     mcp.run()
 
 
 if __name__ == "__main__":
     main()
-
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import asyncio
+import csv
+import json
+import logging
+import os
+import time
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
+from itertools import islice
+from typing import Any, TextIO
+
+from postcode_mcp.app.container import Container
+from postcode_mcp.core.errors import ValidationError
+
+log = logging.getLogger(__name__)
+
+# CSV 출력에 덧붙이는 컬럼 (입력 컬럼과 겹치지 않도록 norm_ 접두어)
+CSV_RESULT_FIELDS = ("road_addr", "jibun_addr", "postcode5", "building_name", "confidence")
+CSV_ERROR_FIELD = "norm_error"
+
+
+@dataclass
+class BatchStats:
+    rows: int  # 이번 실행에서 처리한 행 수
+    resumed_from: int  # checkpoint에서 이어받은 행 수 (처음부터면 0)
+    errors: int
+    elapsed_seconds: float
+    rows_per_second: float
+    cache_hit_ratio: float
+    upstream_calls: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class _Checkpoint:
+    input: str
+    rows_done: int
+    output_bytes: int
+
+
+def _detect_format(path: str, fmt: str | None) -> str:
+    if fmt:
+        fmt = fmt.lower()
+    else:
+        fmt = "csv" if path.lower().endswith(".csv") else "jsonl"
+    if fmt not in ("csv", "jsonl"):
+        raise ValidationError(f"Unsupported batch format: {fmt!r} (csv | jsonl)")
+    return fmt
+
+
+def _read_rows(f: TextIO, fmt: str) -> Iterator[dict[str, Any]]:
+    if fmt == "csv":
+        yield from csv.DictReader(f)
+        return
+    for line in f:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            # 깨진 줄 하나로 배치 전체를 멈추지 않음 → 원문을 보존하고 EMPTY_QUERY 에러 행으로 출력
+            log.warning("batch: invalid JSON line skipped: %.80s", line)
+            yield {"_invalid_line": line}
+            continue
+        # 문자열만 있는 줄은 {"query": ...}로 취급
+        yield row if isinstance(row, dict) else {"query": str(row)}
+
+
+def _load_checkpoint(path: str, input_path: str) -> _Checkpoint | None:
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        ckpt = _Checkpoint(**json.load(f))
+    if ckpt.input != input_path:
+        raise ValidationError(
+            f"Checkpoint {path} belongs to {ckpt.input!r}, not {input_path!r} (use --restart to start over)"
+        )
+    return ckpt
+
+
+def _save_checkpoint(path: str, ckpt: _Checkpoint) -> None:
+    # 임시 파일에 쓰고 rename → 도중에 죽어도 checkpoint가 깨지지 않음
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(asdict(ckpt), f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _cache_counters(container: Container) -> tuple[int, int]:
+    """(hits, lookups). L1 miss 후 디스크 L2에서 찾은 경우도 hit로 셈."""
+    stats = container.cache.stats()
+    l1 = stats["l1"]
+    hits = l1["hits"] + stats.get("l2", {}).get("hits", 0)
+    return hits, l1["hits"] + l1["misses"]
+
+
+def _hit_ratio(container: Container, before: tuple[int, int]) -> float:
+    hits, lookups = _cache_counters(container)
+    hits -= before[0]
+    lookups -= before[1]
+    return round(hits / lookups, 4) if lookups else 0.0
+
+
+def _upstream_calls(container: Container) -> int:
+    return container.http.stats()["requests"] + container.async_http.stats()["requests"]
+
+
+async def run_batch(
+    container: Container,
+    *,
+    input_path: str,
+    output_path: str,
+    fmt: str | None = None,
+    query_field: str = "query",
+    hint_city: str | None = None,
+    max_candidates: int = 1,
+    chunk_size: int = 500,
+    concurrency: int | None = None,
+    checkpoint_path: str | None = None,
+    restart: bool = False,
+) -> BatchStats:
+    """
+    CSV/JSONL 주소 파일을 chunk_size 행씩 읽어 AddressService.aresolve_batch로 정규화하고,
+    결과 행을 output_path에 바로 이어 씁니다 (메모리 사용량은 chunk_size에 비례).
+
+    - chunk마다 출력을 fsync한 뒤 checkpoint(처리한 행 수, 출력 파일 크기)를 기록
+    - checkpoint가 있으면 출력 파일을 기록된 크기로 자르고 그다음 행부터 이어서 처리
+    - 정상 종료 시 checkpoint 삭제
+    - 캐시는 컨테이너 것을 그대로 사용 → POSTCODE_CACHE_BACKEND=sqlite면 재실행 시 겹치는 주소는 upstream 호출 없음
+    """
+    fmt = _detect_format(input_path, fmt)
+    input_path = os.path.abspath(input_path)
+    checkpoint_path = checkpoint_path or f"{output_path}.ckpt"
+    concurrency = concurrency or container.settings.batch_concurrency
+
+    ckpt = None if restart else _load_checkpoint(checkpoint_path, input_path)
+    resumed_from = ckpt.rows_done if ckpt else 0
+
+    out = open(output_path, "r+" if ckpt else "w", encoding="utf-8", newline="")
+    if ckpt:
+        # 마지막 checkpoint 이후에 쓰다 만 부분은 버림
+        out.truncate(ckpt.output_bytes)
+        out.seek(ckpt.output_bytes)
+
+    started = time.perf_counter()
+    cache_before = _cache_counters(container)
+    upstream_before = _upstream_calls(container)
+    rows_done = resumed_from
+    errors = 0
+    writer: csv.DictWriter[str] | None = None
+
+    with open(input_path, encoding="utf-8", newline="") as f, out:
+        rows = islice(_read_rows(f, fmt), resumed_from, None)
+        while chunk := list(islice(rows, chunk_size)):
+            result = await container.address_service.aresolve_batch(
+                [str(row.get(query_field) or "") for row in chunk],
+                hint_city=hint_city,
+                max_candidates=max_candidates,
+                concurrency=concurrency,
+            )
+
+            if fmt == "csv":
+                if writer is None:
+                    fieldnames = [*chunk[0].keys(), *(f"norm_{k}" for k in CSV_RESULT_FIELDS), CSV_ERROR_FIELD]
+                    writer = csv.DictWriter(out, fieldnames=fieldnames, extrasaction="ignore")
+                    if rows_done == 0:
+                        writer.writeheader()
+                for row, item in zip(chunk, result.items, strict=True):
+                    best = item["normalized"] or {}
+                    writer.writerow(
+                        {
+                            **row,
+                            **{f"norm_{k}": best.get(k) for k in CSV_RESULT_FIELDS},
+                            CSV_ERROR_FIELD: (item["error"] or {}).get("errorCode"),
+                        }
+                    )
+            else:
+                for row, item in zip(chunk, result.items, strict=True):
+                    record = {**row, "normalized": item["normalized"], "message": item["message"], "error": item["error"]}
+                    if max_candidates > 1:
+                        record["candidates"] = item["candidates"]
+                    out.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+            out.flush()
+            os.fsync(out.fileno())
+            rows_done += len(chunk)
+            errors += result.meta["errors"]
+            _save_checkpoint(checkpoint_path, _Checkpoint(input_path, rows_done, out.tell()))
+
+            elapsed = time.perf_counter() - started
+            log.info(
+                "batch: %d rows (%.1f rows/s), cache hit ratio %.2f, upstream calls %d",
+                rows_done,
+                (rows_done - resumed_from) / elapsed if elapsed else 0.0,
+                _hit_ratio(container, cache_before),
+                _upstream_calls(container) - upstream_before,
+            )
+
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+
+    elapsed = time.perf_counter() - started
+    processed = rows_done - resumed_from
+    return BatchStats(
+        rows=processed,
+        resumed_from=resumed_from,
+        errors=errors,
+        elapsed_seconds=round(elapsed, 3),
+        rows_per_second=round(processed / elapsed, 1) if elapsed else 0.0,
+        cache_hit_ratio=_hit_ratio(container, cache_before),
+        upstream_calls=_upstream_calls(container) - upstream_before,
+    )
+
+
+def run_batch_sync(container: Container, **kwargs: Any) -> BatchStats:
+    """CLI용: run_batch를 새 이벤트 루프에서 실행하고 async HTTP 클라이언트를 정리."""
+
+    async def _main() -> BatchStats:
+        try:
+            if container.settings.http_prewarm:
+                await container.async_http.prewarm(container.endpoints)
+            return await run_batch(container, **kwargs)
+        finally:
+            await container.async_http.aclose()
+
+    return asyncio.run(_main())
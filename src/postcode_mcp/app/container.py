@@ -1,16 +1,30 @@
 from __future__ import annotations
 
 import os
+import threading
+from collections.abc import Callable
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
 from postcode_mcp.app.settings import Settings, get_settings
-from postcode_mcp.infra.cache import Cache
-from postcode_mcp.infra.http import HttpClient
-from postcode_mcp.infra.providers.juso import JusoProvider
-from postcode_mcp.infra.providers.juso_detail import JusoDetailProvider
-from postcode_mcp.infra.providers.juso_eng import JusoEnglishProvider
-from postcode_mcp.services.postcode_service import PostcodeService
-from postcode_mcp.services.address_service import AddressService
+
+if TYPE_CHECKING:
+    # 실제 import는 build_container 안에서 (모듈 import만으로 httpx/provider/rapidfuzz를 읽지 않도록)
+    import httpx
+
+    from postcode_mcp.infra.cache import Cache
+    from postcode_mcp.infra.fixtures import HttpFixtures
+    from postcode_mcp.infra.hedging import Hedger
+    from postcode_mcp.infra.http import AsyncHttpClient, HttpClient
+    from postcode_mcp.infra.metrics import ToolMetrics
+    from postcode_mcp.infra.providers.juso import JusoProvider
+    from postcode_mcp.infra.providers.juso_detail import JusoDetailProvider
+    from postcode_mcp.infra.providers.juso_eng import JusoEnglishProvider
+    from postcode_mcp.infra.providers.juso_local import LocalJusoIndex
+    from postcode_mcp.infra.ratelimit import RateLimiter
+    from postcode_mcp.infra.retry import RetryBudget
+    from postcode_mcp.services.address_service import AddressService
+    from postcode_mcp.services.postcode_service import PostcodeService
 
 
 @dataclass(frozen=True)
@@ -18,61 +32,301 @@ class Container:
     settings: Settings
     cache: Cache
     http: HttpClient
+    async_http: AsyncHttpClient
+    rate_limiter: RateLimiter
+    retry_budget: RetryBudget
+    hedger: Hedger | None
+    # 원격 호출이 설정된 upstream endpoint URL들 (연결 prewarm 대상)
+    endpoints: tuple[str, ...]
     juso: JusoProvider
     juso_detail: JusoDetailProvider | None
     juso_english: JusoEnglishProvider | None
+    local_index: LocalJusoIndex | None
     postcode_service: PostcodeService
     address_service: AddressService
+    tool_metrics: ToolMetrics
+    # upstream 응답 기록/재생 저장소 (HTTP_FIXTURE_MODE=off면 None)
+    fixtures: HttpFixtures | None = None
 
+    def close(self) -> None:
+        """
+        종료 시 호출: 디스크 L2/fixture 저장소 flush, sync HTTP 연결과 로컬 인덱스 닫기.
+        async 클라이언트는 이벤트 루프 안에서 aclose()로 닫습니다.
+        """
+        self.cache.close()
+        if self.fixtures is not None:
+            self.fixtures.close()
+        self.http.close()
+        if self.local_index is not None:
+            self.local_index.close()
 
-def build_container() -> Container:
-    settings = get_settings()
+    async def aclose(self) -> None:
+        await self.async_http.aclose()
+        self.close()
 
-    cache = Cache(maxsize=settings.cache_maxsize, ttl_seconds=settings.cache_ttl_seconds)
-    http = HttpClient(timeout_seconds=settings.http_timeout_seconds, user_agent=settings.http_user_agent)
 
-    juso = JusoProvider(
-        http=http,
-        confm_key=settings.juso_road_key,
-        count_per_page=settings.juso_count_per_page,
-        first_sort=settings.juso_first_sort,
-        add_info_yn=settings.juso_add_info_yn,
-        cache=cache,
+def build_container(
+    settings: Settings | None = None,
+    *,
+    transport: httpx.BaseTransport | None = None,
+    async_transport: httpx.AsyncBaseTransport | None = None,
+    tool_metrics: ToolMetrics | None = None,
+) -> Container:
+    """
+    설정으로부터 전체 의존성 그래프를 만듭니다.
+    transport/async_transport는 테스트에서 httpx.MockTransport 등을 주입할 때 사용합니다.
+    tool_metrics는 container보다 먼저 만들어진 MetricsMiddleware와 통계를 공유할 때 넘깁니다.
+    """
+    import httpx
+
+    from postcode_mcp.infra.cache import Cache
+    from postcode_mcp.infra.circuit import CircuitBreaker
+    from postcode_mcp.infra.fixtures import MODES as FIXTURE_MODES
+    from postcode_mcp.infra.fixtures import OFF as FIXTURE_OFF
+    from postcode_mcp.infra.http import AsyncHttpClient, HttpClient
+    from postcode_mcp.infra.metrics import ToolMetrics
+    from postcode_mcp.infra.providers.juso import JUSO_API_URL, JusoProvider
+    from postcode_mcp.infra.providers.juso_detail import DETAIL_API_URL, JusoDetailProvider
+    from postcode_mcp.infra.providers.juso_eng import ROAD_API_URL as ENG_API_URL
+    from postcode_mcp.infra.providers.juso_eng import JusoEnglishProvider
+    from postcode_mcp.infra.ratelimit import RateLimiter
+    from postcode_mcp.infra.retry import RetryBudget, RetryPolicy
+    from postcode_mcp.services.address_service import AddressService
+    from postcode_mcp.services.postcode_service import PostcodeService
+
+    settings = settings or get_settings()
+
+    l2 = None
+    if settings.cache_backend == "sqlite":
+        from postcode_mcp.infra.disk_cache import SqliteCache
+
+        l2 = SqliteCache(
+            path=settings.cache_sqlite_path,
+            ttl_seconds=settings.cache_ttl_seconds + settings.cache_stale_ttl_seconds,
+        )
+    elif settings.cache_backend != "memory":
+        raise RuntimeError(f"Unknown POSTCODE_CACHE_BACKEND: {settings.cache_backend!r} (memory | sqlite)")
+
+    negative = None
+    if settings.negative_cache_ttl_seconds > 0:
+        from postcode_mcp.infra.negative_cache import NegativeCache
+
+        negative = NegativeCache(
+            ttl_seconds=settings.negative_cache_ttl_seconds,
+            capacity=settings.negative_cache_capacity,
+            error_rate=settings.negative_cache_error_rate,
+        )
+
+    cache = Cache(
+        maxsize=settings.cache_maxsize,
+        ttl_seconds=settings.cache_ttl_seconds,
+        l2=l2,
+        negative=negative,
+        stale_ttl_seconds=settings.cache_stale_ttl_seconds,
+    )
+    # sync/async 클라이언트가 같은 limiter를 공유 → 경로와 무관하게 endpoint × 키 단위로 제한
+    rate_limiter = RateLimiter(
+        rate_per_second=settings.juso_rate_per_second,
+        burst=settings.juso_rate_burst,
+        min_concurrency=settings.juso_min_concurrency,
+        max_concurrency=settings.juso_max_concurrency,
+    )
+    retry = RetryPolicy(
+        max_attempts=settings.http_max_attempts,
+        base_delay_seconds=settings.http_retry_base_delay_seconds,
+        max_delay_seconds=settings.http_retry_max_delay_seconds,
+    )
+    # 재시도 예산도 전역으로 하나 (장애 시 재시도가 전체 요청의 ratio 비율을 넘지 않도록)
+    retry_budget = RetryBudget(ratio=settings.http_retry_budget_ratio)
+    limits = httpx.Limits(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry_seconds,
+    )
+    if settings.http_fixture_mode not in FIXTURE_MODES:
+        raise RuntimeError(f"Unknown HTTP_FIXTURE_MODE: {settings.http_fixture_mode!r} (off | record | replay)")
+    fixtures = None
+    if settings.http_fixture_mode != FIXTURE_OFF:
+        from postcode_mcp.infra.fixtures import HttpFixtures
+
+        # sync/async 클라이언트가 같은 저장소를 공유
+        fixtures = HttpFixtures(
+            path=settings.http_fixture_path,
+            mode=settings.http_fixture_mode,
+            replay_latency=settings.http_fixture_replay_latency,
+        )
+    http = HttpClient(
+        timeout_seconds=settings.http_timeout_seconds,
+        user_agent=settings.http_user_agent,
+        transport=transport,
+        limiter=rate_limiter,
+        retry=retry,
+        retry_budget=retry_budget,
+        limits=limits,
+        http2=settings.http_http2,
+        fixtures=fixtures,
     )
+    hedger = None
+    if settings.http_hedge_max_ratio > 0:
+        from postcode_mcp.infra.hedging import Hedger
+
+        hedger = Hedger(
+            percentile=settings.http_hedge_percentile,
+            max_ratio=settings.http_hedge_max_ratio,
+            min_delay_seconds=settings.http_hedge_min_delay_seconds,
+        )
+    async_http = AsyncHttpClient(
+        timeout_seconds=settings.http_timeout_seconds,
+        user_agent=settings.http_user_agent,
+        transport=async_transport,
+        limiter=rate_limiter,
+        retry=retry,
+        retry_budget=retry_budget,
+        hedger=hedger,
+        limits=limits,
+        http2=settings.http_http2,
+        fixtures=fixtures,
+    )
+
+    # 로컬 주소 인덱스(JUSO_LOCAL_DB)가 있으면 로컬 우선 + 원격 fallback provider 사용
+    local_index = None
+    if settings.juso_local_db:
+        from postcode_mcp.infra.providers.juso_local import (
+            LocalJusoDetailProvider,
+            LocalJusoEnglishProvider,
+            LocalJusoIndex,
+            LocalJusoProvider,
+        )
+
+        local_index = LocalJusoIndex(settings.juso_local_db)
+
+    def breaker(name: str) -> CircuitBreaker:
+        return CircuitBreaker(
+            name,
+            failure_threshold=settings.circuit_failure_threshold,
+            reset_timeout_seconds=settings.circuit_reset_seconds,
+        )
+
+    # endpoint override (프록시/사설망 게이트웨이, 부하 테스트용 가짜 서버 등)
+    search_url = (os.getenv("JUSO_API_URL") or "").strip() or JUSO_API_URL
+    detail_url = (os.getenv("JUSO_DETAIL_API_URL") or "").strip() or DETAIL_API_URL
+
+    juso_kwargs: dict[str, Any] = {
+        "http": http,
+        "api_url": search_url,
+        "confm_key": settings.juso_road_key,
+        "count_per_page": settings.juso_count_per_page,
+        "first_sort": settings.juso_first_sort,
+        "add_info_yn": settings.juso_add_info_yn,
+        "cache": cache,
+        "async_http": async_http,
+        "circuit_breaker": breaker("search"),
+    }
+    juso = LocalJusoProvider(index=local_index, **juso_kwargs) if local_index else JusoProvider(**juso_kwargs)
 
     juso_detail = None
-    if settings.juso_detail_key:
-        juso_detail = JusoDetailProvider(http=http, confm_key=settings.juso_detail_key, timeout_seconds=settings.http_timeout_seconds)
+    if settings.juso_detail_key or local_index:
+        detail_kwargs: dict[str, Any] = {
+            "http": http,
+            "api_url": detail_url,
+            "confm_key": settings.juso_detail_key or "",
+            "timeout_seconds": settings.http_timeout_seconds,
+            "async_http": async_http,
+            "cache": cache,
+            "circuit_breaker": breaker("detail"),
+        }
+        juso_detail = (
+            LocalJusoDetailProvider(index=local_index, **detail_kwargs)
+            if local_index
+            else JusoDetailProvider(**detail_kwargs)
+        )
 
-    # English provider (키 + URL 둘 다 있어야 활성)
+    # English provider (키 + URL 둘 다 있어야 원격 활성, 로컬 인덱스만 있어도 활성)
     juso_english = None
     eng_url = (os.getenv("JUSO_ENG_API_URL") or "").strip()
-    if settings.juso_eng_key and eng_url:
-        juso_english = JusoEnglishProvider(
-            http=http,
-            confm_key=settings.juso_eng_key,
-            count_per_page=settings.juso_count_per_page,
-            first_sort=settings.juso_first_sort,
-            add_info_yn=settings.juso_add_info_yn,
-            api_url=eng_url,
-            timeout_seconds=settings.http_timeout_seconds,
-            cache=cache,
+    remote_english = bool(settings.juso_eng_key and eng_url)
+    if remote_english or local_index:
+        eng_kwargs: dict[str, Any] = {
+            "http": http,
+            "confm_key": settings.juso_eng_key if remote_english else "",
+            "count_per_page": settings.juso_count_per_page,
+            "first_sort": settings.juso_first_sort,
+            "add_info_yn": settings.juso_add_info_yn,
+            "api_url": eng_url or ENG_API_URL,
+            "timeout_seconds": settings.http_timeout_seconds,
+            "cache": cache,
+            "async_http": async_http,
+            "circuit_breaker": breaker("english"),
+        }
+        juso_english = (
+            LocalJusoEnglishProvider(index=local_index, **eng_kwargs)
+            if local_index
+            else JusoEnglishProvider(**eng_kwargs)
         )
 
+    endpoints = tuple(
+        url
+        for url, enabled in (
+            (search_url, bool(settings.juso_road_key)),
+            (detail_url, bool(settings.juso_detail_key)),
+            (eng_url, remote_english),
+        )
+        if enabled
+    )
+    # 첫 요청이 DNS/TCP/TLS 비용을 내지 않도록 sync 클라이언트 연결을 백그라운드로 미리 맺음
+    # (async 클라이언트 연결은 이벤트 루프에 묶이므로 루프가 뜬 뒤 server lifespan/batch에서 prewarm)
+    if settings.http_prewarm and endpoints:
+        threading.Thread(target=http.prewarm, args=(endpoints,), name="http-prewarm", daemon=True).start()
+
     postcode_service = PostcodeService(juso=juso)
     address_service = AddressService(
         postcode_service=postcode_service,
         detail_provider=juso_detail,
         english_provider=juso_english,
+        stage_timeout_seconds=settings.stage_timeout_seconds,
     )
 
     return Container(
         settings=settings,
         cache=cache,
         http=http,
+        async_http=async_http,
+        rate_limiter=rate_limiter,
+        retry_budget=retry_budget,
+        hedger=hedger,
+        endpoints=endpoints,
         juso=juso,
         juso_detail=juso_detail,
         juso_english=juso_english,
+        local_index=local_index,
         postcode_service=postcode_service,
         address_service=address_service,
+        tool_metrics=tool_metrics or ToolMetrics(),
+        fixtures=fixtures,
     )
+
+
+class LazyContainer:
+    """
+    build_container()를 첫 get() 때 한 번만 실행합니다 (thread-safe).
+    stdio처럼 세션마다 프로세스를 띄우는 경우 initialize/tools/list 응답이
+    의존성 생성(HTTP 클라이언트, provider, 디스크 캐시/로컬 인덱스 연결)을 기다리지 않도록 함.
+    """
+
+    def __init__(self, factory: Callable[[], Container] = build_container) -> None:
+        self._factory = factory
+        self._container: Container | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def built(self) -> bool:
+        return self._container is not None
+
+    def get(self) -> Container:
+        container = self._container
+        if container is None:
+            with self._lock:
+                if self._container is None:
+                    self._container = self._factory()
+                container = self._container
+        return container
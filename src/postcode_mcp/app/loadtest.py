@@ -0,0 +1,416 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import http.server
+import json
+import logging
+import math
+import os
+import platform
+import random
+import socket
+import threading
+import time
+import zlib
+from collections.abc import Callable, Iterator
+from contextlib import AsyncExitStack, contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from importlib import metadata
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from postcode_mcp.app.container import build_container
+from postcode_mcp.app.middleware import MetricsMiddleware
+from postcode_mcp.app.settings import get_settings
+
+log = logging.getLogger(__name__)
+
+SEARCH_ENDPOINT = "addrLinkApi.do"
+DETAIL_ENDPOINT = "addrDetailApi.do"
+ENGLISH_ENDPOINT = "addrEngApi.do"
+
+# tool 이름 → (검색어 → tool arguments)
+SCENARIOS: dict[str, Callable[[str], dict[str, Any]]] = {
+    "resolve_postcode_auto": lambda q: {"query": q},
+    "normalize_address": lambda q: {"query": q},
+    "get_postcode": lambda q: {"road_addr": q},
+    "get_english_address": lambda q: {"road_addr": q},
+    "normalize_addresses_batch": lambda q: {"queries": [f"{q}-{j}" for j in range(10)]},
+}
+DEFAULT_TOOLS = ("resolve_postcode_auto", "normalize_address", "get_postcode", "get_english_address")
+
+
+@dataclass
+class UpstreamProfile:
+    """
+    가짜 Juso 서버의 응답 특성.
+    - 응답시간: 중앙값 latency_ms, 분산 latency_sigma인 log-normal (sigma 0이면 고정)
+    - error_rate: HTTP 503 비율 (재시도 대상), api_error_rate: errorCode=-999(과부하) 응답 비율
+    """
+
+    latency_ms: float = 30.0
+    latency_sigma: float = 0.5
+    error_rate: float = 0.0
+    api_error_rate: float = 0.0
+    results_per_query: int = 3
+    seed: int | None = None
+
+
+def _item(keyword: str, n: int) -> dict[str, Any]:
+    # 검색어마다 다른 건물 코드 → 상세/영문 캐시도 검색어 단위로 갈림
+    code = zlib.crc32(keyword.encode("utf-8")) % 100_000
+    return {
+        "roadAddr": f"경기도 수원시 팔달구 효원로 {code}-{n}",
+        "roadAddrPart1": f"경기도 수원시 팔달구 효원로 {code}-{n}",
+        "jibunAddr": f"경기도 수원시 팔달구 인계동 {code}-{n}",
+        "engAddr": f"{code}-{n} Hyowon-ro, Paldal-gu, Suwon-si, Gyeonggi-do",
+        "zipNo": f"{16000 + code % 1000:05d}",
+        "bdNm": f"건물{n}",
+        "admCd": "4111514100",
+        "rnMgtSn": "411153180008",
+        "udrtYn": "0",
+        "buldMnnm": str(code),
+        "buldSlno": str(n),
+        "bdMgtSn": f"41115141001{code:05d}{n}",
+        "siNm": "경기도",
+        "sggNm": "수원시 팔달구",
+    }
+
+
+def _payload(items: list[dict[str, Any]], *, error_code: str = "0") -> dict[str, Any]:
+    return {
+        "results": {
+            "common": {
+                "errorCode": error_code,
+                "errorMessage": "정상" if error_code == "0" else "시스템 에러",
+                "totalCount": str(len(items)),
+                "currentPage": "1",
+                "countPerPage": str(len(items)),
+            },
+            "juso": items,
+        }
+    }
+
+
+class FakeJusoServer:
+    """
+    addrLinkApi / addrDetailApi / addrEngApi를 흉내 내는 로컬 HTTP 서버 (부하 테스트용).
+    endpoint별 GET 호출 수를 calls에 기록합니다 (prewarm HEAD는 제외).
+    """
+
+    def __init__(self, profile: UpstreamProfile | None = None) -> None:
+        self.profile = profile or UpstreamProfile()
+        self.calls: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._rng = random.Random(self.profile.seed)
+        self._server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}/addrlink"
+
+    def url(self, endpoint: str) -> str:
+        return f"{self.base_url}/{endpoint}"
+
+    def start(self) -> FakeJusoServer:
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-juso", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> FakeJusoServer:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self.calls)
+
+    def _respond(self, endpoint: str, params: dict[str, str]) -> tuple[int, dict[str, Any] | None]:
+        p = self.profile
+        with self._lock:
+            self.calls[endpoint] = self.calls.get(endpoint, 0) + 1
+            delay = p.latency_ms * (math.exp(self._rng.gauss(0.0, p.latency_sigma)) if p.latency_sigma > 0 else 1.0)
+            roll = self._rng.random()
+        time.sleep(delay / 1000)
+
+        if roll < p.error_rate:
+            return 503, None
+        if roll < p.error_rate + p.api_error_rate:
+            return 200, _payload([], error_code="-999")
+        keyword = params.get("keyword", "")
+        if endpoint == DETAIL_ENDPOINT:
+            detail = [{"dongNm": f"{n}01동", "floorNm": "", "hoNm": ""} for n in range(1, 3)]
+            return 200, _payload(detail)
+        items = [_item(keyword, n) for n in range(1, p.results_per_query + 1)]
+        return 200, _payload(items)
+
+    def _handler_class(self) -> type[http.server.BaseHTTPRequestHandler]:
+        fake = self
+
+        class _Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive (실제 서비스처럼 연결 재사용)
+
+            def do_HEAD(self) -> None:
+                self.send_response(200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def do_GET(self) -> None:
+                url = urlsplit(self.path)
+                endpoint = url.path.rsplit("/", 1)[-1]
+                params = {k: v[0] for k, v in parse_qs(url.query).items()}
+                status, payload = fake._respond(endpoint, params)
+                body = json.dumps(payload, ensure_ascii=False).encode("utf-8") if payload is not None else b""
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json;charset=UTF-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args: object) -> None:
+                pass
+
+        return _Handler
+
+
+@dataclass
+class ToolResult:
+    tool: str
+    requests: int
+    errors: int
+    elapsed_seconds: float
+    throughput_rps: float
+    latency_ms: dict[str, float]  # p50/p95/p99/mean/max
+    upstream_calls: dict[str, int]  # endpoint별 호출 수 (재시도 포함)
+    upstream_calls_per_request: float
+
+
+@dataclass
+class LoadTestReport:
+    started_at: str
+    version: str
+    python: str
+    config: dict[str, Any]
+    tools: list[ToolResult] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    def save(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+            f.write("\n")
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """nearest-rank percentile (sorted_values는 오름차순)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def _latency_summary(samples: list[float]) -> dict[str, float]:
+    data = sorted(samples)
+    return {
+        "p50": round(percentile(data, 0.50), 2),
+        "p95": round(percentile(data, 0.95), 2),
+        "p99": round(percentile(data, 0.99), 2),
+        "mean": round(sum(data) / len(data), 2) if data else 0.0,
+        "max": round(data[-1], 2) if data else 0.0,
+    }
+
+
+def _version() -> str:
+    try:
+        return metadata.version("postcode-mcp")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+@contextmanager
+def _environ(overrides: dict[str, str]) -> Iterator[None]:
+    saved = {k: os.environ.get(k) for k in overrides}
+    os.environ.update(overrides)
+    try:
+        yield
+    finally:
+        for k, v in saved.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+
+
+def _fake_env(fake: FakeJusoServer) -> dict[str, str]:
+    # 키는 가짜 값으로 덮어써서 실제 키가 테스트 서버로 가지 않게 하고,
+    # 로컬 인덱스/디스크 캐시는 끄고 매 실행이 같은 조건(빈 메모리 캐시)에서 시작하도록 함.
+    # rate limit(토큰 버킷)과 record/replay도 꺼서 throttle이 아니라 코드 자체를 잼
+    return {
+        "JUSO_RATE_PER_SECOND": "0",
+        "HTTP_FIXTURE_MODE": "off",
+        "JUSO_ROAD_KEY": "loadtest",
+        "JUSO_DETAIL_KEY": "loadtest",
+        "JUSO_ENG_KEY": "loadtest",
+        "JUSO_LOCAL_DB": "",
+        "JUSO_API_URL": fake.url(SEARCH_ENDPOINT),
+        "JUSO_DETAIL_API_URL": fake.url(DETAIL_ENDPOINT),
+        "JUSO_ENG_API_URL": fake.url(ENGLISH_ENDPOINT),
+        "POSTCODE_CACHE_BACKEND": "memory",
+    }
+
+
+async def _drive(
+    url: str, tool: str, queries: list[str], concurrency: int
+) -> tuple[list[float], int, float]:
+    """동시 session concurrency개로 queries를 나눠 호출. (응답시간 ms 목록, 에러 수, 경과 초)"""
+    from fastmcp import Client
+
+    make_args = SCENARIOS[tool]
+    latencies: list[float] = []
+    errors = 0
+    pending = iter(queries)
+
+    async def worker(client: Client[Any]) -> None:
+        nonlocal errors
+        for q in pending:
+            t0 = time.perf_counter()
+            try:
+                result = await client.call_tool(tool, make_args(q), raise_on_error=False)
+                failed = result.is_error
+            except Exception:
+                failed = True
+            latencies.append((time.perf_counter() - t0) * 1000)
+            errors += failed
+
+    async with AsyncExitStack() as stack:
+        clients = [await stack.enter_async_context(Client(url)) for _ in range(concurrency)]
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(c) for c in clients))
+        elapsed = time.perf_counter() - started
+    return latencies, errors, elapsed
+
+
+async def run_loadtest(
+    *,
+    tools: tuple[str, ...] = DEFAULT_TOOLS,
+    requests: int = 200,
+    concurrency: int = 16,
+    distinct_queries: int = 0,
+    profile: UpstreamProfile | None = None,
+) -> LoadTestReport:
+    """
+    가짜 Juso 서버 + 실제 tool 구성(Container, MetricsMiddleware)을 FastMCP HTTP transport로 띄우고,
+    tool마다 requests건을 concurrency개 session으로 호출해 처리량/응답시간/upstream 호출 수를 잽니다.
+    - distinct_queries: 서로 다른 검색어 수 (0이면 requests와 같음 = 전부 cache miss)
+    - tool마다 검색어가 달라 앞 tool의 캐시가 다음 tool 결과에 섞이지 않음
+    """
+    import uvicorn
+    from fastmcp import FastMCP
+
+    from postcode_mcp.tools.postcode_tools import register_postcode_tools
+
+    unknown = [t for t in tools if t not in SCENARIOS]
+    if unknown:
+        raise ValueError(f"Unknown tools: {unknown} (available: {sorted(SCENARIOS)})")
+    profile = profile or UpstreamProfile()
+    distinct = distinct_queries or requests
+
+    with FakeJusoServer(profile) as fake, _environ(_fake_env(fake)):
+        settings = get_settings()
+        container = build_container(settings)
+        mcp = FastMCP("postcode-mcp-loadtest")
+        register_postcode_tools(mcp, container)
+        mcp.add_middleware(MetricsMiddleware(container.tool_metrics))
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.bind(("127.0.0.1", 0))
+        url = f"http://127.0.0.1:{sock.getsockname()[1]}/mcp"
+        server = uvicorn.Server(uvicorn.Config(mcp.http_app(path="/mcp"), log_level="warning", lifespan="on"))
+        serving = asyncio.ensure_future(server.serve(sockets=[sock]))
+
+        report = LoadTestReport(
+            started_at=datetime.now(UTC).isoformat(timespec="seconds"),
+            version=_version(),
+            python=platform.python_version(),
+            config={
+                "tools": list(tools),
+                "requests": requests,
+                "concurrency": concurrency,
+                "distinct_queries": distinct,
+                "upstream": asdict(profile),
+                "settings": {
+                    k: v for k, v in dataclasses.asdict(settings).items() if not k.endswith("_key")
+                },
+            },
+        )
+        try:
+            while not server.started:
+                if serving.done():
+                    serving.result()  # 시작 실패 시 예외 전달
+                await asyncio.sleep(0.01)
+
+            for n, tool in enumerate(tools):
+                queries = [f"부하테스트로 {n}-{i % distinct}" for i in range(requests)]
+                before = fake.snapshot()
+                latencies, errors, elapsed = await _drive(url, tool, queries, concurrency)
+                after = fake.snapshot()
+                calls = {e: after[e] - before.get(e, 0) for e in sorted(after) if after[e] != before.get(e, 0)}
+                report.tools.append(
+                    ToolResult(
+                        tool=tool,
+                        requests=requests,
+                        errors=errors,
+                        elapsed_seconds=round(elapsed, 3),
+                        throughput_rps=round(requests / elapsed, 1) if elapsed else 0.0,
+                        latency_ms=_latency_summary(latencies),
+                        upstream_calls=calls,
+                        upstream_calls_per_request=round(sum(calls.values()) / requests, 3),
+                    )
+                )
+                log.info("loadtest %s: %s", tool, report.tools[-1].latency_ms)
+        finally:
+            server.should_exit = True
+            await serving
+            await container.aclose()
+    return report
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], *, tolerance: float = 0.2) -> list[str]:
+    """
+    저장된 두 리포트(to_dict/JSON)를 tool별로 비교해 회귀 목록을 반환합니다.
+    - p95/p99가 baseline보다 tolerance 비율 넘게 (그리고 1ms 넘게) 늘었거나
+    - throughput이 tolerance 비율 넘게 줄었거나, 요청당 upstream 호출이 늘었으면 회귀
+    """
+    base_tools = {t["tool"]: t for t in baseline.get("tools", [])}
+    regressions: list[str] = []
+    for cur in current.get("tools", []):
+        base = base_tools.get(cur["tool"])
+        if base is None:
+            continue
+        name = cur["tool"]
+        for q in ("p95", "p99"):
+            now, before = cur["latency_ms"][q], base["latency_ms"][q]
+            if now > before * (1 + tolerance) and now - before > 1.0:
+                regressions.append(f"{name}: {q} {before}ms -> {now}ms")
+        if cur["throughput_rps"] < base["throughput_rps"] * (1 - tolerance):
+            regressions.append(f"{name}: throughput {base['throughput_rps']} -> {cur['throughput_rps']} rps")
+        if cur["upstream_calls_per_request"] > base["upstream_calls_per_request"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: upstream calls/request "
+                f"{base['upstream_calls_per_request']} -> {cur['upstream_calls_per_request']}"
+            )
+    return regressions
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from postcode_mcp.infra.circuit import CLOSED, HALF_OPEN, OPEN
+from postcode_mcp.infra.metrics import PrometheusText
+
+if TYPE_CHECKING:
+    from postcode_mcp.app.container import Container
+    from postcode_mcp.app.warmup import WarmUp
+    from postcode_mcp.infra.metrics import ToolMetrics
+
+# circuit 상태 gauge 값
+_CIRCUIT_STATE = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+def _providers(container: Container) -> list[tuple[str, Any]]:
+    return [
+        (name, p)
+        for name, p in (
+            ("search", container.juso),
+            ("detail", container.juso_detail),
+            ("english", container.juso_english),
+        )
+        if p is not None
+    ]
+
+
+def render_metrics(
+    container: Container | None, warmup: WarmUp | None = None, *, tool_metrics: ToolMetrics | None = None
+) -> str:
+    """
+    Container의 누적 통계를 Prometheus text format으로 출력합니다 (GET /metrics).
+    hot path에서는 카운터만 올리고, 집계/포맷은 scrape 때 여기서 한 번에 합니다.
+    warmup이 있으면 시작 시 캐시 warm-up 진행 상황도 함께 냅니다.
+    container가 아직 없으면(첫 tool 호출 전) scrape 때문에 만들지 않고 tool_metrics/warmup만 냅니다.
+    """
+    out = PrometheusText(prefix="postcode_")
+    tools = container.tool_metrics if container is not None else tool_metrics
+
+    # tools
+    if tools is not None:
+        out.histogram("tool_duration_seconds", "MCP tool call latency.", "tool", [({}, tools.latency)])
+        out.metric(
+            "tool_errors_total",
+            "counter",
+            "MCP tool calls that raised.",
+            [({"tool": t}, n) for t, n in tools.errors.items()],
+        )
+        out.metric("tool_in_flight", "gauge", "MCP tool calls in progress.", [({}, tools.in_flight)])
+
+    if container is not None:
+        _render_container(out, container)
+
+    if warmup is not None:
+        progress = warmup.progress()
+        out.metric(
+            "warmup_keys", "gauge", "Cache warm-up keys by state (total = snapshot keys).",
+            [({"state": state}, progress[state]) for state in ("total", "warmed", "skipped", "failed")],
+        )
+        out.metric("warmup_running", "gauge", "Cache warm-up in progress.", [({}, int(progress["running"]))])
+
+    return out.render()
+
+
+def _render_container(out: PrometheusText, container: Container) -> None:
+    clients = (("sync", container.http), ("async", container.async_http))
+
+    # upstream HTTP
+    out.histogram(
+        "upstream_duration_seconds",
+        "Upstream HTTP attempt latency per endpoint (failures included).",
+        "endpoint",
+        [({"client": name}, http.latency) for name, http in clients],
+    )
+    out.metric(
+        "upstream_errors_total",
+        "counter",
+        "Failed upstream HTTP attempts per endpoint.",
+        [({"client": name, "endpoint": e}, n) for name, http in clients for e, n in http.endpoint_errors.items()],
+    )
+    out.metric(
+        "upstream_retries_total",
+        "counter",
+        "Upstream HTTP retries.",
+        [({"client": name}, http.stats()["retries"]) for name, http in clients],
+    )
+    pools = [(name, http.pool_stats()) for name, http in clients]
+    out.metric(
+        "http_pool_connections",
+        "gauge",
+        "Pooled upstream connections.",
+        [({"client": name, "state": s}, pool[s]) for name, pool in pools if pool for s in ("active", "idle")],
+    )
+
+    # cache
+    namespaces = container.cache.namespace_stats()
+    for field, help_text in (
+        ("hits", "Cache lookups that found a value (L1 or L2)."),
+        ("misses", "Cache lookups that found nothing."),
+        ("evictions", "L1 entries evicted for capacity."),
+        ("expirations", "L1 entries removed after the hard TTL."),
+    ):
+        out.metric(
+            f"cache_{field}_total", "counter", help_text, [({"namespace": ns}, s[field]) for ns, s in namespaces.items()]
+        )
+    cache_stats = container.cache.stats()
+    out.metric(
+        "cache_stale_hits_total", "counter", "Stale values served while revalidating.",
+        [({}, cache_stats["l1"]["stale_hits"])],
+    )
+    out.metric(
+        "cache_entries",
+        "gauge",
+        "Current cache size.",
+        [({"tier": tier}, cache_stats[tier]["size"]) for tier in ("l1", "l2") if tier in cache_stats],
+    )
+
+    # single-flight / circuit breaker
+    providers = _providers(container)
+    flights = [(name, p.singleflight.stats()) for name, p in providers]
+    out.metric(
+        "singleflight_coalesced_total", "counter", "Upstream calls merged into an in-flight call.",
+        [({"provider": name}, s["coalesced"]) for name, s in flights],
+    )
+    out.metric(
+        "singleflight_in_flight", "gauge", "Distinct upstream calls in flight.",
+        [({"provider": name}, s["in_flight"]) for name, s in flights],
+    )
+    circuits = [(name, p.circuit_breaker.stats()) for name, p in providers]
+    out.metric(
+        "circuit_state", "gauge", "Circuit breaker state (0 closed, 1 half-open, 2 open).",
+        [({"provider": name}, _CIRCUIT_STATE[str(s["state"])]) for name, s in circuits],
+    )
+    out.metric(
+        "circuit_rejected_total", "counter", "Calls rejected while the circuit was open.",
+        [({"provider": name}, s["rejected"]) for name, s in circuits],
+    )
+
+    # rate limit / retry budget / hedging
+    limiters = container.rate_limiter.stats().items()
+    for field, kind, help_text in (
+        ("concurrency_limit", "gauge", "Current AIMD concurrency limit."),
+        ("in_flight", "gauge", "Upstream requests holding a permit."),
+        ("waiting", "gauge", "Upstream requests waiting for a permit."),
+        ("overloads", "counter", "Overload signals (throttling/timeouts)."),
+    ):
+        name = f"ratelimit_{field}_total" if kind == "counter" else f"ratelimit_{field}"
+        out.metric(name, kind, help_text, [({"limiter": key}, s[field]) for key, s in limiters])
+    budget = container.retry_budget.stats()
+    out.metric("retry_budget_tokens", "gauge", "Remaining retry budget tokens.", [({}, budget["tokens"])])
+    out.metric(
+        "retry_budget_exhausted_total", "counter", "Retries skipped for lack of budget.", [({}, budget["exhausted"])]
+    )
+    hedger = container.hedger
+    if hedger is not None:
+        out.metric("hedges_total", "counter", "Hedged upstream requests sent.", [({}, hedger.hedges)])
+        out.metric("hedge_wins_total", "counter", "Hedged requests that answered first.", [({}, hedger.hedge_wins)])
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import json
+import logging
+import random
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from fastmcp.server.middleware import Middleware
+
+from postcode_mcp.core.trace import RequestTrace, trace_request
+
+if TYPE_CHECKING:
+    from postcode_mcp.infra.metrics import ToolMetrics
+
+slow_log = logging.getLogger("postcode_mcp.slow_request")
+
+
+class SlowRequestLog:
+    """
+    threshold_ms 이상 걸린 tool 호출 중 sample_rate 비율만 한 줄 JSON으로 기록합니다.
+    - 단계별 span/캐시 결과, upstream 시도/재시도 수, stale 단계만 남기고 입력(주소/검색어)은 남기지 않음
+    - threshold_ms가 0 이하면 비활성
+    """
+
+    def __init__(self, threshold_ms: float, sample_rate: float = 1.0, rng: Callable[[], float] = random.random) -> None:
+        self.threshold_ms = threshold_ms
+        self.sample_rate = sample_rate
+        self._rng = rng
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold_ms > 0 and self.sample_rate > 0
+
+    def observe(self, tool: str, seconds: float, trace: RequestTrace, *, error: bool) -> bool:
+        total_ms = seconds * 1000
+        if not self.enabled or total_ms < self.threshold_ms or self._rng() >= self.sample_rate:
+            return False
+        record = {
+            "event": "slow_request",
+            "tool": tool,
+            "total_ms": round(total_ms, 2),
+            "error": error,
+            "attempts": trace.attempts,
+            "retries": trace.retries,
+            "stale": sorted(trace.stale),
+            "timings": trace.timings(),
+        }
+        slow_log.warning(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+        return True
+
+
+class MetricsMiddleware(Middleware):
+    """
+    tool 호출마다 응답시간/에러/처리 중 수를 ToolMetrics에 기록합니다.
+    호출 전체를 trace_request()로 감싸므로, slow_log가 있으면 느린 호출의 단계별 timing을 남길 수 있습니다.
+    """
+
+    def __init__(self, metrics: ToolMetrics, slow_log: SlowRequestLog | None = None) -> None:
+        self._metrics = metrics
+        self._slow_log = slow_log
+
+    async def on_call_tool(self, context: Any, call_next: Any) -> Any:
+        tool = context.message.name
+        self._metrics.started()
+        t0 = time.perf_counter()
+        error = True
+        with trace_request() as trace:
+            try:
+                result = await call_next(context)
+                error = False
+                return result
+            finally:
+                seconds = time.perf_counter() - t0
+                self._metrics.finished(tool, seconds, error=error)
+                if self._slow_log is not None:
+                    self._slow_log.observe(tool, seconds, trace, error=error)
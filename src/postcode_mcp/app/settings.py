@@ -15,6 +15,9 @@ class Settings:
     juso_eng_key: str | None
     # juso_confm_key: str
 
+    # 로컬 주소 인덱스 (python -m postcode_mcp ingest-juso 로 생성, 없으면 None)
+    juso_local_db: str | None
+
     # Juso common params
     juso_count_per_page: int
     juso_first_sort: str
@@ -22,12 +25,73 @@ class Settings:
 
     # Cache
     cache_ttl_seconds: int
+    cache_stale_ttl_seconds: int  # soft TTL 이후 stale 응답 + 백그라운드 갱신을 허용하는 시간
     cache_maxsize: int
+    cache_backend: str  # memory | sqlite (sqlite = 메모리 L1 + 디스크 L2)
+    cache_sqlite_path: str
+    # 결과 0건 negative 캐시 (ttl 0이면 비활성)
+    negative_cache_ttl_seconds: int
+    negative_cache_capacity: int
+    negative_cache_error_rate: float
 
     # HTTP
     http_timeout_seconds: float
     http_user_agent: str
 
+    # connection pool (sync/async 클라이언트 각각): 최대 연결 수, keep-alive 유지 연결 수/만료, HTTP/2(h2 필요)
+    http_max_connections: int
+    http_max_keepalive_connections: int
+    http_keepalive_expiry_seconds: float
+    http_http2: bool
+    # 시작 시 container를 만들고 설정된 endpoint마다 연결을 미리 맺어 둠
+    # (기본 off: stdio는 세션마다 프로세스를 띄우므로 오래 떠 있는 HTTP 서버에서만 켬)
+    http_prewarm: bool
+
+    # upstream 응답 기록/재생: off | record(실제 응답을 파일에 저장) | replay(저장된 응답만 사용, 네트워크 없음)
+    http_fixture_mode: str
+    http_fixture_path: str
+    http_fixture_replay_latency: bool  # replay 시 기록된 응답시간만큼 대기
+
+    # 재시도 (연결 실패/5xx/read timeout만): 지수 backoff + full jitter, 전역 예산(ratio)
+    http_max_attempts: int
+    http_retry_base_delay_seconds: float
+    http_retry_max_delay_seconds: float
+    http_retry_budget_ratio: float
+
+    # hedged request (async 경로): 첫 요청이 endpoint p{percentile} 안에 응답 없으면 한 번 더 전송
+    http_hedge_max_ratio: float  # hedge되는 요청 비율 상한 (0이면 비활성)
+    http_hedge_percentile: float
+    http_hedge_min_delay_seconds: float
+
+    # provider별 circuit breaker: 연속 실패 N번이면 open, reset 시간 뒤 half-open 탐색
+    circuit_failure_threshold: int
+    circuit_reset_seconds: float
+
+    # upstream 호출 제한 (endpoint × 키 단위): token bucket + AIMD 동시성
+    juso_rate_per_second: float  # 0이면 rate 제한 없음
+    juso_rate_burst: int
+    juso_min_concurrency: int
+    juso_max_concurrency: int
+
+    # Enrichment (detail/english) 단계별 타임아웃
+    stage_timeout_seconds: float
+
+    # resolve_from_kakao_places 동시 조회 수
+    kakao_places_concurrency: int
+
+    # normalize_addresses_batch 동시 조회 수
+    batch_concurrency: int
+
+    # 느린 요청 로그: tool 호출이 N ms 이상이면 sample_rate 비율로 단계별 timing을 JSON 로그로 남김 (0이면 비활성)
+    slow_request_ms: float
+    slow_request_sample_rate: float
+
+    # hot-key snapshot / 시작 시 캐시 warm-up (snapshot path가 비어 있으면 비활성)
+    warmup_snapshot_path: str
+    warmup_top_keys: int
+    warmup_rate_per_second: float
+    warmup_snapshot_interval_seconds: float  # 0이면 종료 시에만 snapshot 저장
+
 
 def _clean(s: str | None) -> str:
     return (s or "").strip().strip('"').strip("'")
@@ -43,18 +107,27 @@ def _float(name: str, default: float) -> float:
     return float(v)
 
 
-def get_settings() -> Settings:
+def _bool(name: str, default: bool) -> bool:
+    v = _clean(os.getenv(name, "true" if default else "false")).lower()
+    return v in ("1", "true", "yes", "y", "on")
+
+
+def get_settings(*, require_key: bool = True) -> Settings:
     """
     키 분리 + 하위호환:
     - JUSO_ROAD_KEY가 있으면 그걸 사용
     - 없으면 기존 JUSO_CONFM_KEY를 ROAD 키로 사용(호환)
+    - JUSO_LOCAL_DB(로컬 주소 인덱스)가 있으면 키 없이도 동작 (원격 fallback 없음)
+    - require_key=False면 키가 없어도 오류 없이 읽음 (서버 import 시 키 외 설정만 필요할 때,
+      키 검증은 container를 처음 만들 때)
     """
     road_key = _clean(os.getenv("JUSO_ROAD_KEY"))
     legacy_key = _clean(os.getenv("JUSO_CONFM_KEY"))
     if not road_key:
         road_key = legacy_key
 
-    if not road_key:
+    local_db = _clean(os.getenv("JUSO_LOCAL_DB")) or None
+    if require_key and not road_key and not local_db:
         raise RuntimeError(
             "Missing JUSO_ROAD_KEY (or legacy JUSO_CONFM_KEY) in environment (.env)."
         )
@@ -67,16 +140,55 @@ def get_settings() -> Settings:
         juso_road_key=road_key,
         juso_detail_key=detail_key,
         juso_eng_key=eng_key,
+        juso_local_db=local_db,
         # common params
         juso_count_per_page=_int("JUSO_COUNT_PER_PAGE", 10),
         juso_first_sort=_clean(os.getenv("JUSO_FIRST_SORT", "none")),
         juso_add_info_yn=_clean(os.getenv("JUSO_ADD_INFO_YN", "Y")),
         # cache
         cache_ttl_seconds=_int("POSTCODE_CACHE_TTL_SECONDS", 60 * 60 * 24 * 7),
+        cache_stale_ttl_seconds=_int("POSTCODE_CACHE_STALE_TTL_SECONDS", 60 * 60 * 24),
         cache_maxsize=_int("POSTCODE_CACHE_MAXSIZE", 20000),
+        cache_backend=_clean(os.getenv("POSTCODE_CACHE_BACKEND", "memory")).lower(),
+        cache_sqlite_path=_clean(os.getenv("POSTCODE_CACHE_SQLITE_PATH", ".cache/postcode-cache.sqlite3")),
+        negative_cache_ttl_seconds=_int("NEGATIVE_CACHE_TTL_SECONDS", 600),
+        negative_cache_capacity=_int("NEGATIVE_CACHE_CAPACITY", 100_000),
+        negative_cache_error_rate=_float("NEGATIVE_CACHE_ERROR_RATE", 0.0001),
         # http
         http_timeout_seconds=_float("HTTP_TIMEOUT_SECONDS", 10.0),
         http_user_agent=_clean(os.getenv("HTTP_USER_AGENT", "postcode-mcp/0.1.0")),
+        http_max_connections=_int("HTTP_MAX_CONNECTIONS", 100),
+        http_max_keepalive_connections=_int("HTTP_MAX_KEEPALIVE_CONNECTIONS", 20),
+        http_keepalive_expiry_seconds=_float("HTTP_KEEPALIVE_EXPIRY_SECONDS", 30.0),
+        http_http2=_bool("HTTP_HTTP2", False),
+        http_prewarm=_bool("HTTP_PREWARM", False),
+        http_fixture_mode=_clean(os.getenv("HTTP_FIXTURE_MODE", "off")).lower(),
+        http_fixture_path=_clean(os.getenv("HTTP_FIXTURE_PATH", ".cache/http-fixtures.sqlite3")),
+        http_fixture_replay_latency=_bool("HTTP_FIXTURE_REPLAY_LATENCY", False),
+        http_max_attempts=_int("HTTP_MAX_ATTEMPTS", 3),
+        http_retry_base_delay_seconds=_float("HTTP_RETRY_BASE_DELAY_SECONDS", 0.1),
+        http_retry_max_delay_seconds=_float("HTTP_RETRY_MAX_DELAY_SECONDS", 2.0),
+        http_retry_budget_ratio=_float("HTTP_RETRY_BUDGET_RATIO", 0.1),
+        http_hedge_max_ratio=_float("HTTP_HEDGE_MAX_RATIO", 0.0),
+        http_hedge_percentile=_float("HTTP_HEDGE_PERCENTILE", 0.95),
+        http_hedge_min_delay_seconds=_float("HTTP_HEDGE_MIN_DELAY_SECONDS", 0.05),
+        circuit_failure_threshold=_int("CIRCUIT_FAILURE_THRESHOLD", 5),
+        circuit_reset_seconds=_float("CIRCUIT_RESET_SECONDS", 30.0),
+        juso_rate_per_second=_float("JUSO_RATE_PER_SECOND", 20.0),
+        juso_rate_burst=_int("JUSO_RATE_BURST", 20),
+        juso_min_concurrency=_int("JUSO_MIN_CONCURRENCY", 1),
+        juso_max_concurrency=_int("JUSO_MAX_CONCURRENCY", 16),
+        # enrichment
+        stage_timeout_seconds=_float("STAGE_TIMEOUT_SECONDS", 5.0),
+        kakao_places_concurrency=_int("KAKAO_PLACES_CONCURRENCY", 8),
+        batch_concurrency=_int("BATCH_CONCURRENCY", 8),
+        # observability
+        slow_request_ms=_float("SLOW_REQUEST_MS", 2000.0),
+        slow_request_sample_rate=_float("SLOW_REQUEST_SAMPLE_RATE", 1.0),
+        warmup_snapshot_path=_clean(os.getenv("WARMUP_SNAPSHOT_PATH", "")),
+        warmup_top_keys=_int("WARMUP_TOP_KEYS", 1000),
+        warmup_rate_per_second=_float("WARMUP_RATE_PER_SECOND", 2.0),
+        warmup_snapshot_interval_seconds=_float("WARMUP_SNAPSHOT_INTERVAL_SECONDS", 300.0),
     )
 
 if __name__ == "__main__":
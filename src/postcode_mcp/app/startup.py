@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any
+
+# 서버 모듈 import(설정 읽기 + tool 등록) → 첫 tools/list 응답까지 허용 시간.
+# FastMCP/mcp 자체 import는 이 패키지가 줄일 수 없는 부분이라 따로 잼 (framework_import_ms).
+STARTUP_BUDGET_MS = 300.0
+
+# 새 프로세스에서 실행하는 측정 스크립트 (이미 import된 모듈의 영향을 받지 않도록)
+_PROBE = """
+import asyncio, json, sys, time
+t0 = time.perf_counter()
+import fastmcp.server.server, fastmcp.client
+t1 = time.perf_counter()
+import postcode_mcp.server as server
+t2 = time.perf_counter()
+
+async def first_list():
+    async with fastmcp.Client(server.mcp) as client:
+        return await client.list_tools()
+
+tools = asyncio.run(first_list())
+t3 = time.perf_counter()
+print(json.dumps({
+    "framework_import_ms": (t1 - t0) * 1000,
+    "import_ms": (t2 - t1) * 1000,
+    "first_list_tools_ms": (t3 - t2) * 1000,
+    "tools": len(tools),
+    "container_built": server._container.built,
+    "loaded": sorted(m for m in (
+        "httpx", "rapidfuzz", "sqlite3",
+        "postcode_mcp.app.metrics", "postcode_mcp.app.warmup", "postcode_mcp.infra.providers.juso_eng",
+    ) if m in sys.modules),
+}))
+"""
+
+
+def _probe(env: dict[str, str]) -> dict[str, Any]:
+    t0 = time.perf_counter()
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE], env=env, capture_output=True, text=True, check=True, timeout=120
+    )
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+    if not isinstance(result, dict):
+        raise RuntimeError(f"Unexpected startup probe output: {out.stdout!r}")
+    result["process_ms"] = (time.perf_counter() - t0) * 1000
+    result["startup_ms"] = result["import_ms"] + result["first_list_tools_ms"]
+    return result
+
+
+def measure_startup(*, runs: int = 5, budget_ms: float = STARTUP_BUDGET_MS) -> dict[str, Any]:
+    """
+    새 Python 프로세스에서 서버 모듈 import → 첫 tools/list까지 걸리는 시간을 runs번 재서 중앙값을 반환합니다.
+    - startup_ms(= import_ms + first_list_tools_ms)가 budget_ms 이하인지 within_budget으로 표시
+    - container_built: tools/list까지 의존성 그래프가 만들어지지 않았는지 (lazy container 확인용)
+    - 시작 시 백그라운드 prewarm은 측정에 섞이지 않도록 끔
+    """
+    # 이 파일: <src>/postcode_mcp/app/startup.py
+    src = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(p for p in (src, os.environ.get("PYTHONPATH")) if p),
+        "HTTP_PREWARM": "false",
+        "LOG_LEVEL": "WARNING",
+    }
+    env.setdefault("JUSO_ROAD_KEY", "startup-bench")
+    samples = [_probe(env) for _ in range(runs)]
+
+    timings = ("framework_import_ms", "import_ms", "first_list_tools_ms", "startup_ms", "process_ms")
+    result: dict[str, Any] = {k: round(statistics.median(s[k] for s in samples), 1) for k in timings}
+    result.update(
+        runs=runs,
+        budget_ms=budget_ms,
+        within_budget=result["startup_ms"] <= budget_ms,
+        tools=samples[-1]["tools"],
+        container_built=any(s["container_built"] for s in samples),
+        loaded=samples[-1]["loaded"],
+    )
+    return result
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import json
+import logging
+import os
+import time
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any
+
+from postcode_mcp.core.errors import PostcodeError
+
+if TYPE_CHECKING:
+    from postcode_mcp.app.container import Container
+    from postcode_mcp.infra.cache import Cache
+
+log = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+
+def export_snapshot(cache: Cache, path: str, *, top_n: int, carry: Iterable[tuple[str, int]] = ()) -> int:
+    """
+    조회 수가 많은 L1 key top_n개를 JSON snapshot으로 저장하고 저장한 key 수를 반환합니다.
+    carry: 캐시에는 없지만 남겨 둘 key (warm-up이 끝나기 전에 종료될 때 아직 못 채운 key)
+    임시 파일에 쓴 뒤 교체하므로 저장 중 종료돼도 이전 snapshot은 그대로 남음.
+    """
+    merged = dict(carry)
+    for key, hits in cache.hot_keys(top_n):
+        merged[key] = max(hits, merged.get(key, 0))
+    top = heapq.nlargest(top_n, merged.items(), key=lambda item: item[1])
+    keys = [{"key": key, "hits": hits} for key, hits in top]
+    snapshot = {"version": SNAPSHOT_VERSION, "created_at": time.time(), "keys": keys}
+    parent = os.path.dirname(os.path.abspath(path))
+    os.makedirs(parent, exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(snapshot, f, ensure_ascii=False)
+    os.replace(tmp, path)
+    return len(keys)
+
+
+def load_snapshot(path: str) -> list[tuple[str, int]]:
+    """[(key, 조회 수)], 많은 순. 파일이 없거나 형식이 다르면 빈 목록."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            snapshot = json.load(f)
+    except FileNotFoundError:
+        return []
+    except (OSError, ValueError) as e:
+        log.warning("Warm-up snapshot unreadable (%s): %s", path, e)
+        return []
+    if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+        log.warning("Warm-up snapshot version mismatch (%s)", path)
+        return []
+    keys = [
+        (str(item["key"]), int(item.get("hits", 1)))
+        for item in snapshot.get("keys", [])
+        if isinstance(item, dict) and item.get("key")
+    ]
+    keys.sort(key=lambda item: item[1], reverse=True)
+    return keys
+
+
+class WarmUp:
+    """
+    snapshot의 hot key를 provider로 다시 조회해 캐시를 채웁니다 (서버가 요청을 받는 동안 백그라운드로).
+    - 조회 수가 많은 key부터, 한 번에 하나씩 rate_per_second 간격으로
+    - 실제 요청과 upstream 쿼터를 다투지 않도록, rate limiter가 한가할 때(idle)만 보냄
+    - 이미 캐시에 있는 key(실제 요청이 먼저 채운 경우)는 건너뜀
+    - progress()로 진행 상황 확인 (/metrics의 postcode_warmup_*)
+    """
+
+    def __init__(
+        self,
+        *,
+        rate_per_second: float,
+        idle_poll_seconds: float = 0.05,
+        log_every: int = 100,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._interval = 1.0 / rate_per_second if rate_per_second > 0 else 0.0
+        self._idle_poll = idle_poll_seconds
+        self._log_every = max(1, log_every)
+        self._clock = clock
+        self.total = 0
+        self.warmed = 0
+        self.skipped = 0
+        self.failed = 0
+        self.running = False
+        self._pending: list[tuple[str, int]] = []
+        self._unwarmed: list[tuple[str, int]] = []
+
+    def pending(self) -> list[tuple[str, int]]:
+        """아직 처리하지 않았거나 채우지 못한 snapshot key (종료 시 snapshot에 이어 남기도록)."""
+        return self._unwarmed + self._pending[::-1]
+
+    def progress(self) -> dict[str, Any]:
+        return {
+            "total": self.total,
+            "done": self.warmed + self.skipped + self.failed,
+            "warmed": self.warmed,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "running": self.running,
+        }
+
+    async def run(self, container: Container, keys: list[tuple[str, int]]) -> dict[str, Any]:
+        cache = container.cache
+        self.total += len(keys)
+        self.running = True
+        t0 = self._clock()
+        self._pending = list(reversed(keys))
+        log.info("Cache warm-up started: %d keys", len(keys))
+        try:
+            for i, (key, hits) in enumerate(keys, 1):
+                warm = self._resolve(container, key)
+                if warm is None or cache.peek(key):
+                    self.skipped += 1
+                else:
+                    await self._wait_idle(container)
+                    # 기다리는 동안 실제 요청이 채웠을 수 있음
+                    if cache.peek(key):
+                        self.skipped += 1
+                    else:
+                        if not await self._warm(cache, key, warm):
+                            self._unwarmed.append((key, hits))
+                        await asyncio.sleep(self._interval)
+                cache.seed_access(key, hits)
+                self._pending.pop()
+                if i % self._log_every == 0:
+                    log.info("Cache warm-up progress: %s", self.progress())
+        finally:
+            self.running = False
+        result = self.progress()
+        log.info("Cache warm-up finished in %.1fs: %s", self._clock() - t0, result)
+        return result
+
+    async def _warm(self, cache: Cache, key: str, warm: Callable[[], Any]) -> bool:
+        try:
+            await warm()
+        except PostcodeError as e:
+            log.debug("Warm-up failed for %s: %s", key, e)
+        # circuit open 등으로 캐시에 남지 않은 경우도 실패로 셈
+        if cache.peek(key):
+            self.warmed += 1
+            return True
+        self.failed += 1
+        return False
+
+    async def _wait_idle(self, container: Container) -> None:
+        while not container.rate_limiter.idle():
+            await asyncio.sleep(self._idle_poll)
+
+    @staticmethod
+    def _resolve(c: Container, key: str) -> Callable[[], Any] | None:
+        """cache key → 같은 key를 채우는 provider 호출 (해당 provider가 없거나 형식이 다르면 None)."""
+        detail_provider, english_provider = c.juso_detail, c.juso_english
+        if detail_provider is not None and (detail := detail_provider.request_from_cache_key(key)) is not None:
+            return lambda: detail_provider.asearch(detail)
+        if english_provider is not None and (eng := english_provider.request_from_cache_key(key)) is not None:
+            return lambda: english_provider.asearch(eng)
+        if (keyword := c.juso.keyword_from_cache_key(key)) is not None:
+            return lambda: c.juso.asearch(keyword)
+        return None
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Iterable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+async def gather_limited(aws: Iterable[Awaitable[T]], *, limit: int) -> list[T]:
+    """
+    asyncio.gather와 같지만 동시에 실행되는 awaitable 수를 limit로 제한합니다.
+    결과 순서는 입력 순서와 동일합니다.
+    """
+    sem = asyncio.Semaphore(max(1, limit))
+
+    async def _run(aw: Awaitable[T]) -> T:
+        async with sem:
+            return await aw
+
+    return list(await asyncio.gather(*(_run(aw) for aw in aws)))
@@ -11,3 +11,11 @@ class UpstreamError(PostcodeError):
 
 class ValidationError(PostcodeError):
     """Raised when input validation fails."""
+
+
+class UpstreamUnavailableError(UpstreamError):
+    """Raised when an upstream API is unreachable or not responding (network, 5xx, timeout)."""
+
+
+class CircuitOpenError(UpstreamUnavailableError):
+    """Raised without calling upstream while its circuit breaker is open."""
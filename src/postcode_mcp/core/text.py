@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+import unicodedata
 
 
 _WS = re.compile(r"\s+")
@@ -13,6 +14,14 @@ def normalize_query(q: str) -> str:
     return q
 
 
+def canonical_query(q: str) -> str:
+    """
+    배치 중복 제거용 정규형: 유니코드 NFKC(전각 숫자/공백 등 통일) + 공백 정리.
+    Juso 검색어로 그대로 써도 결과가 달라지지 않는 범위의 변환만 수행.
+    """
+    return normalize_query(unicodedata.normalize("NFKC", q or ""))
+
+
 def normalize_postcode(zip_no: str) -> str:
     """
     Juso API는 보통 5자리 zipNo를 반환하지만,
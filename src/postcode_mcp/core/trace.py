@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, TypeVar, cast
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass
+class RequestTrace:
+    """
+    요청 1건 동안 provider 계층에서 모은 정보를 서비스 계층(meta)으로 전달하기 위한 컨테이너.
+    - contextvars로 전달되므로 asyncio.gather/to_thread로 갈라진 작업에서도 같은 객체를 공유
+    """
+
+    stale: set[str] = field(default_factory=set)  # stale 캐시로 응답한 단계(search/english 등)
+    attempts: int = 0  # upstream HTTP 시도 횟수 (재시도 포함)
+    retries: int = 0  # 그중 재시도 횟수
+    spans: list[tuple[str, float]] = field(default_factory=list)  # (span 이름, 소요 ms) 끝난 순서대로
+    cache: dict[str, str] = field(default_factory=dict)  # 단계별 캐시 조회 결과 (hit/stale/negative/miss)
+
+    def merge(self, child: RequestTrace) -> None:
+        """child trace(호출 1건)의 기록을 이 trace에 더함."""
+        self.stale |= child.stale
+        self.attempts += child.attempts
+        self.retries += child.retries
+        self.spans.extend(child.spans)
+        self.cache.update(child.cache)
+
+    def timings(self) -> dict[str, dict[str, Any]]:
+        """
+        span 이름별 {"ms", "count"(2번 이상일 때), "cache"(조회한 단계만)}.
+        같은 이름의 span(예: 페이지별 fetch)은 ms를 합산.
+        """
+        out: dict[str, dict[str, Any]] = {}
+        for name, ms in self.spans:
+            entry = out.setdefault(name, {"ms": 0.0, "count": 0})
+            entry["ms"] += ms
+            entry["count"] += 1
+        for entry in out.values():
+            entry["ms"] = round(entry["ms"], 2)
+            if entry["count"] == 1:
+                del entry["count"]
+        for stage, outcome in self.cache.items():
+            out.setdefault(stage, {})["cache"] = outcome
+        return out
+
+
+_current: ContextVar[RequestTrace | None] = ContextVar("postcode_request_trace", default=None)
+
+
+def current_trace() -> RequestTrace | None:
+    return _current.get()
+
+
+@contextmanager
+def trace_request() -> Iterator[RequestTrace]:
+    """요청 단위 trace 시작. 이미 진행 중이면 바깥 trace를 그대로 사용."""
+    existing = _current.get()
+    if existing is not None:
+        yield existing
+        return
+
+    trace = RequestTrace()
+    token = _current.set(trace)
+    try:
+        yield trace
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def child_trace() -> Iterator[RequestTrace]:
+    """
+    호출 1건 전용 trace 시작. 바깥 trace가 있으면 끝날 때 기록을 바깥 trace에 합침.
+    한 tool 호출 안에서 동시에 실행되는 서비스 호출들(kakao places, batch)이
+    서로의 attempts/stale을 자기 meta에 섞지 않도록 함.
+    """
+    parent = _current.get()
+    trace = RequestTrace()
+    token = _current.set(trace)
+    try:
+        yield trace
+    finally:
+        _current.reset(token)
+        if parent is not None:
+            parent.merge(trace)
+
+
+def traced(fn: F) -> F:
+    """함수(sync/async) 실행 전체를 child_trace() 안에서 실행하는 데코레이터."""
+    if inspect.iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def _async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            with child_trace():
+                return await fn(*args, **kwargs)
+
+        return cast(F, _async_wrapper)
+
+    @functools.wraps(fn)
+    def _wrapper(*args: Any, **kwargs: Any) -> Any:
+        with child_trace():
+            return fn(*args, **kwargs)
+
+    return cast(F, _wrapper)
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """블록 실행 시간을 현재 trace에 span으로 기록 (trace가 없으면 시간도 재지 않음)."""
+    trace = _current.get()
+    if trace is None:
+        yield
+        return
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.spans.append((name, (time.perf_counter() - t0) * 1000))
+
+
+def note_cache(stage: str, outcome: str) -> None:
+    trace = _current.get()
+    if trace is not None:
+        trace.cache[stage] = outcome
+
+
+def note_stale(stage: str) -> None:
+    trace = _current.get()
+    if trace is not None:
+        trace.stale.add(stage)
+
+
+def note_attempt(*, retry: bool) -> None:
+    trace = _current.get()
+    if trace is not None:
+        if retry:
+            trace.retries += 1
+        else:
+            trace.attempts += 1
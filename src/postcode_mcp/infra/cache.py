@@ -1,14 +1,258 @@
 from __future__ import annotations
 
+import asyncio
+import contextvars
+import heapq
+import logging
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
 from cachetools import TTLCache
 
+if TYPE_CHECKING:
+    from postcode_mcp.infra.disk_cache import SqliteCache
+    from postcode_mcp.infra.negative_cache import NegativeCache
+
+log = logging.getLogger(__name__)
+
+# 메트릭용 key namespace (앞에서부터 먼저 맞는 것): 영문검색 / 상세주소 / 주소검색
+NAMESPACES = ("juso:road:", "juso:detail:", "juso:")
+
+
+def key_namespace(key: str) -> str:
+    for ns in NAMESPACES:
+        if key.startswith(ns):
+            return ns
+    return "other"
+
+
+class _NamespaceStats:
+    __slots__ = ("hits", "misses", "evictions", "expirations")
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0  # 용량 초과로 밀려난 수
+        self.expirations = 0  # hard TTL 만료로 지워진 수
+
+
+class _TTLCache(TTLCache[str, tuple[object, float]]):
+    """밀려나거나(popitem) 만료된(expire) key를 namespace별로 세는 TTLCache."""
+
+    def __init__(self, *, maxsize: int, ttl: float, on_evict: Callable[[str, bool], None]) -> None:
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self._on_evict = on_evict
+
+    def popitem(self) -> tuple[str, tuple[object, float]]:
+        item = super().popitem()
+        self._on_evict(item[0], False)
+        return item
+
+    def expire(self, time: Any = None) -> list[tuple[str, tuple[object, float]]]:
+        expired = super().expire(time)
+        for key, _ in expired:
+            self._on_evict(key, True)
+        return expired
+
 
 class Cache:
-    def __init__(self, *, maxsize: int, ttl_seconds: int) -> None:
-        self._cache: TTLCache[str, object] = TTLCache(maxsize=maxsize, ttl=ttl_seconds)
+    """
+    L1: 프로세스 내 TTLCache
+    L2(선택): 디스크 SqliteCache - 재시작/다른 워커 프로세스와 공유
+
+    negative(선택): 결과 0건 key 집합 (짧은 TTL, Bloom filter)
+
+    L1에는 (value, expires_at)을 저장해, L2에서 올라온 값도 원래 만료 시각을 그대로 따름.
+
+    stale-while-revalidate:
+    - ttl_seconds(soft)가 지나면 stale, stale_ttl_seconds가 더 지나면(hard) 만료
+    - stale 값은 즉시 반환하고, 호출자가 schedule_refresh*로 백그라운드 갱신을 예약 (key당 1개만)
+
+    hot key: L1에 있는 key별 조회 수(처음 저장 1 + hit마다 +1)를 세어 hot_keys(n)로 내보냄 (warm-up snapshot용).
+    L1에서 밀려나거나 만료되면 같이 지움 → L1 크기 이상 늘지 않음.
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int,
+        ttl_seconds: int,
+        l2: SqliteCache | None = None,
+        negative: NegativeCache | None = None,
+        stale_ttl_seconds: int = 0,
+    ) -> None:
+        hard_ttl = ttl_seconds + max(0, stale_ttl_seconds)
+        self._namespaces: dict[str, _NamespaceStats] = {ns: _NamespaceStats() for ns in (*NAMESPACES, "other")}
+        self._cache: TTLCache[str, tuple[object, float]] = _TTLCache(
+            maxsize=maxsize, ttl=hard_ttl, on_evict=self._evicted
+        )
+        self._ttl_seconds = ttl_seconds
+        self._stale_ttl_seconds = max(0, stale_ttl_seconds)
+        self._hard_ttl_seconds = hard_ttl
+        self._l2 = l2
+        self._negative = negative
+        self._hits = 0
+        self._misses = 0
+        self._stale_hits = 0
+        self._access: dict[str, int] = {}
+        self._refreshing: set[str] = set()
+        self._refresh_lock = threading.Lock()
+        self._refresh_executor: ThreadPoolExecutor | None = None
 
     def get(self, key: str) -> object | None:
-        return self._cache.get(key)
+        return self.lookup(key)[0]
+
+    def lookup(self, key: str) -> tuple[object | None, bool]:
+        """(value, stale). 없거나 hard 만료면 (None, False)."""
+        now = time.time()
+        ns = self._namespaces[key_namespace(key)]
+        entry = self._cache.get(key)
+        if entry is not None and entry[1] > now:
+            self._hits += 1
+        else:
+            self._misses += 1
+            entry = self._l2.get(key) if self._l2 is not None else None
+            if entry is None:
+                ns.misses += 1
+                return None, False
+            # L2 hit → L1으로 승격 (남은 TTL 유지)
+            self._cache[key] = entry
+
+        ns.hits += 1
+        self._access[key] = self._access.get(key, 0) + 1
+        # expires_at은 hard 만료 시각 → stale 구간 길이를 빼면 soft 만료 시각
+        stale = entry[1] - self._stale_ttl_seconds <= now
+        if stale:
+            self._stale_hits += 1
+        return entry[0], stale
 
     def set(self, key: str, value: object) -> None:
-        self._cache[key] = value
+        expires_at = time.time() + self._hard_ttl_seconds
+        self._cache[key] = (value, expires_at)
+        # 갱신(refresh)으로 다시 저장될 때는 조회 수를 늘리지 않음
+        self._access.setdefault(key, 1)
+        if self._l2 is not None:
+            self._l2.set(key, value, expires_at=expires_at)
+
+    def delete(self, key: str) -> None:
+        """L1/L2에서 key를 지움 (갱신 결과 값이 없어진 경우: stale 값을 계속 내주지 않도록)."""
+        self._cache.pop(key, None)
+        self._access.pop(key, None)
+        if self._l2 is not None:
+            self._l2.delete(key)
+
+    def peek(self, key: str) -> bool:
+        """L1에 만료되지 않은(stale 포함) 값이 있는지. 통계/조회 수에 반영하지 않음."""
+        entry = self._cache.get(key)
+        return entry is not None and entry[1] > time.time()
+
+    def hot_keys(self, n: int) -> list[tuple[str, int]]:
+        """조회 수가 많은 L1 key n개 [(key, 조회 수)], 많은 순."""
+        return heapq.nlargest(n, list(self._access.items()), key=lambda item: item[1])
+
+    def seed_access(self, key: str, hits: int) -> None:
+        """L1에 있는 key의 조회 수를 최소 hits로 (warm-up 후 이전 snapshot 순위를 이어가도록)."""
+        if key in self._access:
+            self._access[key] = max(self._access[key], hits)
+
+    def schedule_refresh(self, key: str, refresh: Callable[[], Awaitable[Any]]) -> bool:
+        """
+        실행 중인 이벤트 루프에 key 갱신 작업을 예약합니다 (key당 동시에 1개).
+        갱신 작업은 호출한 요청의 context(trace 등)와 분리된 빈 context에서 실행됩니다.
+        """
+        if not self._claim_refresh(key):
+            return False
+
+        async def _run() -> None:
+            try:
+                await refresh()
+            except Exception as e:
+                log.warning("Background refresh failed for %s: %s", key, e)
+            finally:
+                self._release_refresh(key)
+
+        asyncio.get_running_loop().create_task(_run(), context=contextvars.Context())
+        return True
+
+    def schedule_refresh_sync(self, key: str, refresh: Callable[[], Any]) -> bool:
+        """schedule_refresh의 sync 버전: 백그라운드 스레드에서 갱신."""
+        if not self._claim_refresh(key):
+            return False
+
+        def _run() -> None:
+            try:
+                refresh()
+            except Exception as e:
+                log.warning("Background refresh failed for %s: %s", key, e)
+            finally:
+                self._release_refresh(key)
+
+        with self._refresh_lock:
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cache-refresh")
+            executor = self._refresh_executor
+        executor.submit(contextvars.Context().run, _run)
+        return True
+
+    def _claim_refresh(self, key: str) -> bool:
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def _release_refresh(self, key: str) -> None:
+        with self._refresh_lock:
+            self._refreshing.discard(key)
+
+    def set_negative(self, key: str) -> None:
+        """upstream이 정상 응답(errorCode=0)으로 0건을 돌려준 key를 기록."""
+        if self._negative is not None:
+            self._negative.add(key)
+
+    def is_negative(self, key: str) -> bool:
+        return self._negative is not None and key in self._negative
+
+    def _evicted(self, key: str, expired: bool) -> None:
+        self._access.pop(key, None)
+        ns = self._namespaces[key_namespace(key)]
+        if expired:
+            ns.expirations += 1
+        else:
+            ns.evictions += 1
+
+    def namespace_stats(self) -> dict[str, dict[str, int]]:
+        """
+        key namespace별 {"hits", "misses", "evictions", "expirations"}.
+        hits/misses는 L1+L2를 합친 조회 결과, evictions/expirations는 L1 기준.
+        """
+        return {
+            ns: {"hits": s.hits, "misses": s.misses, "evictions": s.evictions, "expirations": s.expirations}
+            for ns, s in self._namespaces.items()
+        }
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        out = {
+            "l1": {
+                "hits": self._hits,
+                "misses": self._misses,
+                "stale_hits": self._stale_hits,
+                "refreshing": len(self._refreshing),
+                "size": len(self._cache),
+            }
+        }
+        if self._l2 is not None:
+            out["l2"] = {**self._l2.stats(), "size": self._l2.size()}
+        if self._negative is not None:
+            out["negative"] = self._negative.stats()
+        return out
+
+    def close(self) -> None:
+        """종료 시 호출: 백그라운드 갱신 정리 후 L2를 디스크에 flush."""
+        if self._refresh_executor is not None:
+            self._refresh_executor.shutdown(wait=False, cancel_futures=True)
+        if self._l2 is not None:
+            self._l2.close()
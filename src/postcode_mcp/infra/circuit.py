@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from postcode_mcp.core.errors import CircuitOpenError, UpstreamError, UpstreamUnavailableError
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    provider(upstream endpoint) 하나의 circuit breaker.
+    - closed: 정상. 연속 failure_threshold번 실패(UpstreamUnavailableError)하면 open
+    - open: upstream을 호출하지 않고 즉시 CircuitOpenError. reset_timeout_seconds가 지나면 half-open
+    - half-open: 탐색 요청 1건만 통과시켜 성공하면 closed, 실패하면 다시 open
+    - upstream이 응답은 했지만 에러코드/4xx인 경우(UpstreamError)는 "도달 가능"으로 보고 성공 처리
+    """
+
+    def __init__(self, name: str, *, failure_threshold: int = 5, reset_timeout_seconds: float = 30.0) -> None:
+        self.name = name
+        self._failure_threshold = max(1, failure_threshold)
+        self._reset_timeout_seconds = reset_timeout_seconds
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.opened = 0  # open으로 바뀐 횟수
+        self.rejected = 0  # open이라 호출하지 않은 횟수
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == OPEN
+
+    def retry_after(self) -> float:
+        """open 상태가 풀리기까지 남은 시간(초)."""
+        with self._lock:
+            if self._state != OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self._reset_timeout_seconds - time.monotonic())
+
+    def _maybe_half_open(self) -> None:
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self._reset_timeout_seconds:
+            self._state = HALF_OPEN
+            self._probe_in_flight = False
+
+    def _before(self) -> None:
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == CLOSED:
+                return
+            if self._state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return
+            self.rejected += 1
+        raise CircuitOpenError(f"{self.name} upstream unavailable (circuit open)")
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != CLOSED:
+                log.info("Circuit %s closed", self.name)
+            self._state = CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or (self._state == CLOSED and self._failures >= self._failure_threshold):
+                log.warning("Circuit %s opened after %d failure(s)", self.name, self._failures)
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+                self.opened += 1
+
+    def _abandon(self) -> None:
+        # 취소 등으로 결과를 모르는 호출: 상태는 그대로, half-open 탐색 자리만 반납
+        with self._lock:
+            self._probe_in_flight = False
+
+    def call_sync(self, fn: Callable[[], T]) -> T:
+        self._before()
+        try:
+            result = fn()
+        except UpstreamUnavailableError:
+            self.record_failure()
+            raise
+        except UpstreamError:
+            self.record_success()
+            raise
+        except BaseException:
+            self._abandon()
+            raise
+        self.record_success()
+        return result
+
+    async def call(self, fn: Callable[[], Awaitable[T]]) -> T:
+        self._before()
+        try:
+            result = await fn()
+        except UpstreamUnavailableError:
+            self.record_failure()
+            raise
+        except UpstreamError:
+            self.record_success()
+            raise
+        except BaseException:
+            self._abandon()
+            raise
+        self.record_success()
+        return result
+
+    def stats(self) -> dict[str, object]:
+        return {
+            "state": self.state,
+            "failures": self._failures,
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import sys
+import threading
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+# key 구성(shape)별 공유 index 표 {keys: {key: 위치}}
+_SHAPES: dict[tuple[str, ...], dict[str, int]] = {}
+_SHAPES_LOCK = threading.Lock()
+# upstream 응답이 이상해 shape가 계속 늘어나는 경우 대비 상한 (넘으면 공유하지 않음)
+_MAX_SHAPES = 256
+
+
+def _shape(keys: tuple[str, ...]) -> dict[str, int]:
+    index = _SHAPES.get(keys)
+    if index is not None:
+        return index
+    index = {k: i for i, k in enumerate(keys)}
+    with _SHAPES_LOCK:
+        if len(_SHAPES) < _MAX_SHAPES:
+            index = _SHAPES.setdefault(keys, index)
+    return index
+
+
+class Record(tuple[Any, ...], Mapping[str, Any]):
+    """
+    캐시 보관용 읽기 전용 JSON object.
+    - tuple 하나에 값들 + 마지막 칸에 key → 위치 표, 표는 같은 key 구성의 Record끼리 공유
+      (dict처럼 항목마다 key/hash 테이블을 갖지 않음, 별도 객체 없이 tuple 하나)
+    - 변경 불가라 캐시 hit에서 복사 없이 그대로 반환해도 안전
+    - 밖에서는 Mapping으로만 다룸 (tuple 연산은 내부용)
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, keys: tuple[str, ...], values: tuple[Any, ...]) -> Record:
+        return tuple.__new__(cls, (*values, _shape(keys)))
+
+    def _index(self) -> dict[str, int]:
+        return tuple.__getitem__(self, -1)
+
+    def __getitem__(self, key: str) -> Any:  # type: ignore[override]
+        return tuple.__getitem__(self, self._index()[key])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index())
+
+    def __len__(self) -> int:
+        return tuple.__len__(self) - 1
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return dict(self.items()) == dict(other.items())
+
+    def __ne__(self, other: object) -> bool:
+        eq = self.__eq__(other)
+        return eq if eq is NotImplemented else not eq
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # 디스크 L2(pickle)에서 읽을 때도 shape 표를 공유하도록 key 목록으로 다시 생성
+        return Record, (tuple(self._index()), tuple(self.values()))
+
+    def __repr__(self) -> str:
+        return f"Record({dict(self)!r})"
+
+
+def compact(value: Any, *, intern_keys: frozenset[str] = frozenset()) -> Any:
+    """
+    JSON 값(dict/list/str/...)을 캐시용 compact 형태로 바꿉니다.
+    - dict → Record, list → tuple
+    - key와 intern_keys에 해당하는 값(시도/시군구명, 코드처럼 반복되는 짧은 문자열)은 sys.intern으로 공유
+    """
+    if isinstance(value, dict):
+        keys = tuple(sys.intern(str(k)) for k in value)
+        values = tuple(
+            sys.intern(v) if k in intern_keys and isinstance(v, str) else compact(v, intern_keys=intern_keys)
+            for k, v in zip(keys, value.values(), strict=True)
+        )
+        return Record(keys, values)
+    if isinstance(value, list):
+        return tuple(compact(v, intern_keys=intern_keys) for v in value)
+    return value
+
+
+def plain(value: Any) -> Any:
+    """compact의 역변환 (응답 직렬화용: Record → dict, tuple → list). 안쪽의 Record까지 찾아 바꾸도록 dict/list도 다시 만듦."""
+    if isinstance(value, Mapping):
+        return {k: plain(v) for k, v in value.items()}
+    if isinstance(value, (tuple, list)):
+        return [plain(v) for v in value]
+    return value
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+log = logging.getLogger(__name__)
+
+# 만료 행 정리는 N번 쓰기마다 한 번
+_PURGE_EVERY = 1000
+
+
+class SqliteCache:
+    """
+    Cache의 디스크 L2 계층 (SQLite WAL 모드).
+    - 재시작 후에도 유지되고, 같은 파일을 여러 워커 프로세스가 동시에 읽을 수 있음
+    - 값은 pickle로 저장, expires_at(epoch seconds)으로 TTL 적용
+    - fork된 프로세스에서는 연결을 새로 엶 (SQLite 연결은 fork 간 공유 불가)
+    """
+
+    def __init__(self, *, path: str, ttl_seconds: int) -> None:
+        self._path = path
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._pid = 0
+        self._writes = 0
+        self._hits = 0
+        self._misses = 0
+
+        parent = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent, exist_ok=True)
+        self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is not None and self._pid == os.getpid():
+            return self._conn
+
+        conn = sqlite3.connect(self._path, timeout=5.0, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            " key TEXT PRIMARY KEY,"
+            " value BLOB NOT NULL,"
+            " expires_at REAL NOT NULL"
+            ")"
+        )
+        self._conn = conn
+        self._pid = os.getpid()
+        return conn
+
+    def get(self, key: str) -> tuple[object, float] | None:
+        """(value, expires_at) 또는 None(없거나 만료)."""
+        with self._lock:
+            try:
+                row = self._connect().execute(
+                    "SELECT value, expires_at FROM cache WHERE key = ? AND expires_at > ?",
+                    (key, time.time()),
+                ).fetchone()
+            except sqlite3.Error as e:
+                log.warning("Disk cache read failed: %s", e)
+                row = None
+
+            if row is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+        try:
+            return pickle.loads(row[0]), float(row[1])
+        except Exception as e:
+            log.warning("Disk cache entry is unreadable (%s): %s", key, e)
+            return None
+
+    def set(self, key: str, value: object, *, expires_at: float | None = None) -> None:
+        if expires_at is None:
+            expires_at = time.time() + self._ttl_seconds
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+        with self._lock:
+            try:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, blob, expires_at),
+                )
+                self._writes += 1
+                if self._writes % _PURGE_EVERY == 0:
+                    conn.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+            except sqlite3.Error as e:
+                # L2 쓰기 실패는 L1만으로 계속 동작
+                log.warning("Disk cache write failed: %s", e)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            try:
+                self._connect().execute("DELETE FROM cache WHERE key = ?", (key,))
+            except sqlite3.Error as e:
+                log.warning("Disk cache delete failed: %s", e)
+
+    def size(self) -> int:
+        with self._lock:
+            try:
+                row = self._connect().execute("SELECT COUNT(*) FROM cache").fetchone()
+            except sqlite3.Error:
+                return 0
+        return int(row[0])
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self._hits, "misses": self._misses, "writes": self._writes}
+
+    def close(self) -> None:
+        """WAL을 본 DB 파일에 반영(checkpoint)하고 연결을 닫습니다."""
+        with self._lock:
+            if self._conn is None or self._pid != os.getpid():
+                return
+            try:
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                self._conn.close()
+            except sqlite3.Error as e:
+                log.warning("Disk cache close failed: %s", e)
+            finally:
+                self._conn = None
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from urllib.parse import urlencode
+
+import httpx
+
+from postcode_mcp.infra.metrics import endpoint_name
+
+log = logging.getLogger(__name__)
+
+OFF = "off"
+RECORD = "record"
+REPLAY = "replay"
+MODES = (OFF, RECORD, REPLAY)
+
+# fixture key에서 빼는 파라미터 (API 키는 파일에 남기지 않고, 키가 달라도 같은 응답으로 봄)
+_STRIPPED_PARAMS = frozenset({"confmKey"})
+_JSON_HEADERS = {"content-type": "application/json;charset=UTF-8"}
+
+
+def fixture_key(url: httpx.URL) -> str:
+    """endpoint 이름 + 정렬된 파라미터 (confmKey 제외, 값 앞뒤 공백 제거)."""
+    params = sorted((k, v.strip()) for k, v in url.params.multi_items() if k not in _STRIPPED_PARAMS)
+    return f"{endpoint_name(url.path)}?{urlencode(params)}"
+
+
+class HttpFixtures:
+    """
+    upstream 응답 기록/재생 저장소 (SQLite, 응답 본문은 zlib 압축).
+    - record: 실제 upstream 호출 결과 중 2xx 응답을 key별 최신 1건으로 저장 (응답시간 포함)
+    - replay: 네트워크 없이 저장된 응답을 반환, replay_latency=True면 기록된 응답시간만큼 대기
+      (기록에 없는 요청은 404 → 재시도/circuit 실패로 세지 않는 UpstreamError)
+    HttpClient/AsyncHttpClient의 transport를 감싸는 방식이라 rate limit/재시도/캐시/파싱 경로는 그대로 탐.
+    """
+
+    def __init__(self, *, path: str, mode: str, replay_latency: bool = False) -> None:
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Unknown fixture mode: {mode!r} ({RECORD} | {REPLAY})")
+        self.path = path
+        self.mode = mode
+        self.replay_latency = replay_latency
+        self._lock = threading.Lock()
+        self._recorded = 0
+        self._replayed = 0
+        self._misses = 0
+        self._closed = False
+
+        parent = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=5.0, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS fixtures ("
+            " key TEXT PRIMARY KEY,"
+            " status INTEGER NOT NULL,"
+            " body BLOB NOT NULL,"
+            " elapsed_ms REAL NOT NULL,"
+            " recorded_at REAL NOT NULL"
+            ")"
+        )
+
+    # --- store ---
+
+    def get(self, key: str) -> tuple[int, bytes, float] | None:
+        """(status, body, elapsed_ms) 또는 None."""
+        with self._lock:
+            row = self._conn.execute("SELECT status, body, elapsed_ms FROM fixtures WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        return int(row[0]), zlib.decompress(row[1]), float(row[2])
+
+    def put(self, key: str, status: int, body: bytes, elapsed_ms: float) -> None:
+        blob = zlib.compress(body, 6)
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO fixtures (key, status, body, elapsed_ms, recorded_at) VALUES (?, ?, ?, ?, ?)",
+                    (key, status, blob, elapsed_ms, time.time()),
+                )
+                self._recorded += 1
+            except sqlite3.Error as e:
+                log.warning("Fixture write failed: %s", e)
+
+    def size(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM fixtures").fetchone()[0])
+
+    def stats(self) -> dict[str, int]:
+        return {"recorded": self._recorded, "replayed": self._replayed, "misses": self._misses}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            try:
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                self._conn.close()
+            except sqlite3.Error as e:
+                log.warning("Fixture store close failed: %s", e)
+
+    # --- transports ---
+
+    def transport(self, inner: httpx.BaseTransport) -> httpx.BaseTransport:
+        return _RecordingTransport(self, inner) if self.mode == RECORD else _ReplayTransport(self)
+
+    def async_transport(self, inner: httpx.AsyncBaseTransport) -> httpx.AsyncBaseTransport:
+        return _AsyncRecordingTransport(self, inner) if self.mode == RECORD else _AsyncReplayTransport(self)
+
+    def _record(self, request: httpx.Request, response: httpx.Response, elapsed: float) -> None:
+        if 200 <= response.status_code < 300:
+            self.put(fixture_key(request.url), response.status_code, response.content, elapsed * 1000)
+
+    def _replay(self, request: httpx.Request) -> tuple[httpx.Response, float]:
+        key = fixture_key(request.url)
+        found = self.get(key)
+        if found is None:
+            self._misses += 1
+            log.warning("No recorded response for %s", key)
+            return httpx.Response(404, request=request), 0.0
+        self._replayed += 1
+        status, body, elapsed_ms = found
+        delay = elapsed_ms / 1000 if self.replay_latency else 0.0
+        return httpx.Response(status, headers=_JSON_HEADERS, content=body, request=request), delay
+
+
+class _RecordingTransport(httpx.BaseTransport):
+    def __init__(self, fixtures: HttpFixtures, inner: httpx.BaseTransport) -> None:
+        self._fixtures = fixtures
+        self._inner = inner
+
+    @property
+    def _pool(self) -> object:
+        # HttpClient.pool_stats/prewarm이 감싼 transport의 connection pool을 보도록
+        return getattr(self._inner, "_pool", None)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        t0 = time.perf_counter()
+        response = self._inner.handle_request(request)
+        response.read()
+        self._fixtures._record(request, response, time.perf_counter() - t0)
+        return response
+
+    def close(self) -> None:
+        self._inner.close()
+
+
+class _AsyncRecordingTransport(httpx.AsyncBaseTransport):
+    def __init__(self, fixtures: HttpFixtures, inner: httpx.AsyncBaseTransport) -> None:
+        self._fixtures = fixtures
+        self._inner = inner
+
+    @property
+    def _pool(self) -> object:
+        return getattr(self._inner, "_pool", None)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        t0 = time.perf_counter()
+        response = await self._inner.handle_async_request(request)
+        await response.aread()
+        self._fixtures._record(request, response, time.perf_counter() - t0)
+        return response
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+class _ReplayTransport(httpx.BaseTransport):
+    def __init__(self, fixtures: HttpFixtures) -> None:
+        self._fixtures = fixtures
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response, delay = self._fixtures._replay(request)
+        if delay:
+            time.sleep(delay)
+        return response
+
+
+class _AsyncReplayTransport(httpx.AsyncBaseTransport):
+    def __init__(self, fixtures: HttpFixtures) -> None:
+        self._fixtures = fixtures
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response, delay = self._fixtures._replay(request)
+        if delay:
+            await asyncio.sleep(delay)
+        return response
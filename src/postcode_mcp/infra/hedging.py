@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import collections
+import threading
+
+from postcode_mcp.infra.metrics import endpoint_name
+from postcode_mcp.infra.retry import RetryBudget
+
+# percentile 계산에 쓰는 최근 응답 수 (endpoint별)
+_WINDOW = 512
+# 이 개수만큼 새 샘플이 쌓일 때마다 percentile 재계산
+_RECOMPUTE_EVERY = 16
+
+
+class LatencyTracker:
+    """endpoint 하나의 최근 응답시간(초) 분포."""
+
+    def __init__(self, window: int = _WINDOW) -> None:
+        self._samples: collections.deque[float] = collections.deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._since_sorted = 0
+        self._sorted: list[float] = []
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+            self._since_sorted += 1
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, q: float) -> float | None:
+        with self._lock:
+            if not self._samples:
+                return None
+            if self._since_sorted >= _RECOMPUTE_EVERY or not self._sorted:
+                self._sorted = sorted(self._samples)
+                self._since_sorted = 0
+            data = self._sorted
+        return data[min(len(data) - 1, int(q * len(data)))]
+
+
+class Hedger:
+    """
+    hedged request 정책.
+    - 첫 요청이 endpoint의 최근 percentile(기본 p95) 안에 응답하지 않으면 같은 요청을 한 번 더 보내고 먼저 온 응답 사용
+    - hedge 비율은 max_ratio로 제한 (RetryBudget과 같은 token ratio: 요청마다 max_ratio 적립, hedge마다 1 소모)
+    - 샘플이 min_samples보다 적으면 hedge하지 않음
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: float = 0.95,
+        max_ratio: float = 0.05,
+        min_delay_seconds: float = 0.05,
+        min_samples: int = 20,
+    ) -> None:
+        self._percentile = percentile
+        self._min_delay_seconds = min_delay_seconds
+        self._min_samples = min_samples
+        self._budget = RetryBudget(ratio=max_ratio, max_tokens=max(1.0, max_ratio * 20))
+        self._trackers: dict[str, LatencyTracker] = {}
+        self._lock = threading.Lock()
+        self.hedges = 0
+        self.hedge_wins = 0  # hedge 요청이 먼저 응답한 횟수
+
+    def _tracker(self, url: str) -> LatencyTracker:
+        tracker = self._trackers.get(url)
+        if tracker is None:
+            with self._lock:
+                tracker = self._trackers.setdefault(url, LatencyTracker())
+        return tracker
+
+    def observe(self, url: str, seconds: float) -> None:
+        self._tracker(url).observe(seconds)
+
+    def delay(self, url: str) -> float | None:
+        """hedge를 보내기 전 기다릴 시간. None이면 이번 요청은 hedge 대상 아님."""
+        self._budget.deposit()
+        tracker = self._tracker(url)
+        if len(tracker) < self._min_samples:
+            return None
+        p = tracker.percentile(self._percentile)
+        return max(self._min_delay_seconds, p) if p is not None else None
+
+    def try_hedge(self) -> bool:
+        if not self._budget.withdraw():
+            return False
+        self.hedges += 1
+        return True
+
+    def stats(self) -> dict[str, object]:
+        """{"latency": {endpoint: {p50_ms, p95_ms, p99_ms}}, "hedges", "hedge_wins"}"""
+        latency: dict[str, dict[str, float]] = {}
+        for url, tracker in list(self._trackers.items()):
+            endpoint = endpoint_name(url)
+            latency[endpoint] = {
+                f"p{int(q * 100)}_ms": round((tracker.percentile(q) or 0.0) * 1000, 1) for q in (0.5, 0.95, 0.99)
+            }
+        return {"latency": latency, "hedges": self.hedges, "hedge_wins": self.hedge_wins}
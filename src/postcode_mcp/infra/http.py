@@ -1,27 +1,212 @@
 from __future__ import annotations
 
+import asyncio
+import importlib.util
 import logging
-from typing import Any
+import time
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
 
 import httpx
 
-from postcode_mcp.core.errors import UpstreamError
+from postcode_mcp.core.errors import UpstreamError, UpstreamUnavailableError
+from postcode_mcp.core.trace import note_attempt
+from postcode_mcp.infra.metrics import Histogram, endpoint_name
+from postcode_mcp.infra.ratelimit import Outcome, RateLimiter, classify_error, classify_payload
+from postcode_mcp.infra.retry import RetryBudget, RetryPolicy, is_retryable
+
+if TYPE_CHECKING:
+    from postcode_mcp.infra.fixtures import HttpFixtures
+    from postcode_mcp.infra.hedging import Hedger
 
 log = logging.getLogger(__name__)
 
 
-class HttpClient:
-    def __init__(self, *, timeout_seconds: float, user_agent: str) -> None:
-        self._client = httpx.Client(timeout=timeout_seconds, headers={"User-Agent": user_agent})
+def _upstream_error(e: httpx.HTTPError) -> UpstreamError:
+    # 연결 실패/5xx/timeout(재시도 대상과 같은 기준)은 "upstream 불가"로 구분 → circuit breaker가 실패로 셈
+    cls = UpstreamUnavailableError if is_retryable(e) or isinstance(e, httpx.TimeoutException) else UpstreamError
+    return cls(f"Upstream HTTP error: {e}")
+
+
+def http2_available() -> bool:
+    """HTTP/2는 h2 패키지(httpx[http2])가 있어야 사용 가능."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def _client_options(
+    *,
+    timeout_seconds: float,
+    user_agent: str,
+    limits: httpx.Limits | None,
+    http2: bool,
+) -> dict[str, Any]:
+    if http2 and not http2_available():
+        log.warning("HTTP_HTTP2 is enabled but h2 is not installed (pip install 'httpx[http2]'); using HTTP/1.1")
+        http2 = False
+    return {
+        "timeout": timeout_seconds,
+        "headers": {"User-Agent": user_agent},
+        "limits": limits or httpx.Limits(),
+        # TLS(ALPN)로 협상하므로 https endpoint에만 적용됨
+        "http2": http2,
+    }
+
+
+def _prewarm_targets(urls: Iterable[str]) -> list[str]:
+    # origin(scheme + host + port)마다 연결 하나면 충분 → origin별 첫 URL만
+    targets: dict[tuple[str, str], str] = {}
+    for url in urls:
+        parts = urlsplit(url)
+        targets.setdefault((parts.scheme, parts.netloc), url)
+    return list(targets.values())
+
+
+class _BaseHttpClient:
+    """HttpClient/AsyncHttpClient 공통: rate limit, 재시도 정책, 호출 통계."""
+
+    def __init__(
+        self,
+        *,
+        limiter: RateLimiter | None,
+        retry: RetryPolicy | None,
+        retry_budget: RetryBudget | None,
+    ) -> None:
+        # endpoint × confmKey 단위 rate/동시성 제한 (None이면 제한 없음)
+        self._limiter = limiter
+        # GET은 멱등 → 재시도 가능한 실패는 backoff 후 재시도 (budget 안에서만)
+        self._retry = retry or RetryPolicy(max_attempts=1)
+        self._retry_budget = retry_budget
+        # upstream 호출(시도)/재시도/실패 횟수 (batch 리포트, 메트릭용)
+        self._requests = 0
+        self._retries = 0
+        self._errors = 0
+        self._limits = httpx.Limits()
+        # endpoint별 응답시간(시도 단위, 실패 포함)/실패 수 (메트릭용)
+        self.latency = Histogram()
+        self.endpoint_errors: dict[str, int] = {}
+
+    def _should_retry(self, e: httpx.HTTPError, attempt: int) -> bool:
+        if attempt >= self._retry.max_attempts or not is_retryable(e):
+            return False
+        if self._retry_budget is not None and not self._retry_budget.withdraw():
+            log.warning("Retry budget exhausted, not retrying: %s", e)
+            return False
+        self._retries += 1
+        note_attempt(retry=True)
+        return True
+
+    def stats(self) -> dict[str, int]:
+        return {"requests": self._requests, "retries": self._retries, "errors": self._errors}
+
+    def _observe(self, url: str, seconds: float, *, error: bool) -> None:
+        endpoint = endpoint_name(url)
+        self.latency.observe(endpoint, seconds)
+        if error:
+            self.endpoint_errors[endpoint] = self.endpoint_errors.get(endpoint, 0) + 1
+
+    def _pool(self) -> Any:
+        # httpx 기본 transport의 httpcore connection pool (MockTransport 등 주입된 transport면 None)
+        transport = getattr(getattr(self, "_client", None), "_transport", None)
+        return getattr(transport, "_pool", None)
+
+    def pool_stats(self) -> dict[str, float]:
+        """
+        connection pool 사용 현황 {"max_connections", "connections", "active", "idle", "utilization"}.
+        connection pool이 없는 transport(테스트의 MockTransport 등)면 빈 dict.
+        """
+        pool = self._pool()
+        if pool is None:
+            return {}
+        connections = list(pool.connections)
+        active = sum(1 for c in connections if not c.is_idle())
+        max_connections = self._limits.max_connections
+        return {
+            "max_connections": max_connections or 0,
+            "connections": len(connections),
+            "active": active,
+            "idle": len(connections) - active,
+            "utilization": round(active / max_connections, 3) if max_connections else 0.0,
+        }
+
+
+class HttpClient(_BaseHttpClient):
+    def __init__(
+        self,
+        *,
+        timeout_seconds: float,
+        user_agent: str,
+        transport: httpx.BaseTransport | None = None,
+        limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
+        retry_budget: RetryBudget | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        fixtures: HttpFixtures | None = None,
+    ) -> None:
+        super().__init__(limiter=limiter, retry=retry, retry_budget=retry_budget)
+        options = _client_options(timeout_seconds=timeout_seconds, user_agent=user_agent, limits=limits, http2=http2)
+        self._limits = options["limits"]
+        if fixtures is not None:
+            # record: 실제 transport 응답을 저장, replay: 저장된 응답만 반환 (네트워크 없음)
+            inner = transport or httpx.HTTPTransport(limits=options["limits"], http2=options["http2"])
+            transport = fixtures.transport(inner)
+        self._client = httpx.Client(transport=transport, **options)
 
     def get_json(self, url: str, *, params: dict[str, Any]) -> dict[str, Any]:
+        if self._retry_budget is not None:
+            self._retry_budget.deposit()
+        attempt = 1
+        while True:
+            try:
+                return self._attempt(url, params)
+            except httpx.HTTPError as e:
+                if not self._should_retry(e, attempt):
+                    raise _upstream_error(e) from e
+                delay = self._retry.backoff(attempt)
+                log.info("Retrying %s in %.0fms (attempt %d): %s", url, delay * 1000, attempt + 1, e)
+                time.sleep(delay)
+                attempt += 1
+
+    def _attempt(self, url: str, params: dict[str, Any]) -> dict[str, Any]:
+        self._requests += 1
+        note_attempt(retry=False)
+        permit = self._limiter.acquire_sync(url, params) if self._limiter is not None else None
+        outcome = Outcome.ERROR
+        t0 = time.perf_counter()
         try:
             r = self._client.get(url, params=params)
             r.raise_for_status()
-            return r.json()
+            payload = r.json()
+            outcome = classify_payload(payload)
+            self._observe(url, time.perf_counter() - t0, error=False)
+            return payload
         except httpx.HTTPError as e:
+            self._errors += 1
+            self._observe(url, time.perf_counter() - t0, error=True)
+            outcome = classify_error(e)
             log.warning("HTTP error: %s", e)
-            raise UpstreamError(f"Upstream HTTP error: {e}") from e
+            raise
+        finally:
+            if permit is not None:
+                permit.release(outcome)
+
+    def prewarm(self, urls: Iterable[str]) -> int:
+        """
+        endpoint origin마다 HEAD 요청을 보내 DNS/TCP/TLS 연결을 미리 맺고 keep-alive pool에 남겨 둡니다.
+        실패는 무시(첫 실제 요청이 평소처럼 연결). rate limit/통계에는 포함되지 않음. 반환값: 연결에 성공한 origin 수.
+        connection pool이 없는 transport(MockTransport 등)면 아무것도 보내지 않음.
+        """
+        if self._pool() is None:
+            return 0
+        warmed = 0
+        for url in _prewarm_targets(urls):
+            try:
+                self._client.head(url)
+                warmed += 1
+            except httpx.HTTPError as e:
+                log.info("Connection prewarm failed for %s: %s", url, e)
+        return warmed
 
     def close(self) -> None:
         try:
@@ -29,3 +214,135 @@ class HttpClient:
         except Exception:
             # close 실패는 무시(프로세스 종료 시점)
             pass
+
+
+class AsyncHttpClient(_BaseHttpClient):
+    """
+    HttpClient의 비동기 버전.
+    - 요청 대기 중 워커 스레드를 점유하지 않으므로 HTTP transport에서 동시 조회를 많이 처리할 수 있음
+    - 인터페이스는 HttpClient와 동일(get_json), 단 await 필요
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout_seconds: float,
+        user_agent: str,
+        transport: httpx.AsyncBaseTransport | None = None,
+        limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
+        retry_budget: RetryBudget | None = None,
+        hedger: Hedger | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        fixtures: HttpFixtures | None = None,
+    ) -> None:
+        super().__init__(limiter=limiter, retry=retry, retry_budget=retry_budget)
+        options = _client_options(timeout_seconds=timeout_seconds, user_agent=user_agent, limits=limits, http2=http2)
+        self._limits = options["limits"]
+        if fixtures is not None:
+            inner = transport or httpx.AsyncHTTPTransport(limits=options["limits"], http2=options["http2"])
+            transport = fixtures.async_transport(inner)
+        self._client = httpx.AsyncClient(transport=transport, **options)
+        # 느린 응답(꼬리 지연)에 대비한 hedged request (None이면 사용 안 함)
+        self._hedger = hedger
+
+    async def get_json(self, url: str, *, params: dict[str, Any]) -> dict[str, Any]:
+        if self._retry_budget is not None:
+            self._retry_budget.deposit()
+        attempt = 1
+        while True:
+            try:
+                return await self._attempt(url, params)
+            except httpx.HTTPError as e:
+                if not self._should_retry(e, attempt):
+                    raise _upstream_error(e) from e
+                delay = self._retry.backoff(attempt)
+                log.info("Retrying %s in %.0fms (attempt %d): %s", url, delay * 1000, attempt + 1, e)
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def _attempt(self, url: str, params: dict[str, Any]) -> dict[str, Any]:
+        delay = self._hedger.delay(url) if self._hedger is not None else None
+        if delay is None:
+            return await self._send(url, params)
+        return await self._hedged(url, params, delay)
+
+    async def _hedged(self, url: str, params: dict[str, Any], delay: float) -> dict[str, Any]:
+        """
+        첫 요청이 delay 안에 끝나지 않으면 같은 요청을 하나 더 보내고 먼저 성공한 응답을 사용합니다.
+        (한쪽이 실패하면 나머지를 기다림, 둘 다 실패하면 먼저 난 에러를 올림)
+        """
+        assert self._hedger is not None
+        first = asyncio.ensure_future(self._send(url, params))
+        tasks = {first}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done and self._hedger.try_hedge():
+                log.debug("Hedging %s after %.0fms", url, delay * 1000)
+                tasks.add(asyncio.ensure_future(self._send(url, params)))
+
+            error: BaseException | None = None
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not first:
+                            self._hedger.hedge_wins += 1
+                        return task.result()
+                    error = error or task.exception()
+            assert error is not None
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _send(self, url: str, params: dict[str, Any]) -> dict[str, Any]:
+        self._requests += 1
+        note_attempt(retry=False)
+        permit = await self._limiter.acquire(url, params) if self._limiter is not None else None
+        outcome = Outcome.ERROR
+        t0 = time.perf_counter()
+        try:
+            r = await self._client.get(url, params=params)
+            r.raise_for_status()
+            payload = r.json()
+            outcome = classify_payload(payload)
+            elapsed = time.perf_counter() - t0
+            self._observe(url, elapsed, error=False)
+            if self._hedger is not None:
+                self._hedger.observe(url, elapsed)
+            return payload
+        except httpx.HTTPError as e:
+            self._errors += 1
+            self._observe(url, time.perf_counter() - t0, error=True)
+            outcome = classify_error(e)
+            log.warning("HTTP error: %s", e)
+            raise
+        finally:
+            if permit is not None:
+                permit.release(outcome)
+
+    async def prewarm(self, urls: Iterable[str]) -> int:
+        """HttpClient.prewarm의 비동기 버전 (origin들을 동시에 연결)."""
+        if self._pool() is None:
+            return 0
+
+        async def warm(url: str) -> bool:
+            try:
+                await self._client.head(url)
+                return True
+            except httpx.HTTPError as e:
+                log.info("Connection prewarm failed for %s: %s", url, e)
+                return False
+
+        results = await asyncio.gather(*(warm(url) for url in _prewarm_targets(urls)))
+        return sum(results)
+
+    async def aclose(self) -> None:
+        try:
+            await self._client.aclose()
+        except Exception:
+            # close 실패는 무시(프로세스 종료 시점)
+            pass
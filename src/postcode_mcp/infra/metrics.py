@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import bisect
+import functools
+from collections.abc import Iterable, Mapping
+from urllib.parse import urlsplit
+
+# 응답시간 histogram 구간 (초)
+DEFAULT_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@functools.lru_cache(maxsize=64)
+def endpoint_name(url: str) -> str:
+    """메트릭 label용 endpoint 이름 (예: addrLinkApi.do)."""
+    return urlsplit(url).path.rsplit("/", 1)[-1] or url
+
+
+class _Series:
+    __slots__ = ("counts", "sum")
+
+    def __init__(self, size: int) -> None:
+        self.counts = [0] * size
+        self.sum = 0.0
+
+
+class Histogram:
+    """
+    label 값(tool 이름, endpoint 등)별 누적 histogram.
+    hot path 비용을 줄이려고 observe는 lock 없이 구간 카운터 하나와 합계만 갱신합니다
+    (다른 통계 카운터와 같이 GIL 아래의 단순 증가, 누적 구간 합은 출력할 때 계산).
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[str, _Series] = {}
+
+    def observe(self, label: str, seconds: float) -> None:
+        series = self._series.get(label)
+        if series is None:
+            series = self._series.setdefault(label, _Series(len(self.buckets) + 1))
+        series.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        series.sum += seconds
+
+    def series(self) -> dict[str, _Series]:
+        return dict(self._series)
+
+
+class ToolMetrics:
+    """MCP tool 호출 메트릭: tool별 응답시간/에러 수, 처리 중인 호출 수."""
+
+    def __init__(self) -> None:
+        self.latency = Histogram()
+        self.errors: dict[str, int] = {}
+        self.in_flight = 0
+
+    def started(self) -> None:
+        self.in_flight += 1
+
+    def finished(self, tool: str, seconds: float, *, error: bool) -> None:
+        self.in_flight -= 1
+        self.latency.observe(tool, seconds)
+        if error:
+            self.errors[tool] = self.errors.get(tool, 0) + 1
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: Mapping[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class PrometheusText:
+    """Prometheus text exposition format(0.0.4) 작성기."""
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self, prefix: str = "") -> None:
+        self._prefix = prefix
+        self._lines: list[str] = []
+
+    def _family(self, name: str, kind: str, help_text: str) -> str:
+        name = self._prefix + name
+        self._lines.append(f"# HELP {name} {help_text}")
+        self._lines.append(f"# TYPE {name} {kind}")
+        return name
+
+    def metric(
+        self,
+        name: str,
+        kind: str,
+        help_text: str,
+        samples: Iterable[tuple[Mapping[str, str], float]],
+    ) -> None:
+        """counter/gauge 하나: samples는 (labels, value) 목록."""
+        samples = list(samples)
+        if not samples:
+            return
+        full = self._family(name, kind, help_text)
+        for labels, value in samples:
+            self._lines.append(f"{full}{_labels(labels)} {_number(value)}")
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        label: str,
+        histograms: Iterable[tuple[Mapping[str, str], Histogram]],
+    ) -> None:
+        """histogram 하나: histograms는 (고정 labels, Histogram) 목록 (예: sync/async 클라이언트별)."""
+        parts = [(const, h, h.series()) for const, h in histograms]
+        if not any(series for _, _, series in parts):
+            return
+        full = self._family(name, "histogram", help_text)
+        for const, h, series in parts:
+            bounds = [*h.buckets, float("inf")]
+            for value, s in sorted(series.items()):
+                base = {**const, label: value}
+                cumulative = 0
+                for bound, count in zip(bounds, s.counts, strict=True):
+                    cumulative += count
+                    self._lines.append(f"{full}_bucket{_labels({**base, 'le': _number(bound)})} {cumulative}")
+                self._lines.append(f"{full}_sum{_labels(base)} {_number(s.sum)}")
+                self._lines.append(f"{full}_count{_labels(base)} {cumulative}")
+
+    def render(self) -> str:
+        return "\n".join(self._lines) + "\n"
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import threading
+import time
+
+
+class BloomFilter:
+    """
+    고정 크기 Bloom filter (bytearray 비트맵 + double hashing).
+    - capacity개를 넣었을 때 false positive 확률이 error_rate가 되도록 크기를 잡음
+    - 삭제는 지원하지 않음 (만료는 NegativeCache의 세대 교체로 처리)
+    """
+
+    def __init__(self, *, capacity: int, error_rate: float) -> None:
+        capacity = max(1, capacity)
+        bits = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self._bits = max(8, bits)
+        self._hashes = max(1, round(self._bits / capacity * math.log(2)))
+        self._array = bytearray((self._bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str) -> list[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self._bits for i in range(self._hashes)]
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self._array[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._array[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._array)
+
+
+class NegativeCache:
+    """
+    "정상 응답인데 결과 0건"인 key 집합 (negative caching).
+    - Bloom filter 두 세대(current/previous)를 ttl/2마다 교체 → key는 ttl/2 ~ ttl 동안 유지
+    - key 수가 많아도 메모리는 capacity/error_rate로 고정
+    - false positive(확률 ~error_rate)로 실제 결과가 있는 key가 최대 ttl 동안 0건으로 보일 수 있으므로
+      ttl은 짧게, error_rate는 낮게 둘 것
+    """
+
+    def __init__(self, *, ttl_seconds: int, capacity: int, error_rate: float) -> None:
+        self._rotate_every = max(1.0, ttl_seconds / 2)
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._lock = threading.Lock()
+        self._current = BloomFilter(capacity=capacity, error_rate=error_rate)
+        self._previous = BloomFilter(capacity=capacity, error_rate=error_rate)
+        self._rotated_at = time.monotonic()
+        self._hits = 0
+
+    def _maybe_rotate(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._rotated_at
+        if elapsed < self._rotate_every:
+            return
+        if elapsed >= 2 * self._rotate_every:
+            # 두 세대 모두 만료
+            self._previous = BloomFilter(capacity=self._capacity, error_rate=self._error_rate)
+        else:
+            self._previous = self._current
+        self._current = BloomFilter(capacity=self._capacity, error_rate=self._error_rate)
+        self._rotated_at = now
+
+    def add(self, key: str) -> None:
+        with self._lock:
+            self._maybe_rotate()
+            # 세대가 capacity를 넘기면 error_rate 보장이 깨지므로 조기 교체
+            if self._current.count >= self._capacity:
+                self._previous = self._current
+                self._current = BloomFilter(capacity=self._capacity, error_rate=self._error_rate)
+                self._rotated_at = time.monotonic()
+            self._current.add(key)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            self._maybe_rotate()
+            found = key in self._current or key in self._previous
+            if found:
+                self._hits += 1
+            return found
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self._hits,
+            "size": self._current.count + self._previous.count,
+            "bytes": self._current.nbytes + self._previous.nbytes,
+        }
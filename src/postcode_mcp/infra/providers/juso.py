@@ -1,17 +1,33 @@
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import logging
+import sys
+import threading
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 from typing import Any
 
+from postcode_mcp.core.concurrency import gather_limited
 from postcode_mcp.core.errors import UpstreamError, ValidationError
 from postcode_mcp.core.models import AddressCandidate
 from postcode_mcp.core.text import normalize_postcode, normalize_query
+from postcode_mcp.core.trace import note_cache, note_stale, span
 from postcode_mcp.infra.cache import Cache
-from postcode_mcp.infra.http import HttpClient
+from postcode_mcp.infra.circuit import CircuitBreaker
+from postcode_mcp.infra.http import AsyncHttpClient, HttpClient
+from postcode_mcp.infra.singleflight import SingleFlight
 
 log = logging.getLogger(__name__)
 
 JUSO_API_URL = "http://www.juso.go.kr/addrlink/addrLinkApi.do"
+# addrLinkApi의 countPerPage 최댓값
+MAX_COUNT_PER_PAGE = 100
+# totalCount 확인 후 나머지 페이지를 동시에 조회하는 최대 개수
+PAGE_FETCH_CONCURRENCY = 4
 
 
 class JusoProvider:
@@ -24,124 +40,340 @@ class JusoProvider:
         first_sort: str,
         add_info_yn: str,
         cache: Cache,
+        async_http: AsyncHttpClient | None = None,
+        singleflight: SingleFlight | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        api_url: str = JUSO_API_URL,
     ) -> None:
         self._http = http
+        self._async_http = async_http
+        self._api_url = api_url
         self._confm_key = confm_key
         self._count_per_page = count_per_page
         self._first_sort = first_sort
         self._add_info_yn = add_info_yn
         self._cache = cache
+        self._inflight = singleflight or SingleFlight()
+        self._breaker = circuit_breaker or CircuitBreaker("search")
+        self._pool: ThreadPoolExecutor | None = None
+        self._pool_lock = threading.Lock()
 
-    def search(self, keyword: str, *, max_results: int | None = None) -> list[AddressCandidate]:
+    @property
+    def singleflight(self) -> SingleFlight:
+        return self._inflight
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        return self._breaker
+
+    def search(self, keyword: str, *, max_results: int | None = None) -> Sequence[AddressCandidate]:
         """
         행안부 주소검색 API를 호출하여 주소 후보를 반환합니다.
 
         Args:
             keyword: 검색어 (주소 또는 장소명)
-            max_results: 최대 반환 개수 (None이면 count_per_page만큼)
+            max_results: 최대 반환 개수 (None이면 count_per_page만큼, count_per_page보다 크면 여러 페이지 조회)
 
         Returns:
-            AddressCandidate 리스트
+            AddressCandidate tuple (캐시 엔트리를 복사하지 않고 그대로 반환하므로 읽기 전용)
+        """
+        keyword, max_results, cache_key = self._prepare(keyword, max_results)
+
+        # 캐시 확인: 더 큰 N으로 받아둔 결과가 있으면 잘라서 반환
+        entry, stale = self._lookup(cache_key, keyword)
+        if stale and not self._breaker.is_open:
+            # stale-while-revalidate: 지금은 stale 값으로 응답하고 백그라운드에서 갱신
+            # (circuit open이면 갱신하지 않고 stale 값만 사용)
+            depth = max(len(entry.candidates), max_results)
+            self._cache.schedule_refresh_sync(
+                cache_key,
+                lambda: self._inflight.do_sync(
+                    cache_key, lambda: self._fetch(keyword, depth, cache_key, _EMPTY_ENTRY)
+                ),
+            )
+        while not entry.satisfies(max_results):
+            # API 호출 (같은 cache_key의 동시 miss는 한 번만 upstream 호출)
+            entry = self._inflight.do_sync(cache_key, partial(self._fetch, keyword, max_results, cache_key, entry))
+        return entry.candidates[:max_results]
+
+    async def asearch(self, keyword: str, *, max_results: int | None = None) -> Sequence[AddressCandidate]:
+        """
+        search()의 비동기 버전. async_http가 없으면 sync search를 스레드에서 실행합니다.
+        """
+        if self._async_http is None:
+            return await asyncio.to_thread(self.search, keyword, max_results=max_results)
+
+        keyword, max_results, cache_key = self._prepare(keyword, max_results)
+
+        entry, stale = self._lookup(cache_key, keyword)
+        if stale and not self._breaker.is_open:
+            depth = max(len(entry.candidates), max_results)
+            self._cache.schedule_refresh(
+                cache_key,
+                lambda: self._inflight.do(
+                    cache_key, lambda: self._afetch(keyword, depth, cache_key, _EMPTY_ENTRY)
+                ),
+            )
+        while not entry.satisfies(max_results):
+            entry = await self._inflight.do(cache_key, partial(self._afetch, keyword, max_results, cache_key, entry))
+        return entry.candidates[:max_results]
+
+    def _lookup(self, cache_key: str, keyword: str) -> tuple[_SearchEntry, bool]:
+        """(entry, stale). 캐시에 없으면 빈 엔트리."""
+        cached, stale = self._cache.lookup(cache_key)
+        if isinstance(cached, _SearchEntry):
+            log.debug("Cache hit for keyword: %s (stale=%s)", keyword, stale)
+            note_cache("search", "stale" if stale else "hit")
+            if stale:
+                note_stale("search")
+            return cached, stale
+        if self._cache.is_negative(cache_key):
+            log.debug("Negative cache hit for keyword: %s", keyword)
+            note_cache("search", "negative")
+            return _SearchEntry(candidates=(), pages=0, exhausted=True), False
+        note_cache("search", "miss")
+        return _EMPTY_ENTRY, False
+
+    def _fetch(
+        self, keyword: str, max_results: int, cache_key: str, base: _SearchEntry
+    ) -> _SearchEntry:
+        """
+        base 이후 페이지만 이어서 조회해 max_results를 채웁니다.
+        totalCount를 모르면 1페이지를 먼저 받고, 나머지 필요한 페이지는 동시에 조회해 순서대로 합칩니다.
+        """
+        entry = self._resumable(base, max_results)
+        page_size = entry.page_size or self._page_size(max_results)
+
+        if entry.total_count is None:
+            entry = entry.with_pages([self._get_page(keyword, 1, page_size)], page_size)
+            if entry.satisfies(max_results):
+                return self._store(cache_key, entry)
+
+        pages = entry.next_pages(max_results)
+        if len(pages) == 1:
+            fetched = [self._get_page(keyword, pages[0], page_size)]
+        else:
+            # 요청 trace(contextvars)가 워커 스레드에서도 보이도록 페이지마다 context 복사
+            pool = self._page_pool()
+            futures = [
+                pool.submit(contextvars.copy_context().run, self._get_page, keyword, p, page_size) for p in pages
+            ]
+            fetched = [f.result() for f in futures]
+        return self._store(cache_key, entry.with_pages(fetched, page_size))
+
+    async def _afetch(
+        self, keyword: str, max_results: int, cache_key: str, base: _SearchEntry
+    ) -> _SearchEntry:
+        entry = self._resumable(base, max_results)
+        page_size = entry.page_size or self._page_size(max_results)
+
+        if entry.total_count is None:
+            entry = entry.with_pages([await self._aget_page(keyword, 1, page_size)], page_size)
+            if entry.satisfies(max_results):
+                return self._store(cache_key, entry)
+
+        fetched = await gather_limited(
+            (self._aget_page(keyword, p, page_size) for p in entry.next_pages(max_results)),
+            limit=PAGE_FETCH_CONCURRENCY,
+        )
+        return self._store(cache_key, entry.with_pages(fetched, page_size))
+
+    def _get_page(self, keyword: str, page: int, page_size: int) -> _Page:
+        try:
+            params = self._params(keyword, page, page_size)
+            with span("search.fetch"):
+                response = self._breaker.call_sync(lambda: self._http.get_json(self._api_url, params=params))
+        except UpstreamError as e:
+            log.error("Juso API error: %s", e)
+            raise
+        return self._parse_page(response)
+
+    async def _aget_page(self, keyword: str, page: int, page_size: int) -> _Page:
+        http = self._async_http
+        assert http is not None
+        try:
+            params = self._params(keyword, page, page_size)
+            with span("search.fetch"):
+                response = await self._breaker.call(lambda: http.get_json(self._api_url, params=params))
+        except UpstreamError as e:
+            log.error("Juso API error: %s", e)
+            raise
+        return self._parse_page(response)
+
+    def _page_pool(self) -> ThreadPoolExecutor:
+        # sync 경로의 페이지 동시 조회용 (처음 필요할 때 생성)
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=PAGE_FETCH_CONCURRENCY, thread_name_prefix="juso-page")
+            return self._pool
+
+    def _page_size(self, max_results: int) -> int:
+        """필요한 만큼만 요청 (max_candidates=1이면 1건), 상한은 count_per_page."""
+        return max(1, min(max_results, self._count_per_page, MAX_COUNT_PER_PAGE))
+
+    def _resumable(self, base: _SearchEntry, max_results: int) -> _SearchEntry:
         """
+        base에 이어서 받을 수 있으면 base, 아니면 빈 엔트리(처음부터).
+        작은 페이지로 받아둔 결과(예: 1건)에 이어 붙이면 요청 수가 늘어나므로 더 큰 페이지로 새로 받음.
+        """
+        if base.pages and base.page_size >= self._page_size(max_results):
+            return base
+        return _EMPTY_ENTRY
+
+    def _store(self, cache_key: str, entry: _SearchEntry) -> _SearchEntry:
+        # 캐시 저장: keyword당 1개 엔트리 (지금까지 받은 페이지 전체)
+        # (Juso 에러코드는 _parse_page에서 UpstreamError로 올라가므로 여기까지 오면 정상 응답)
+        if entry.candidates:
+            self._cache.set(cache_key, entry)
+        elif entry.exhausted:
+            # stale 갱신에서 0건이 된 경우(주소 폐지 등) 이전 결과가 먼저 조회되지 않도록 지움
+            self._cache.delete(cache_key)
+            self._cache.set_negative(cache_key)
+        return entry
+
+    def _prepare(self, keyword: str, max_results: int | None) -> tuple[str, int, str]:
         keyword = normalize_query(keyword)
         if not keyword:
             raise ValidationError("검색어가 비어있습니다.")
 
         max_results = max_results or self._count_per_page
-        max_results = min(max_results, self._count_per_page)
 
-        # 캐시 키 생성
-        cache_key = f"juso:{keyword}:{max_results}:{self._first_sort}"
+        # 캐시 키 생성 (max_results와 무관: 작은 N은 큰 N 결과를 잘라서 사용)
+        # v2: AddressCandidate가 slots dataclass로 바뀌어 예전 디스크 L2(pickle) 엔트리와 호환되지 않음
+        cache_key = f"juso:v2:{keyword}:{self._first_sort}"
+        return keyword, max_results, cache_key
 
-        # 캐시 확인
-        cached = self._cache.get(cache_key)
-        if cached is not None:
-            log.debug("Cache hit for keyword: %s", keyword)
-            return list(cached) if isinstance(cached, (list, tuple)) else []
+    def keyword_from_cache_key(self, key: str) -> str | None:
+        """_prepare의 cache_key 역변환 (캐시 warm-up용). 형식이나 정렬 설정이 다르면 None."""
+        prefix = "juso:v2:"
+        if not key.startswith(prefix):
+            return None
+        keyword, _, first_sort = key[len(prefix):].rpartition(":")
+        if not keyword or first_sort != self._first_sort:
+            return None
+        return keyword
 
-        # API 호출
-        candidates: list[AddressCandidate] = []
-        current_page = 1
-        total_count = 0
-
-        while len(candidates) < max_results:
-            params = {
-                "confmKey": self._confm_key,
-                "keyword": keyword,
-                "currentPage": str(current_page),
-                "countPerPage": str(self._count_per_page),
-                "resultType": "json",
-                "firstSort": self._first_sort,
-                "addInfoYn": self._add_info_yn,
-            }
-
-            try:
-                response = self._http.get_json(JUSO_API_URL, params=params)
-            except UpstreamError as e:
-                log.error("Juso API error: %s", e)
-                raise
-
-            # 응답 파싱
-            results = response.get("results", {})
-            common = results.get("common", {})
-            error_code = common.get("errorCode", "0")
-
-            if error_code != "0":
-                error_message = common.get("errorMessage", "Unknown error")
-                log.error("Juso API error: %s - %s", error_code, error_message)
-                raise UpstreamError(f"Juso API error {error_code}: {error_message}")
-
-            juso_list = results.get("juso", [])
-            if not juso_list:
-                break
+    def _params(self, keyword: str, current_page: int, count_per_page: int) -> dict[str, Any]:
+        return {
+            "confmKey": self._confm_key,
+            "keyword": keyword,
+            "currentPage": str(current_page),
+            "countPerPage": str(count_per_page),
+            "resultType": "json",
+            "firstSort": self._first_sort,
+            "addInfoYn": self._add_info_yn,
+        }
+
+    def _parse_page(self, response: dict[str, Any]) -> _Page:
+        """한 페이지 응답을 파싱합니다."""
+        # 응답 파싱
+        results = response.get("results", {})
+        common = results.get("common", {})
+        error_code = common.get("errorCode", "0")
 
-            total_count = int(common.get("totalCount", "0"))
-
-            def _pick_str(v: Any) -> str | None:
-                if v is None:
-                    return None
-                s = str(v).strip()
-                return s if s else None
-
-            for juso_item in juso_list:
-                if len(candidates) >= max_results:
-                    break
-
-                road_addr = _pick_str(juso_item.get("roadAddr")) or ""
-                jibun_addr = _pick_str(juso_item.get("jibunAddr"))
-                zip_no = normalize_postcode(_pick_str(juso_item.get("zipNo")) or "")
-                bd_nm = _pick_str(juso_item.get("bdNm"))
-
-                if not road_addr or not zip_no:
-                    continue
-
-                candidate = AddressCandidate(
-                    road_addr=road_addr,
-                    jibun_addr=jibun_addr,
-                    postcode5=zip_no,
-                    building_name=bd_nm,
-                    confidence=1.0,
-                    # detail keys
-                    admCd=_pick_str(juso_item.get("admCd")),
-                    rnMgtSn=_pick_str(juso_item.get("rnMgtSn")),
-                    udrtYn=_pick_str(juso_item.get("udrtYn")),
-                    buldMnnm=_pick_str(juso_item.get("buldMnnm")),
-                    buldSlno=_pick_str(juso_item.get("buldSlno")),
-                    bdMgtSn=_pick_str(juso_item.get("bdMgtSn")),
-                    # optional
-                    engAddr=_pick_str(juso_item.get("engAddr")),
-                )
+        if error_code != "0":
+            error_message = common.get("errorMessage", "Unknown error")
+            log.error("Juso API error: %s - %s", error_code, error_message)
+            raise UpstreamError(f"Juso API error {error_code}: {error_message}")
+
+        juso_list = results.get("juso") or []
+        total_count = int(common.get("totalCount") or "0")
+
+        candidates: list[AddressCandidate] = []
+        for juso_item in juso_list:
+            candidate = _to_candidate(juso_item)
+            if candidate is not None:
                 candidates.append(candidate)
 
-            # 더 이상 결과가 없으면 종료
-            if len(juso_list) < self._count_per_page or len(candidates) >= total_count:
+        return _Page(candidates=candidates, items=len(juso_list), total_count=total_count)
+
+
+@dataclass(frozen=True, slots=True)
+class _Page:
+    candidates: list[AddressCandidate]
+    items: int  # 응답 juso[] 개수 (후보로 변환되지 않은 항목 포함)
+    total_count: int
+
+
+@dataclass(frozen=True, slots=True)
+class _SearchEntry:
+    """
+    keyword 단위 캐시 엔트리.
+    - candidates: 1..pages 페이지(페이지당 page_size건)에서 받은 후보 전체
+    - exhausted: upstream에 더 받을 결과가 없음
+    - total_count: 첫 페이지 응답의 totalCount (아직 모르면 None)
+    """
+
+    candidates: tuple[AddressCandidate, ...]
+    pages: int
+    exhausted: bool
+    page_size: int = 0
+    total_count: int | None = None
+
+    def satisfies(self, max_results: int) -> bool:
+        return self.exhausted or len(self.candidates) >= max_results
+
+    def next_pages(self, max_results: int) -> list[int]:
+        """max_results를 채우는 데 필요한 나머지 페이지 번호 (totalCount 범위 안에서, 최소 1개)."""
+        assert self.page_size and self.total_count is not None
+        last = max(-(-max_results // self.page_size), self.pages + 1)
+        last = min(last, -(-self.total_count // self.page_size))
+        return list(range(self.pages + 1, last + 1))
+
+    def with_pages(self, fetched: list[_Page], page_size: int) -> _SearchEntry:
+        """이어지는 페이지들을 순서대로 합친 새 엔트리."""
+        candidates = list(self.candidates)
+        pages = self.pages
+        total_count = self.total_count
+        exhausted = False
+        for page in fetched:
+            pages += 1
+            candidates.extend(page.candidates)
+            total_count = page.total_count
+            if page.items < page_size or pages * page_size >= total_count:
+                exhausted = True
                 break
+        return _SearchEntry(tuple(candidates), pages, exhausted, page_size, total_count)
+
+
+_EMPTY_ENTRY = _SearchEntry(candidates=(), pages=0, exhausted=False)
+
+
+def _pick_str(v: Any) -> str | None:
+    if v is None:
+        return None
+    s = str(v).strip()
+    return s if s else None
+
+
+def _pick_code(v: Any) -> str | None:
+    # 법정동/도로명 코드, 우편번호, 건물번호처럼 후보 간에 반복되는 값은 intern해 캐시 엔트리끼리 공유
+    s = _pick_str(v)
+    return sys.intern(s) if s is not None else None
 
-            current_page += 1
 
-        # 캐시 저장
-        if candidates:
-            self._cache.set(cache_key, candidates)
+def _to_candidate(juso_item: dict[str, Any]) -> AddressCandidate | None:
+    road_addr = _pick_str(juso_item.get("roadAddr")) or ""
+    jibun_addr = _pick_str(juso_item.get("jibunAddr"))
+    zip_no = normalize_postcode(_pick_str(juso_item.get("zipNo")) or "")
+    bd_nm = _pick_str(juso_item.get("bdNm"))
 
-        return candidates
+    if not road_addr or not zip_no:
+        return None
 
+    return AddressCandidate(
+        road_addr=road_addr,
+        jibun_addr=jibun_addr,
+        postcode5=sys.intern(zip_no),
+        building_name=bd_nm,
+        confidence=1.0,
+        # detail keys
+        admCd=_pick_code(juso_item.get("admCd")),
+        rnMgtSn=_pick_code(juso_item.get("rnMgtSn")),
+        udrtYn=_pick_code(juso_item.get("udrtYn")),
+        buldMnnm=_pick_code(juso_item.get("buldMnnm")),
+        buldSlno=_pick_code(juso_item.get("buldSlno")),
+        bdMgtSn=_pick_str(juso_item.get("bdMgtSn")),
+        # optional
+        engAddr=_pick_str(juso_item.get("engAddr")),
+    )
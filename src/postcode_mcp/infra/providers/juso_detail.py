@@ -1,7 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any, cast
+
+from postcode_mcp.core.trace import note_cache, note_stale, span
+from postcode_mcp.infra.circuit import CircuitBreaker
+from postcode_mcp.infra.singleflight import SingleFlight
+
+if TYPE_CHECKING:
+    from postcode_mcp.infra.cache import Cache
 
 DETAIL_API_URL = "https://business.juso.go.kr/addrlink/addrDetailApi.do"
 
@@ -25,12 +34,135 @@ class JusoDetailProvider:
     - optional: searchType(dong|floorho), dongNm
     """
 
-    def __init__(self, http: Any, confm_key: str, timeout_seconds: float | None = None):
+    def __init__(
+        self,
+        http: Any,
+        confm_key: str,
+        timeout_seconds: float | None = None,
+        async_http: Any | None = None,
+        singleflight: SingleFlight | None = None,
+        cache: Cache | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        api_url: str = DETAIL_API_URL,
+    ):
         self._http = http
+        self._async_http = async_http
+        self._api_url = api_url
         self._confm_key = confm_key
         self._timeout_seconds = timeout_seconds
+        self._inflight = singleflight or SingleFlight()
+        # 상세주소는 건물 단위로 거의 바뀌지 않으므로 캐시 (circuit open 시 stale 응답용이기도 함)
+        self._cache = cache
+        self._breaker = circuit_breaker or CircuitBreaker("detail")
+
+    @property
+    def singleflight(self) -> SingleFlight:
+        return self._inflight
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        return self._breaker
+
+    @staticmethod
+    def cache_key(req: DetailAddrRequest) -> str:
+        return (
+            f"juso:detail:{req.admCd}:{req.rnMgtSn}:{req.udrtYn}:{req.buldMnnm}:{req.buldSlno}"
+            f":{req.searchType}:{req.dongNm or ''}"
+        )
+
+    @staticmethod
+    def request_from_cache_key(key: str) -> DetailAddrRequest | None:
+        """cache_key의 역변환 (캐시 warm-up용). 형식이 다르면 None."""
+        if not key.startswith("juso:detail:"):
+            return None
+        parts = key[len("juso:detail:"):].split(":")
+        if len(parts) != 7:
+            return None
+        adm_cd, rn_mgt_sn, udrt_yn, buld_mnnm, buld_slno, search_type, dong_nm = parts
+        return DetailAddrRequest(
+            admCd=adm_cd,
+            rnMgtSn=rn_mgt_sn,
+            udrtYn=udrt_yn,
+            buldMnnm=buld_mnnm,
+            buldSlno=buld_slno,
+            searchType=search_type,
+            dongNm=dong_nm or None,
+        )
 
     def search(self, req: DetailAddrRequest) -> dict[str, Any]:
+        key = self.cache_key(req)
+        cached = self._lookup(key)
+        if cached is not None:
+            if cached[1] and self._cache is not None and not self._breaker.is_open:
+                # stale-while-revalidate
+                self._cache.schedule_refresh_sync(key, lambda: self._inflight.do_sync(key, lambda: self._fetch(req)))
+            return cached[0]
+        return self._inflight.do_sync(key, lambda: self._fetch(req))
+
+    async def asearch(self, req: DetailAddrRequest) -> dict[str, Any]:
+        """
+        search()의 비동기 버전. async_http가 없으면 sync search를 스레드에서 실행합니다.
+        """
+        if self._async_http is None:
+            return await asyncio.to_thread(self.search, req)
+
+        key = self.cache_key(req)
+        cached = self._lookup(key)
+        if cached is not None:
+            if cached[1] and self._cache is not None and not self._breaker.is_open:
+                self._cache.schedule_refresh(key, lambda: self._inflight.do(key, lambda: self._afetch(req)))
+            return cached[0]
+        return await self._inflight.do(key, lambda: self._afetch(req))
+
+    def _lookup(self, key: str) -> tuple[dict[str, Any], bool] | None:
+        """(payload, stale) 또는 None(캐시 없음/miss)."""
+        if self._cache is None:
+            return None
+        cached, stale = self._cache.lookup(key)
+        if cached is None:
+            note_cache("detail", "miss")
+            return None
+        note_cache("detail", "stale" if stale else "hit")
+        if stale:
+            note_stale("detail")
+        return cast(dict[str, Any], cached), stale
+
+    def _fetch(self, req: DetailAddrRequest) -> dict[str, Any]:
+        params = self._params(req)
+
+        # HttpClient에 get_json이 있으면 사용, 없으면 requests-like 인터페이스를 시도
+        with span("detail.fetch"):
+            if hasattr(self._http, "get_json"):
+                payload: dict[str, Any] = self._breaker.call_sync(
+                    lambda: self._http.get_json(self._api_url, params=params)
+                )
+            elif hasattr(self._http, "get"):
+                r = self._http.get(self._api_url, params=params, timeout=self._timeout_seconds)
+                payload = r.json()
+            else:
+                raise RuntimeError("Http client must provide get_json(url, params=...) or get(url, params=...).")
+
+        self._store(self.cache_key(req), payload)
+        return payload
+
+    async def _afetch(self, req: DetailAddrRequest) -> dict[str, Any]:
+        http = self._async_http
+        assert http is not None
+        params = self._params(req)
+        with span("detail.fetch"):
+            payload: dict[str, Any] = await self._breaker.call(lambda: http.get_json(self._api_url, params=params))
+        self._store(self.cache_key(req), payload)
+        return payload
+
+    def _store(self, key: str, payload: dict[str, Any]) -> None:
+        # 정상 응답(errorCode=0)만 캐시. 상세주소가 없는 건물(0건)도 정상 결과이므로 그대로 캐시
+        if self._cache is None:
+            return
+        common, _ = self.extract_items(payload)
+        if str(common.get("errorCode", "0")) == "0":
+            self._cache.set(key, payload)
+
+    def _params(self, req: DetailAddrRequest) -> dict[str, Any]:
         params: dict[str, Any] = {
             "confmKey": self._confm_key,
             "resultType": req.resultType,
@@ -43,19 +175,10 @@ class JusoDetailProvider:
         }
         if req.dongNm:
             params["dongNm"] = req.dongNm
-
-        # HttpClient에 get_json이 있으면 사용, 없으면 requests-like 인터페이스를 시도
-        if hasattr(self._http, "get_json"):
-            return self._http.get_json(DETAIL_API_URL, params=params)
-
-        if hasattr(self._http, "get"):
-            r = self._http.get(DETAIL_API_URL, params=params, timeout=self._timeout_seconds)
-            return r.json()
-
-        raise RuntimeError("Http client must provide get_json(url, params=...) or get(url, params=...).")
+        return params
 
     @staticmethod
-    def extract_items(payload: dict[str, Any]) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    def extract_items(payload: Mapping[str, Any]) -> tuple[dict[str, Any], list[dict[str, Any]]]:
         """
         returns: (common, items)
         payload shape (json):
@@ -1,10 +1,27 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any, cast
 
+from postcode_mcp.core.trace import note_cache, note_stale, span
+from postcode_mcp.infra.circuit import CircuitBreaker
+from postcode_mcp.infra.compact import compact, plain
+from postcode_mcp.infra.singleflight import SingleFlight
+
+if TYPE_CHECKING:
+    from postcode_mcp.infra.cache import Cache
 
 ROAD_API_URL = "https://business.juso.go.kr/addrlink/addrEngApi.do"
+# 캐시에 넣을 때 intern하는 필드 (시도/시군구/읍면동/도로명, 코드 등 항목 간에 반복되는 값)
+_INTERN_FIELDS = frozenset(
+    {
+        "siNm", "sggNm", "emdNm", "liNm", "rn", "emdNo", "zipNo", "admCd", "rnMgtSn", "bdKdcd",
+        "udrtYn", "mtYn", "buldMnnm", "buldSlno", "lnbrMnnm", "lnbrSlno",
+        "errorCode", "errorMessage", "totalCount", "currentPage", "countPerPage",
+    }
+)
 
 
 @dataclass(frozen=True)
@@ -32,9 +49,13 @@ class JusoEnglishProvider:
         add_info_yn: str,
         timeout_seconds: float | None = None,
         api_url: str = ROAD_API_URL,
-        cache: Any | None = None,
+        cache: Cache | None = None,
+        async_http: Any | None = None,
+        singleflight: SingleFlight | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
     ):
         self._http = http
+        self._async_http = async_http
         self._confm_key = confm_key
         self._count_per_page = count_per_page
         self._first_sort = first_sort
@@ -42,20 +63,117 @@ class JusoEnglishProvider:
         self._timeout_seconds = timeout_seconds
         self._api_url = api_url
         self._cache = cache
-        
-    def search(self, req: EngAddrRequest) -> dict[str, Any]:
-        keyword = (req.keyword or "").strip()
-        current_page = req.current_page
-        count_per_page = req.count_per_page or self._count_per_page
+        self._inflight = singleflight or SingleFlight()
+        self._breaker = circuit_breaker or CircuitBreaker("english")
+
+    @property
+    def singleflight(self) -> SingleFlight:
+        return self._inflight
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        return self._breaker
+
+    def search(self, req: EngAddrRequest) -> Mapping[str, Any]:
+        keyword, cache_key, params = self._prepare(req)
         if not keyword:
-            return {"results": {"common": {"errorCode": "EMPTY_KEYWORD", "errorMessage": "keyword is empty"}, "juso": []}}
+            return _empty_keyword_payload()
 
-        cache_key = f"juso:road:{keyword}:{current_page}:{count_per_page}:{self._first_sort}:{self._add_info_yn}"
         if self._cache is not None:
-            cached = self._cache.get(cache_key)
+            cached, stale = self._cache.lookup(cache_key)
+            note_cache("english", _cache_outcome(cached, stale))
             if cached is not None:
-                return cached
+                if stale:
+                    # stale-while-revalidate: stale 값으로 응답하고 백그라운드에서 갱신 (circuit open이면 stale 값만)
+                    note_stale("english")
+                if stale and not self._breaker.is_open:
+                    self._cache.schedule_refresh_sync(
+                        cache_key,
+                        lambda: self._inflight.do_sync(cache_key, lambda: self._fetch(cache_key, params)),
+                    )
+                return cast(Mapping[str, Any], cached)
+            if self._cache.is_negative(cache_key):
+                note_cache("english", "negative")
+                return _no_result_payload()
+
+        # 같은 cache_key의 동시 miss는 한 번만 upstream 호출
+        return self._inflight.do_sync(cache_key, lambda: self._fetch(cache_key, params))
+
+    def _fetch(self, cache_key: str, params: dict[str, Any]) -> Mapping[str, Any]:
+        api_url = self._api_url or ROAD_API_URL
+        with span("english.fetch"):
+            if hasattr(self._http, "get_json"):
+                payload = self._breaker.call_sync(lambda: self._http.get_json(api_url, params=params))
+            elif hasattr(self._http, "get"):
+                r = self._http.get(api_url, params=params, timeout=10)
+                payload = r.json()
+            else:
+                raise RuntimeError("Http client must provide get_json(url, params=...) or get(url, params=...).")
+
+        return self._store(cache_key, payload)
+
+    async def asearch(self, req: EngAddrRequest) -> Mapping[str, Any]:
+        """
+        search()의 비동기 버전. async_http가 없으면 sync search를 스레드에서 실행합니다.
+        """
+        if self._async_http is None:
+            return await asyncio.to_thread(self.search, req)
+
+        keyword, cache_key, params = self._prepare(req)
+        if not keyword:
+            return _empty_keyword_payload()
+
+        if self._cache is not None:
+            cached, stale = self._cache.lookup(cache_key)
+            note_cache("english", _cache_outcome(cached, stale))
+            if cached is not None:
+                if stale:
+                    note_stale("english")
+                if stale and not self._breaker.is_open:
+                    self._cache.schedule_refresh(
+                        cache_key,
+                        lambda: self._inflight.do(cache_key, lambda: self._afetch(cache_key, params)),
+                    )
+                return cast(Mapping[str, Any], cached)
+            if self._cache.is_negative(cache_key):
+                note_cache("english", "negative")
+                return _no_result_payload()
+
+        return await self._inflight.do(cache_key, lambda: self._afetch(cache_key, params))
+
+    async def _afetch(self, cache_key: str, params: dict[str, Any]) -> Mapping[str, Any]:
+        http = self._async_http
+        assert http is not None
+        with span("english.fetch"):
+            payload = await self._breaker.call(lambda: http.get_json(self._api_url or ROAD_API_URL, params=params))
+
+        return self._store(cache_key, payload)
 
+    def _store(self, cache_key: str, payload: dict[str, Any]) -> Mapping[str, Any]:
+        """
+        정상 응답만 캐시: 결과가 있으면 일반 캐시, 0건이면 negative 캐시.
+        errorCode가 0이 아닌 응답(키 오류/일시 장애 등)은 캐시하지 않음.
+        캐시에는 원본 dict 대신 compact(Record/tuple, 반복 문자열 intern) 형태로 넣고, 캐시 hit과 같은 형태를 반환.
+        """
+        common, items = self.extract_items(payload)
+        if str(common.get("errorCode", "0")) != "0":
+            return payload
+        stored: Mapping[str, Any] = compact(payload, intern_keys=_INTERN_FIELDS)
+        if self._cache is not None:
+            if items:
+                self._cache.set(cache_key, stored)
+            else:
+                # stale 갱신에서 0건이 된 경우 이전 결과가 먼저 조회되지 않도록 지움
+                self._cache.delete(cache_key)
+                self._cache.set_negative(cache_key)
+        return stored
+
+    def _prepare(self, req: EngAddrRequest) -> tuple[str, str, dict[str, Any]]:
+        keyword = (req.keyword or "").strip()
+        current_page = req.current_page
+        count_per_page = req.count_per_page or self._count_per_page
+
+        cache_key = f"juso:road:{keyword}:{current_page}:{count_per_page}:{self._first_sort}:{self._add_info_yn}"
         params: dict[str, Any] = {
             "confmKey": self._confm_key,
             "keyword": keyword,
@@ -65,32 +183,32 @@ class JusoEnglishProvider:
             "firstSort": self._first_sort,
             "addInfoYn": self._add_info_yn,
         }
+        return keyword, cache_key, params
 
-        api_url = self._api_url or ROAD_API_URL
-        if hasattr(self._http, "get_json"):
-            payload = self._http.get_json(api_url, params=params)
-        elif hasattr(self._http, "get"):
-            r = self._http.get(api_url, params=params, timeout=10)
-            payload = r.json()
-        else:
-            raise RuntimeError("Http client must provide get_json(url, params=...) or get(url, params=...).")
-
-        if self._cache is not None:
-            self._cache.set(cache_key, payload)
-
-        return payload
+    def request_from_cache_key(self, key: str) -> EngAddrRequest | None:
+        """_prepare의 cache_key 역변환 (캐시 warm-up용). 형식이나 정렬/추가정보 설정이 다르면 None."""
+        if not key.startswith("juso:road:"):
+            return None
+        parts = key[len("juso:road:"):].rsplit(":", 4)
+        if len(parts) != 5 or (parts[3], parts[4]) != (self._first_sort, self._add_info_yn):
+            return None
+        keyword, current_page, count_per_page = parts[0], parts[1], parts[2]
+        if not (keyword and current_page.isdigit() and count_per_page.isdigit()):
+            return None
+        return EngAddrRequest(keyword=keyword, current_page=int(current_page), count_per_page=int(count_per_page))
 
     @staticmethod
-    def extract_items(payload: dict[str, Any]) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    def extract_items(payload: Mapping[str, Any]) -> tuple[dict[str, Any], list[Mapping[str, Any]]]:
+        """(common, juso[]). payload는 원본 dict 또는 캐시의 compact 형태 (common은 응답에 넣도록 dict로 반환)."""
         results = payload.get("results") or {}
-        common = results.get("common") or {}
+        common = plain(results.get("common") or {})
         items = results.get("juso") or []
-        if not isinstance(items, list):
+        if not isinstance(items, (list, tuple)):
             items = []
-        return common, items
+        return common, list(items)
 
     @staticmethod
-    def normalize_item(item: dict[str, Any]) -> dict[str, Any]:
+    def normalize_item(item: Mapping[str, Any]) -> dict[str, Any]:
         """
         우리 서비스 표준 출력 + 상세주소용 코드 필드 보존
         """
@@ -131,6 +249,20 @@ class JusoEnglishProvider:
             "buldSlno": buldSlno,
             "bdMgtSn": bdMgtSn,
 
-            # 원본 보관(디버그/확장용)
+            # 원본 보관(디버그/확장용). 캐시의 Record를 복사하지 않고 그대로 두고, 응답으로 내보낼 때 plain()으로 dict 변환
             "_raw": item,
-        }
\ No newline at end of file
+        }
+
+
+def _cache_outcome(cached: object, stale: bool) -> str:
+    if cached is None:
+        return "miss"
+    return "stale" if stale else "hit"
+
+
+def _empty_keyword_payload() -> dict[str, Any]:
+    return {"results": {"common": {"errorCode": "EMPTY_KEYWORD", "errorMessage": "keyword is empty"}, "juso": []}}
+
+
+def _no_result_payload() -> dict[str, Any]:
+    return {"results": {"common": {"errorCode": "0", "errorMessage": "정상", "totalCount": "0"}, "juso": []}}
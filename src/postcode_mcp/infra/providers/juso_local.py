@@ -0,0 +1,484 @@
+from __future__ import annotations
+
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Any
+
+from postcode_mcp.core.errors import ValidationError
+from postcode_mcp.core.models import AddressCandidate
+from postcode_mcp.core.text import normalize_postcode, normalize_query
+from postcode_mcp.infra.providers.juso import JusoProvider
+from postcode_mcp.infra.providers.juso_detail import DetailAddrRequest, JusoDetailProvider
+from postcode_mcp.infra.providers.juso_eng import EngAddrRequest, JusoEnglishProvider
+
+log = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# 행안부 도로명주소 DB 전체분 파일 형식 ('|' 구분, cp949)
+# 2020.10 이후 배포 형식 기준 컬럼 위치(0-based). 배포 형식이 바뀌면 여기만 고치면 됨.
+# ---------------------------------------------------------------------------
+
+# 도로명주소 한글 전체분 (rnaddrkor_*.txt)
+ROAD_COLUMNS = {
+    "mgmt_no": 0,       # 도로명주소관리번호
+    "adm_cd": 1,        # 법정동코드
+    "sido": 2,
+    "sigungu": 3,
+    "emd": 4,           # 법정읍면동명
+    "ri": 5,            # 법정리명
+    "mountain": 6,      # 산여부 (1=산)
+    "jibun_main": 7,
+    "jibun_sub": 8,
+    "rn_mgt_sn": 9,     # 도로명코드
+    "road_nm": 10,
+    "udrt_yn": 11,      # 지하여부
+    "buld_mnnm": 12,    # 건물본번
+    "buld_slno": 13,    # 건물부번
+    "zip_no": 16,       # 기초구역번호(우편번호)
+    "apt_yn": 19,       # 공동주택구분 (1=공동주택)
+    "bd_nm_ledger": 21,  # 건축물대장 건물명
+    "bd_nm": 22,        # 시군구용 건물명
+}
+
+# 도로명주소 영문 전체분 (rneng_*.txt)
+ENG_COLUMNS = {
+    "mgmt_no": 0,
+    "sido": 2,
+    "sigungu": 3,
+    "emd": 4,
+    "ri": 5,
+    "mountain": 6,
+    "jibun_main": 7,
+    "jibun_sub": 8,
+    "road_nm": 10,
+    "udrt_yn": 11,
+    "buld_mnnm": 12,
+    "buld_slno": 13,
+}
+
+# 상세주소 DB (상세주소 동/층/호)
+DETAIL_COLUMNS = {
+    "adm_cd": 1,
+    "rn_mgt_sn": 9,
+    "udrt_yn": 11,
+    "buld_mnnm": 12,
+    "buld_slno": 13,
+    "dong_nm": 14,
+    "floor_nm": 15,
+    "ho_nm": 16,
+}
+
+# 카카오 등에서 쓰는 시도 약칭 → 주소 DB 표기
+SIDO_ALIASES = {
+    "서울": "서울특별시",
+    "서울시": "서울특별시",
+    "부산": "부산광역시",
+    "대구": "대구광역시",
+    "인천": "인천광역시",
+    "광주": "광주광역시",
+    "대전": "대전광역시",
+    "울산": "울산광역시",
+    "세종": "세종특별자치시",
+    "경기": "경기도",
+    "강원": "강원특별자치도",
+    "강원도": "강원특별자치도",
+    "충북": "충청북도",
+    "충남": "충청남도",
+    "전북": "전북특별자치도",
+    "전라북도": "전북특별자치도",
+    "전남": "전라남도",
+    "경북": "경상북도",
+    "경남": "경상남도",
+    "제주": "제주특별자치도",
+    "제주도": "제주특별자치도",
+}
+
+_WS = re.compile(r"\s+")
+_TRAILING_REF = re.compile(r"\s*\([^)]*\)\s*$")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS road (
+    mgmt_no TEXT PRIMARY KEY,
+    adm_cd TEXT, rn_mgt_sn TEXT, udrt_yn TEXT, buld_mnnm TEXT, buld_slno TEXT,
+    road_addr TEXT NOT NULL, jibun_addr TEXT, zip_no TEXT NOT NULL, bd_nm TEXT
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS road_key (
+    key TEXT NOT NULL,
+    mgmt_no TEXT NOT NULL,
+    PRIMARY KEY (key, mgmt_no)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS road_key_mgmt_no ON road_key (mgmt_no);
+CREATE TABLE IF NOT EXISTS eng (
+    mgmt_no TEXT PRIMARY KEY,
+    road_addr TEXT NOT NULL,
+    jibun_addr TEXT
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS detail (
+    bkey TEXT NOT NULL,
+    dong_nm TEXT NOT NULL,
+    floor_nm TEXT NOT NULL,
+    ho_nm TEXT NOT NULL,
+    PRIMARY KEY (bkey, dong_nm, floor_nm, ho_nm)
+) WITHOUT ROWID;
+"""
+
+
+def _compact(s: str) -> str:
+    return _WS.sub("", s)
+
+
+def query_key(keyword: str) -> str:
+    """검색어 → 인덱스 key (참고항목 괄호 제거, 시도 약칭 확장, 공백 제거)."""
+    q = _TRAILING_REF.sub("", normalize_query(keyword))
+    head, _, rest = q.partition(" ")
+    head = SIDO_ALIASES.get(head, head)
+    return _compact(f"{head} {rest}")
+
+
+def _building_key(adm_cd: str, rn_mgt_sn: str, udrt_yn: str, buld_mnnm: str, buld_slno: str) -> str:
+    return f"{adm_cd}|{rn_mgt_sn}|{udrt_yn}|{buld_mnnm}|{buld_slno}"
+
+
+def _number(main: str, sub: str) -> str:
+    return main if sub in ("", "0") else f"{main}-{sub}"
+
+
+def _join(*parts: str) -> str:
+    return " ".join(p for p in parts if p)
+
+
+def _field(row: list[str], columns: dict[str, int], name: str) -> str:
+    return row[columns[name]].strip()
+
+
+def _iter_rows(path: str, encoding: str, columns: dict[str, int]) -> Iterator[list[str]]:
+    """파일을 한 줄씩 읽어 '|'로 나눈 행을 돌려줍니다 (메모리 사용량은 파일 크기와 무관)."""
+    width = max(columns.values()) + 1
+    with open(path, encoding=encoding, errors="replace", newline="") as f:
+        for line in f:
+            row = line.rstrip("\r\n").split("|")
+            if len(row) >= width:
+                yield row
+
+
+def _road_record(row: list[str]) -> tuple[tuple[str | None, ...], list[str]]:
+    """도로명주소 한글 행 → (road 테이블 값, 검색 key 목록)."""
+
+    def f(name: str) -> str:
+        return _field(row, ROAD_COLUMNS, name)
+
+    sido, sigungu, emd, ri = f("sido"), f("sigungu"), f("emd"), f("ri")
+    road_nm, udrt_yn = f("road_nm"), f("udrt_yn")
+    buld_mnnm, buld_slno = f("buld_mnnm"), f("buld_slno")
+    bd_nm = f("bd_nm") or f("bd_nm_ledger")
+
+    building_no = ("지하 " if udrt_yn == "1" else "") + _number(buld_mnnm, buld_slno)
+    road_part1 = _join(sido, sigungu, road_nm, building_no)
+
+    # 참고항목: 법정동(동/가 지역) + 공동주택 건물명
+    refs = []
+    if emd and not ri and emd.endswith(("동", "가", "로")):
+        refs.append(emd)
+    if f("apt_yn") == "1" and bd_nm:
+        refs.append(bd_nm)
+    road_addr = f"{road_part1} ({', '.join(refs)})" if refs else road_part1
+
+    jibun_no = ("산 " if f("mountain") == "1" else "") + _number(f("jibun_main"), f("jibun_sub"))
+    jibun_addr = _join(sido, sigungu, emd, ri, jibun_no)
+
+    keys = {
+        _compact(road_part1),
+        _compact(_join(sigungu, road_nm, building_no)),
+        _compact(_join(road_nm, building_no)),
+        _compact(jibun_addr),
+        _compact(_join(sigungu, emd, ri, jibun_no)),
+    }
+    if bd_nm:
+        keys.add(_compact(bd_nm))
+
+    values = (
+        f("mgmt_no"),
+        f("adm_cd"),
+        f("rn_mgt_sn"),
+        udrt_yn,
+        buld_mnnm,
+        buld_slno,
+        road_addr,
+        jibun_addr,
+        normalize_postcode(f("zip_no")),
+        bd_nm or None,
+    )
+    return values, sorted(k for k in keys if k)
+
+
+def _eng_record(row: list[str]) -> tuple[str, str, str]:
+    def f(name: str) -> str:
+        return _field(row, ENG_COLUMNS, name)
+
+    building_no = ("Jiha " if f("udrt_yn") == "1" else "") + _number(f("buld_mnnm"), f("buld_slno"))
+    road_addr = ", ".join(p for p in (f"{building_no} {f('road_nm')}", f("sigungu"), f("sido")) if p.strip())
+
+    jibun_no = ("San " if f("mountain") == "1" else "") + _number(f("jibun_main"), f("jibun_sub"))
+    jibun_addr = ", ".join(p for p in (_join(jibun_no, f("ri")), f("emd"), f("sigungu"), f("sido")) if p)
+    return f("mgmt_no"), road_addr, jibun_addr
+
+
+def _detail_record(row: list[str]) -> tuple[str, str, str, str]:
+    def f(name: str) -> str:
+        return _field(row, DETAIL_COLUMNS, name)
+
+    bkey = _building_key(f("adm_cd"), f("rn_mgt_sn"), f("udrt_yn"), f("buld_mnnm"), f("buld_slno"))
+    return bkey, f("dong_nm"), f("floor_nm"), f("ho_nm")
+
+
+def _batched(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    batch: list[Any] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def ingest(
+    db_path: str,
+    *,
+    road_files: Iterable[str] = (),
+    eng_files: Iterable[str] = (),
+    detail_files: Iterable[str] = (),
+    encoding: str = "cp949",
+    batch_size: int = 10_000,
+) -> dict[str, int]:
+    """
+    전체분 파일들을 스트리밍으로 읽어 로컬 인덱스(SQLite)를 만듭니다.
+    batch_size 행씩 끊어서 쓰므로 파일이 수 GB여도 메모리 사용량은 일정합니다.
+    같은 DB에 다시 실행하면 같은 관리번호는 덮어씀(월별 갱신분 반영).
+
+    returns: 종류별 처리 행 수
+    """
+    parent = os.path.dirname(os.path.abspath(db_path))
+    os.makedirs(parent, exist_ok=True)
+
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=OFF")
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.executescript(_SCHEMA)
+
+    counts = {"road": 0, "eng": 0, "detail": 0}
+    started = time.perf_counter()
+    try:
+        for path in road_files:
+            for batch in _batched((_road_record(r) for r in _iter_rows(path, encoding, ROAD_COLUMNS)), batch_size):
+                conn.execute("BEGIN")
+                conn.executemany(
+                    "INSERT OR REPLACE INTO road VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [values for values, _ in batch],
+                )
+                # 다시 적재할 때 도로명/건물명이 바뀐 주소의 이전 검색 key가 남지 않도록 먼저 지움
+                conn.executemany(
+                    "DELETE FROM road_key WHERE mgmt_no = ?", [(values[0],) for values, _ in batch]
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO road_key VALUES (?, ?)",
+                    [(key, values[0]) for values, keys in batch for key in keys],
+                )
+                conn.execute("COMMIT")
+                counts["road"] += len(batch)
+            log.info("Ingested road file %s (%d rows so far)", path, counts["road"])
+
+        for path in eng_files:
+            for batch in _batched((_eng_record(r) for r in _iter_rows(path, encoding, ENG_COLUMNS)), batch_size):
+                conn.execute("BEGIN")
+                conn.executemany("INSERT OR REPLACE INTO eng VALUES (?, ?, ?)", batch)
+                conn.execute("COMMIT")
+                counts["eng"] += len(batch)
+            log.info("Ingested english file %s (%d rows so far)", path, counts["eng"])
+
+        for path in detail_files:
+            for batch in _batched(
+                (_detail_record(r) for r in _iter_rows(path, encoding, DETAIL_COLUMNS)), batch_size
+            ):
+                conn.execute("BEGIN")
+                # 같은 호는 PK로 한 번만 (같은 DB에 다시 적재해도 중복되지 않음)
+                conn.executemany("INSERT OR IGNORE INTO detail VALUES (?, ?, ?, ?)", batch)
+                conn.execute("COMMIT")
+                counts["detail"] += len(batch)
+            log.info("Ingested detail file %s (%d rows so far)", path, counts["detail"])
+
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+
+    log.info("Local Juso index built in %.1fs: %s", time.perf_counter() - started, counts)
+    return counts
+
+
+class LocalJusoIndex:
+    """
+    ingest()로 만든 로컬 주소 인덱스 (읽기 전용).
+    모든 조회는 인덱스 key/PK 조회 1회라 보통 1ms 미만.
+    """
+
+    def __init__(self, path: str) -> None:
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Local Juso index not found: {path}")
+        self._conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+
+    def _query(self, sql: str, params: tuple[Any, ...]) -> list[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def search(self, keyword: str, *, limit: int, offset: int = 0) -> list[sqlite3.Row]:
+        key = query_key(keyword)
+        if not key:
+            return []
+        return self._query(
+            "SELECT r.*, e.road_addr AS eng_road_addr, e.jibun_addr AS eng_jibun_addr"
+            " FROM road_key k JOIN road r ON r.mgmt_no = k.mgmt_no"
+            " LEFT JOIN eng e ON e.mgmt_no = r.mgmt_no"
+            " WHERE k.key = ? ORDER BY r.road_addr LIMIT ? OFFSET ?",
+            (key, limit, offset),
+        )
+
+    def detail(self, req: DetailAddrRequest) -> list[dict[str, str]]:
+        bkey = _building_key(req.admCd, req.rnMgtSn, req.udrtYn, req.buldMnnm, req.buldSlno)
+        if req.searchType == "floorho":
+            rows = self._query(
+                "SELECT DISTINCT floor_nm, ho_nm FROM detail WHERE bkey = ? AND dong_nm = ?"
+                " ORDER BY floor_nm, ho_nm",
+                (bkey, req.dongNm or ""),
+            )
+            return [{"dongNm": req.dongNm or "", "floorNm": r["floor_nm"], "hoNm": r["ho_nm"]} for r in rows]
+
+        rows = self._query(
+            "SELECT DISTINCT dong_nm FROM detail WHERE bkey = ? ORDER BY dong_nm",
+            (bkey,),
+        )
+        return [{"dongNm": r["dong_nm"]} for r in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _row_to_candidate(row: sqlite3.Row) -> AddressCandidate:
+    return AddressCandidate(
+        road_addr=row["road_addr"],
+        jibun_addr=row["jibun_addr"],
+        postcode5=row["zip_no"],
+        building_name=row["bd_nm"],
+        confidence=1.0,
+        admCd=row["adm_cd"],
+        rnMgtSn=row["rn_mgt_sn"],
+        udrtYn=row["udrt_yn"],
+        buldMnnm=row["buld_mnnm"],
+        buldSlno=row["buld_slno"],
+        bdMgtSn=row["mgmt_no"],
+        engAddr=row["eng_road_addr"],
+    )
+
+
+def _ok_payload(items: list[dict[str, Any]]) -> dict[str, Any]:
+    return {
+        "results": {
+            "common": {"errorCode": "0", "errorMessage": "정상", "totalCount": str(len(items))},
+            "juso": items,
+        }
+    }
+
+
+class LocalJusoProvider(JusoProvider):
+    """
+    로컬 인덱스 우선 주소검색. 로컬에 없으면 원격 addrLinkApi로 fallback (confm_key가 있을 때).
+    """
+
+    def __init__(self, *, index: LocalJusoIndex, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._index = index
+
+    def _search_local(self, keyword: str, max_results: int | None) -> list[AddressCandidate]:
+        if not normalize_query(keyword):
+            raise ValidationError("검색어가 비어있습니다.")
+        rows = self._index.search(keyword, limit=max_results or self._count_per_page)
+        return [_row_to_candidate(r) for r in rows]
+
+    def search(self, keyword: str, *, max_results: int | None = None) -> Sequence[AddressCandidate]:
+        local = self._search_local(keyword, max_results)
+        if local or not self._confm_key:
+            return local
+        return super().search(keyword, max_results=max_results)
+
+    async def asearch(self, keyword: str, *, max_results: int | None = None) -> Sequence[AddressCandidate]:
+        local = self._search_local(keyword, max_results)
+        if local or not self._confm_key:
+            return local
+        return await super().asearch(keyword, max_results=max_results)
+
+
+class LocalJusoDetailProvider(JusoDetailProvider):
+    """로컬 상세주소(동/층/호) 조회. 로컬에 없으면 원격 addrDetailApi로 fallback."""
+
+    def __init__(self, *, index: LocalJusoIndex, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._index = index
+
+    def search(self, req: DetailAddrRequest) -> dict[str, Any]:
+        items = self._index.detail(req)
+        if items or not self._confm_key:
+            return _ok_payload(items)
+        return super().search(req)
+
+    async def asearch(self, req: DetailAddrRequest) -> dict[str, Any]:
+        items = self._index.detail(req)
+        if items or not self._confm_key:
+            return _ok_payload(items)
+        return await super().asearch(req)
+
+
+class LocalJusoEnglishProvider(JusoEnglishProvider):
+    """로컬 영문주소 조회 (한글 주소 keyword → 관리번호 → 영문). 로컬에 없으면 원격 addrEngApi로 fallback."""
+
+    def __init__(self, *, index: LocalJusoIndex, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._index = index
+
+    def _search_local(self, req: EngAddrRequest) -> list[dict[str, Any]]:
+        size = req.count_per_page or self._count_per_page
+        rows = self._index.search(req.keyword or "", limit=size, offset=(req.current_page - 1) * size)
+        return [
+            {
+                "roadAddr": r["eng_road_addr"],
+                "jibunAddr": r["eng_jibun_addr"],
+                "zipNo": r["zip_no"],
+                "admCd": r["adm_cd"],
+                "rnMgtSn": r["rn_mgt_sn"],
+                "udrtYn": r["udrt_yn"],
+                "buldMnnm": r["buld_mnnm"],
+                "buldSlno": r["buld_slno"],
+                "bdMgtSn": r["mgmt_no"],
+                "engAddr": r["eng_road_addr"],
+            }
+            for r in rows
+            if r["eng_road_addr"]
+        ]
+
+    def search(self, req: EngAddrRequest) -> Mapping[str, Any]:
+        items = self._search_local(req)
+        if items or not self._confm_key:
+            return _ok_payload(items)
+        return super().search(req)
+
+    async def asearch(self, req: EngAddrRequest) -> Mapping[str, Any]:
+        items = self._search_local(req)
+        if items or not self._confm_key:
+            return _ok_payload(items)
+        return await super().asearch(req)
@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import asyncio
+import collections
+import enum
+import hashlib
+import logging
+import threading
+import time
+from typing import Any
+
+import httpx
+
+from postcode_mcp.infra.metrics import endpoint_name
+
+log = logging.getLogger(__name__)
+
+# upstream 과부하로 보는 Juso errorCode (-999: 시스템 에러, 요청 폭주 시 주로 발생)
+OVERLOAD_ERROR_CODES = frozenset({"-999"})
+# 과부하로 보는 HTTP status
+OVERLOAD_STATUS_CODES = frozenset({429, 502, 503, 504})
+# 과부하 신호가 몰려와도 이 간격 안에서는 한 번만 줄임 (같은 burst의 실패를 중복 반영하지 않기 위해)
+_DECREASE_COOLDOWN_SECONDS = 0.5
+
+
+class Outcome(enum.Enum):
+    OK = "ok"
+    OVERLOAD = "overload"  # throttling/timeout → 동시성 감소
+    ERROR = "error"  # 그 밖의 실패 → 동시성 유지
+
+
+def classify_error(e: BaseException) -> Outcome:
+    if isinstance(e, httpx.TimeoutException):
+        return Outcome.OVERLOAD
+    if isinstance(e, httpx.HTTPStatusError) and e.response.status_code in OVERLOAD_STATUS_CODES:
+        return Outcome.OVERLOAD
+    return Outcome.ERROR
+
+
+def classify_payload(payload: Any) -> Outcome:
+    """Juso 응답(results.common.errorCode)으로 과부하 여부 판단."""
+    try:
+        code = str(payload["results"]["common"]["errorCode"])
+    except (KeyError, TypeError):
+        return Outcome.OK
+    return Outcome.OVERLOAD if code in OVERLOAD_ERROR_CODES else Outcome.OK
+
+
+class TokenBucket:
+    """
+    초당 rate개씩 채워지고 최대 burst개까지 쌓이는 토큰 버킷.
+    reserve()는 토큰을 미리 빼고(음수 허용) 기다려야 할 시간을 돌려줌 → 대기자는 도착 순서대로 줄을 섬.
+    """
+
+    def __init__(self, *, rate: float, burst: int) -> None:
+        self._rate = rate
+        self._burst = max(1, burst)
+        self._tokens = float(self._burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self._rate
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def fill_ratio(self) -> float:
+        """지금 남은 토큰 / burst (예약으로 음수면 0)."""
+        with self._lock:
+            tokens = min(self._burst, self._tokens + (time.monotonic() - self._updated) * self._rate)
+        return max(0.0, tokens) / self._burst
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD(additive increase / multiplicative decrease) 동시성 제한.
+    - 성공할 때마다 limit += 1/limit (대략 limit건 성공마다 +1)
+    - 과부하(throttling/timeout)면 limit *= backoff (cooldown 동안 한 번만)
+    - sync(스레드)/async(이벤트 루프) 호출자가 같은 limit을 공유
+    """
+
+    def __init__(self, *, initial: int, min_limit: int, max_limit: int, backoff: float = 0.5) -> None:
+        self._min = max(1, min_limit)
+        self._max = max(self._min, max_limit)
+        self._limit = float(min(max(initial, self._min), self._max))
+        self._backoff = backoff
+        self._in_flight = 0
+        self._sync_waiting = 0
+        self._cond = threading.Condition()
+        self._waiters: collections.deque[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]] = (
+            collections.deque()
+        )
+        self._decreased_at = 0.0
+        self.decreases = 0
+
+    @property
+    def limit(self) -> float:
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters) + self._sync_waiting
+
+    def _has_room(self) -> bool:
+        return self._in_flight < int(self._limit)
+
+    def acquire_sync(self) -> None:
+        with self._cond:
+            self._sync_waiting += 1
+            while not self._has_room():
+                self._cond.wait()
+            self._sync_waiting -= 1
+            self._in_flight += 1
+
+    async def acquire(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._cond:
+            if self._has_room() and not self._waiters:
+                self._in_flight += 1
+                return
+            fut: asyncio.Future[None] = loop.create_future()
+            self._waiters.append((loop, fut))
+        try:
+            await fut
+        except asyncio.CancelledError:
+            with self._cond:
+                try:
+                    self._waiters.remove((loop, fut))
+                    handed_over = False
+                except ValueError:
+                    # 이미 slot을 넘겨받은 뒤 취소됨
+                    handed_over = fut.done() and not fut.cancelled()
+            if handed_over:
+                self.release(Outcome.ERROR)
+            raise
+
+    def release(self, outcome: Outcome) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            if outcome is Outcome.OK:
+                self._limit = min(self._max, self._limit + 1 / self._limit)
+            elif outcome is Outcome.OVERLOAD:
+                now = time.monotonic()
+                if now - self._decreased_at >= _DECREASE_COOLDOWN_SECONDS:
+                    self._decreased_at = now
+                    self._limit = max(self._min, self._limit * self._backoff)
+                    self.decreases += 1
+            self._wake()
+            self._cond.notify_all()
+
+    def _wake(self) -> None:
+        # 대기 중인 async 호출자에게 빈 slot을 넘김 (lock 보유 상태에서 호출)
+        while self._waiters and self._has_room():
+            loop, fut = self._waiters.popleft()
+            try:
+                loop.call_soon_threadsafe(self._hand_over, fut)
+            except RuntimeError:
+                # 대기자의 이벤트 루프가 이미 닫힘
+                continue
+            self._in_flight += 1
+
+    def _hand_over(self, fut: asyncio.Future[None]) -> None:
+        if fut.cancelled():
+            self.release(Outcome.ERROR)
+        elif not fut.done():
+            fut.set_result(None)
+
+
+class _Limit:
+    """endpoint × confmKey 하나의 rate(token bucket) + 동시성(AIMD) 제한."""
+
+    def __init__(self, bucket: TokenBucket | None, concurrency: AdaptiveConcurrency) -> None:
+        self.bucket = bucket
+        self.concurrency = concurrency
+        self.requests = 0
+        self.overloads = 0
+        self.wait_seconds = 0.0
+
+
+class Permit:
+    __slots__ = ("_limit",)
+
+    def __init__(self, limit: _Limit) -> None:
+        self._limit = limit
+
+    def release(self, outcome: Outcome) -> None:
+        if outcome is Outcome.OVERLOAD:
+            self._limit.overloads += 1
+        self._limit.concurrency.release(outcome)
+
+
+class RateLimiter:
+    """
+    upstream 호출 제한을 endpoint(URL) × confmKey 단위로 관리합니다.
+    (search/detail/english는 URL과 키가 모두 달라 서로 독립적으로 제한됨)
+
+    HttpClient/AsyncHttpClient가 요청마다 acquire*로 Permit을 받고, 응답 결과(Outcome)로 release합니다.
+    한도를 넘으면 에러를 내지 않고 토큰/slot이 생길 때까지 대기합니다.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate_per_second: float,
+        burst: int,
+        max_concurrency: int,
+        min_concurrency: int = 1,
+    ) -> None:
+        self._rate = rate_per_second
+        self._burst = burst
+        self._max_concurrency = max_concurrency
+        self._min_concurrency = min_concurrency
+        self._limits: dict[tuple[str, str], _Limit] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, url: str, params: dict[str, Any]) -> _Limit:
+        key = (url, str(params.get("confmKey") or ""))
+        limit = self._limits.get(key)
+        if limit is None:
+            with self._lock:
+                limit = self._limits.get(key)
+                if limit is None:
+                    bucket = TokenBucket(rate=self._rate, burst=self._burst) if self._rate > 0 else None
+                    concurrency = AdaptiveConcurrency(
+                        initial=self._max_concurrency,
+                        min_limit=self._min_concurrency,
+                        max_limit=self._max_concurrency,
+                    )
+                    limit = self._limits[key] = _Limit(bucket, concurrency)
+        return limit
+
+    def acquire_sync(self, url: str, params: dict[str, Any]) -> Permit:
+        limit = self._get(url, params)
+        limit.requests += 1
+        t0 = time.monotonic()
+        if limit.bucket is not None:
+            delay = limit.bucket.reserve()
+            if delay > 0:
+                time.sleep(delay)
+        limit.concurrency.acquire_sync()
+        limit.wait_seconds += time.monotonic() - t0
+        return Permit(limit)
+
+    async def acquire(self, url: str, params: dict[str, Any]) -> Permit:
+        limit = self._get(url, params)
+        limit.requests += 1
+        t0 = time.monotonic()
+        if limit.bucket is not None:
+            delay = limit.bucket.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        await limit.concurrency.acquire()
+        limit.wait_seconds += time.monotonic() - t0
+        return Permit(limit)
+
+    def idle(self, *, headroom: float = 0.5) -> bool:
+        """
+        upstream 호출이 한가한지: 모든 limiter에 처리/대기 중인 요청이 없고 토큰이 burst의 headroom 비율 이상 남음.
+        백그라운드 작업(캐시 warm-up)이 실제 요청과 쿼터를 다투지 않도록 보낼 시점을 고를 때 사용.
+        """
+        for limit in list(self._limits.values()):
+            if limit.concurrency.in_flight or limit.concurrency.waiting:
+                return False
+            if limit.bucket is not None and limit.bucket.fill_ratio() < headroom:
+                return False
+        return True
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """
+        limiter별 현재 한도/상태. key는 "<endpoint>:<키 지문>" (키 원문은 노출하지 않음).
+        """
+        out: dict[str, dict[str, float]] = {}
+        for (url, confm_key), limit in list(self._limits.items()):
+            endpoint = endpoint_name(url)
+            fingerprint = hashlib.sha256(confm_key.encode("utf-8")).hexdigest()[:8]
+            out[f"{endpoint}:{fingerprint}"] = {
+                "rate_per_second": limit.bucket.rate if limit.bucket is not None else 0.0,
+                "concurrency_limit": round(limit.concurrency.limit, 2),
+                "in_flight": limit.concurrency.in_flight,
+                "waiting": limit.concurrency.waiting,
+                "requests": limit.requests,
+                "overloads": limit.overloads,
+                "decreases": limit.concurrency.decreases,
+                "wait_ms_total": round(limit.wait_seconds * 1000, 1),
+            }
+        return out
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import random
+import threading
+from dataclasses import dataclass
+
+import httpx
+
+# 재시도해도 안전한 실패: 연결 실패/끊김, read timeout, 5xx
+_RETRYABLE_ERRORS = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.ReadTimeout,
+    httpx.ReadError,
+    httpx.RemoteProtocolError,
+)
+
+
+def is_retryable(e: BaseException) -> bool:
+    if isinstance(e, httpx.HTTPStatusError):
+        return e.response.status_code >= 500
+    return isinstance(e, _RETRYABLE_ERRORS)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    지수 backoff + full jitter.
+    n번째 재시도 전 대기: uniform(0, min(max_delay, base_delay * 2^(n-1)))
+    """
+
+    max_attempts: int = 3
+    base_delay_seconds: float = 0.1
+    max_delay_seconds: float = 2.0
+
+    def backoff(self, retry: int) -> float:
+        cap = min(self.max_delay_seconds, self.base_delay_seconds * (2 ** (retry - 1)))
+        return random.uniform(0, cap)
+
+
+class RetryBudget:
+    """
+    전역 재시도 예산 (token ratio).
+    - 최초 요청마다 ratio개 토큰 적립 (max_tokens까지), 재시도마다 1개 소모
+    - 토큰이 없으면 재시도하지 않음 → 장애 시 재시도가 전체 요청의 약 ratio 비율을 넘지 않아 부하를 증폭시키지 않음
+    """
+
+    def __init__(self, *, ratio: float, max_tokens: float = 10.0) -> None:
+        self._ratio = ratio
+        self._max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+        self.exhausted = 0  # 예산 부족으로 포기한 재시도 수
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(self._max_tokens, self._tokens + self._ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            self.exhausted += 1
+            return False
+
+    def stats(self) -> dict[str, float]:
+        return {"tokens": round(self._tokens, 2), "exhausted": self.exhausted}
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar, cast
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    같은 key로 동시에 들어온 upstream 호출을 하나로 합칩니다(in-flight request coalescing).
+    - 첫 호출(leader)만 실제로 fn을 실행하고, 나머지(waiter)는 그 결과/예외를 그대로 받음
+    - 호출이 끝나면 key는 즉시 해제되므로 결과 보관은 Cache의 몫
+    - async(do)와 sync(do_sync) 경로는 서로 독립적으로 합쳐짐
+    """
+
+    def __init__(self) -> None:
+        self._tasks: dict[str, asyncio.Task[Any]] = {}
+        self._calls: dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self._leaders = 0
+        self._coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._tasks.get(key)
+        if task is None:
+            self._leaders += 1
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            task.add_done_callback(lambda t: self._release(key, t))
+        else:
+            self._coalesced += 1
+            log.debug("Coalesced in-flight request: %s", key)
+        # shield: 한 호출자가 취소되어도 다른 waiter가 기다리는 upstream 호출은 계속 진행
+        result: T = await asyncio.shield(task)
+        return result
+
+    def _release(self, key: str, task: asyncio.Task[Any]) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+
+    def do_sync(self, key: str, fn: Callable[[], T]) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                self._leaders += 1
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            log.debug("Coalesced in-flight request: %s", key)
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return cast(T, call.result)
+
+        try:
+            result = fn()
+            call.result = result
+            return result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "leaders": self._leaders,
+            "coalesced": self._coalesced,
+            "in_flight": len(self._tasks) + len(self._calls),
+        }
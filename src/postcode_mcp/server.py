@@ -1,27 +1,131 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any
 
 from fastmcp import FastMCP
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
 
-from postcode_mcp.app.container import build_container
+from postcode_mcp.app.container import LazyContainer, build_container
 from postcode_mcp.app.logger import configure_logging
+from postcode_mcp.app.middleware import MetricsMiddleware, SlowRequestLog
+from postcode_mcp.app.settings import get_settings
+from postcode_mcp.infra.metrics import ToolMetrics
 from postcode_mcp.tools.postcode_tools import register_postcode_tools
 
+if TYPE_CHECKING:
+    # warm-up/Prometheus 렌더링은 쓰일 때(lifespan, /metrics) import
+    from postcode_mcp.app.warmup import WarmUp
+
 configure_logging()
 log = logging.getLogger(__name__)
 
-mcp = FastMCP("postcode-mcp")
+# WARMUP_SNAPSHOT_PATH가 설정된 경우에만 lifespan에서 생성
+_warmup: WarmUp | None = None
+
+
+async def _warm_up() -> None:
+    # container 생성(스레드) → async 클라이언트 연결 prewarm (서버 이벤트 루프에서)
+    container = await asyncio.to_thread(_container.get)
+    await container.async_http.prewarm(container.endpoints)
+
+
+async def _warm_cache(warmup: WarmUp, path: str) -> None:
+    # 이전 실행의 hot key snapshot으로 캐시 채우기 (rate limiter가 한가할 때만 upstream 호출)
+    from postcode_mcp.app.warmup import load_snapshot
+
+    keys = await asyncio.to_thread(load_snapshot, path)
+    if not keys:
+        return
+    container = await asyncio.to_thread(_container.get)
+    await warmup.run(container, keys)
+
+
+def _save_snapshot(path: str) -> None:
+    # container가 아직 없으면(호출이 한 번도 없었으면) 이전 snapshot을 그대로 둠
+    if not _container.built:
+        return
+    from postcode_mcp.app.warmup import export_snapshot
+
+    carry = _warmup.pending() if _warmup is not None else []
+    try:
+        n = export_snapshot(_container.get().cache, path, top_n=_settings.warmup_top_keys, carry=carry)
+        log.info("Saved %d hot cache keys to %s", n, path)
+    except OSError as e:
+        log.warning("Failed to save warm-up snapshot (%s): %s", path, e)
+
+
+async def _snapshot_periodically(path: str, interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        await asyncio.to_thread(_save_snapshot, path)
+
+
+@asynccontextmanager
+async def _lifespan(server: Any) -> AsyncIterator[None]:
+    global _warmup
+    # 시작(initialize/tools/list 응답)을 막지 않도록 백그라운드로
+    tasks: list[asyncio.Future[None]] = []
+    if _settings.http_prewarm:
+        tasks.append(asyncio.ensure_future(_warm_up()))
+    snapshot_path = _settings.warmup_snapshot_path
+    if snapshot_path:
+        if _warmup is None:
+            from postcode_mcp.app.warmup import WarmUp
+
+            _warmup = WarmUp(rate_per_second=_settings.warmup_rate_per_second)
+        tasks.append(asyncio.ensure_future(_warm_cache(_warmup, snapshot_path)))
+        if _settings.warmup_snapshot_interval_seconds > 0:
+            interval = _settings.warmup_snapshot_interval_seconds
+            tasks.append(asyncio.ensure_future(_snapshot_periodically(snapshot_path, interval)))
+    try:
+        yield
+    finally:
+        for task in tasks:
+            task.cancel()
+        if snapshot_path:
+            _save_snapshot(snapshot_path)
+        if _container.built:
+            # 디스크 L2/fixture 저장소 flush, upstream 연결 정리
+            await _container.get().aclose()
+
+
+mcp = FastMCP("postcode-mcp", lifespan=_lifespan)
 
 try:
-    _container = build_container()
+    # import 시에는 서버 자체 설정(관측/warm-up)만 읽음. 키 검증과 HTTP 클라이언트/provider/캐시 생성은
+    # 첫 tool 호출(또는 백그라운드 prewarm) 때 → 키 없이도 import/tools/list는 가능
+    _settings = get_settings(require_key=False)
+    _tool_metrics = ToolMetrics()
+    _container = LazyContainer(lambda: build_container(tool_metrics=_tool_metrics))
     register_postcode_tools(mcp, _container)
+    _slow_log = SlowRequestLog(
+        threshold_ms=_settings.slow_request_ms,
+        sample_rate=_settings.slow_request_sample_rate,
+    )
+    mcp.add_middleware(MetricsMiddleware(_tool_metrics, _slow_log if _slow_log.enabled else None))
     log.info("Postcode tools registered successfully")
 except Exception as e:
     log.error("Failed to register postcode tools: %s", e, exc_info=True)
     raise
 
 
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics(request: Request) -> PlainTextResponse:
+    # Prometheus scrape endpoint (HTTP transport에서만 노출). 렌더링 모듈은 첫 scrape 때 import
+    from postcode_mcp.app.metrics import render_metrics
+    from postcode_mcp.infra.metrics import PrometheusText
+
+    # scrape만으로 container(HTTP 클라이언트/provider/캐시)를 만들지 않음
+    container = _container.get() if _container.built else None
+    text = render_metrics(container, _warmup, tool_metrics=_tool_metrics)
+    return PlainTextResponse(text, media_type=PrometheusText.CONTENT_TYPE)
+
+
 if __name__ == "__main__":
     # default: STDIO (FastMCP 문서상 run() 기본)
     mcp.run(
@@ -1,11 +1,23 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Mapping
 from dataclasses import dataclass
 from typing import Any
 
+from postcode_mcp.core.concurrency import gather_limited
+from postcode_mcp.core.errors import CircuitOpenError, UpstreamError, ValidationError
+from postcode_mcp.core.text import canonical_query
+from postcode_mcp.core.trace import current_trace, span, traced
+from postcode_mcp.infra.circuit import CircuitBreaker
+from postcode_mcp.infra.compact import plain
 from postcode_mcp.infra.providers.juso_detail import DetailAddrRequest, JusoDetailProvider
 from postcode_mcp.infra.providers.juso_eng import EngAddrRequest, JusoEnglishProvider
 
+log = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True)
 class AddressResolveResult:
@@ -21,23 +33,37 @@ class AddressResolveResult:
             "best": self.best,
             "candidates": self.candidates,
             "detail": self.detail,
-            "english": self.english,
+            # english 후보의 _raw는 캐시의 Record 그대로 → 응답으로 내보낼 때만 dict로 변환
+            "english": plain(self.english),
             "message": self.message,
             "meta": self.meta,
         }
 
 
+@dataclass(frozen=True)
+class AddressBatchResult:
+    items: list[dict[str, Any]]  # 입력 순서 그대로, 행마다 { index, query, normalized, candidates, message, error }
+    meta: dict[str, Any]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"items": self.items, "meta": self.meta}
+
+
 class AddressService:
     def __init__(
         self,
         postcode_service: Any,
         detail_provider: JusoDetailProvider | None,
         english_provider: JusoEnglishProvider | None,
+        stage_timeout_seconds: float | None = None,
     ):
         self._postcode_service = postcode_service
         self._detail_provider = detail_provider
         self._english_provider = english_provider
+        # detail/english 단계별 타임아웃 (None이면 HTTP 타임아웃에만 의존)
+        self._stage_timeout_seconds = stage_timeout_seconds
 
+    @traced
     def resolve(
         self,
         *,
@@ -50,99 +76,347 @@ class AddressService:
         include_english: bool = False,
         english_count_per_page: int = 5,
     ) -> AddressResolveResult:
-        base = self._postcode_service.resolve(query=query, hint_city=hint_city, max_candidates=max_candidates)
+        with span("search"):
+            base = self._postcode_service.resolve(query=query, hint_city=hint_city, max_candidates=max_candidates)
         base_dict = base.to_dict() if hasattr(base, "to_dict") else base
-
         best = base_dict.get("best")
-        candidates = base_dict.get("candidates") or []
-        message = base_dict.get("message")
-        meta = base_dict.get("meta") or {}
 
         # -----------------------
         # Detail (2단계)
         # -----------------------
         detail_block: dict[str, Any] | None = None
         if include_detail:
-            if self._detail_provider is None:
-                detail_block = {
-                    "common": {"errorCode": "NO_DETAIL_PROVIDER", "errorMessage": "Detail API key/provider not configured"},
-                    "items": [],
-                }
-            elif not best:
-                detail_block = {
-                    "common": {"errorCode": "NO_BEST", "errorMessage": "No best address to resolve detail"},
-                    "items": [],
-                }
-            else:
-                admCd = str(best.get("admCd") or "")
-                rnMgtSn = str(best.get("rnMgtSn") or "")
-                udrtYn = str(best.get("udrtYn") or "")
-                buldMnnm = str(best.get("buldMnnm") or "")
-                buldSlno = str(best.get("buldSlno") or "")
-
-                if all([admCd, rnMgtSn, udrtYn, buldMnnm]) and buldSlno != "":
-                    payload = self._detail_provider.search(
-                        DetailAddrRequest(
-                            admCd=admCd,
-                            rnMgtSn=rnMgtSn,
-                            udrtYn=udrtYn,
-                            buldMnnm=buldMnnm,
-                            buldSlno=buldSlno,
-                            searchType=detail_search_type,
-                            dongNm=dong_nm,
-                        )
-                    )
-                    common, items = self._detail_provider.extract_items(payload)
-                    detail_block = {"common": common, "items": items}
-                else:
-                    detail_block = {
-                        "common": {
-                            "errorCode": "MISSING_KEYS",
-                            "errorMessage": "Best candidate lacks required keys for detail lookup (need admCd/rnMgtSn/udrtYn/buldMnnm/buldSlno)",
-                        },
-                        "items": [],
-                    }
+            detail_req, detail_block = self._detail_request(best, detail_search_type, dong_nm)
+            if detail_req is not None and self._detail_provider is not None:
+                provider = self._detail_provider
+                detail_block = self._run_stage_sync(
+                    "detail", lambda: provider.search(detail_req), self._detail_block
+                )
 
         # -----------------------
         # English (3단계)
         # -----------------------
         english_block: dict[str, Any] | None = None
         if include_english:
-            if self._english_provider is None:
-                english_block = {
-                    "common": {"errorCode": "NO_ENGLISH_PROVIDER", "errorMessage": "English API key/provider not configured"},
-                    "best": None,
-                    "candidates": [],
-                }
-            else:
-                # 영문검색 입력: best의 road_addr가 있으면 그걸 우선, 없으면 query
-                eng_input = None
-                if isinstance(best, dict):
-                    eng_input = (best.get("road_addr") or best.get("jibun_addr") or "").strip() or None
-                if not eng_input:
-                    eng_input = query
-
-                payload = self._english_provider.search(
-                    EngAddrRequest(keyword=eng_input, current_page=1, count_per_page=english_count_per_page)
+            eng_req, english_block = self._english_request(best, query, english_count_per_page)
+            if eng_req is not None and self._english_provider is not None:
+                eng_provider = self._english_provider
+                english_block = self._run_stage_sync(
+                    "english", lambda: eng_provider.search(eng_req), self._english_block
+                )
+
+        return self._build_result(
+            base_dict,
+            detail_block=detail_block,
+            english_block=english_block,
+            include_detail=include_detail,
+            detail_search_type=detail_search_type,
+            include_english=include_english,
+        )
+
+    @traced
+    async def aresolve(
+        self,
+        *,
+        query: str,
+        hint_city: str | None = None,
+        max_candidates: int = 5,
+        include_detail: bool = False,
+        detail_search_type: str = "dong",
+        dong_nm: str | None = None,
+        include_english: bool = False,
+        english_count_per_page: int = 5,
+    ) -> AddressResolveResult:
+        """
+        resolve()의 비동기 버전 (각 provider의 asearch 사용).
+
+        검색이 끝나면 detail/english 조회를 동시에 시작합니다.
+        (detail은 best의 건물 코드만, english는 best.road_addr만 필요)
+        각 단계는 stage_timeout_seconds를 넘기면 TIMEOUT 에러 블록으로 대체됩니다.
+        """
+        with span("search"):
+            base = await self._postcode_service.aresolve(
+                query=query, hint_city=hint_city, max_candidates=max_candidates
+            )
+        base_dict = base.to_dict() if hasattr(base, "to_dict") else base
+        best = base_dict.get("best")
+
+        detail_block: dict[str, Any] | None = None
+        english_block: dict[str, Any] | None = None
+        stages: dict[str, Awaitable[dict[str, Any]]] = {}
+
+        if include_detail:
+            detail_req, detail_block = self._detail_request(best, detail_search_type, dong_nm)
+            if detail_req is not None and self._detail_provider is not None:
+                stages["detail"] = self._run_stage(
+                    "detail",
+                    self._detail_provider.asearch(detail_req),
+                    self._detail_block,
+                    getattr(self._detail_provider, "circuit_breaker", None),
                 )
-                common, items = self._english_provider.extract_items(payload)
-                norm_items = [self._english_provider.normalize_item(it) for it in items]
 
-                english_best = norm_items[0] if norm_items else None
-                english_block = {"common": common, "best": english_best, "candidates": norm_items}
+        if include_english:
+            eng_req, english_block = self._english_request(best, query, english_count_per_page)
+            if eng_req is not None and self._english_provider is not None:
+                stages["english"] = self._run_stage(
+                    "english",
+                    self._english_provider.asearch(eng_req),
+                    self._english_block,
+                    getattr(self._english_provider, "circuit_breaker", None),
+                )
+
+        if stages:
+            done = dict(zip(stages, await asyncio.gather(*stages.values()), strict=True))
+            detail_block = done.get("detail", detail_block)
+            english_block = done.get("english", english_block)
 
+        return self._build_result(
+            base_dict,
+            detail_block=detail_block,
+            english_block=english_block,
+            include_detail=include_detail,
+            detail_search_type=detail_search_type,
+            include_english=include_english,
+        )
+
+    async def aresolve_batch(
+        self,
+        queries: list[str],
+        *,
+        hint_city: str | None = None,
+        max_candidates: int = 5,
+        concurrency: int = 8,
+    ) -> AddressBatchResult:
+        """
+        주소 문자열 여러 개를 한 번에 정규화합니다 (검색 단계만, detail/english 없음).
+
+        - canonical_query로 정규화한 뒤 같은 검색어는 한 번만 조회하고 결과를 공유
+        - 고유 검색어들은 concurrency 만큼 병렬로 조회 (캐시/single-flight 경유)
+        - 행 하나의 실패는 그 행의 error로만 기록하고 배치 전체는 계속 진행
+        """
+        started = time.perf_counter()
+        canonical = [canonical_query(q) if isinstance(q, str) else "" for q in queries]
+        unique = list(dict.fromkeys(q for q in canonical if q))
+
+        async def _one(query: str) -> dict[str, Any]:
+            try:
+                res = await self._postcode_service.aresolve(
+                    query=query, hint_city=hint_city, max_candidates=max_candidates
+                )
+            except Exception as e:
+                return {"error": _batch_error(query, e)}
+            return res.to_dict() if hasattr(res, "to_dict") else res
+
+        resolved = await gather_limited((_one(q) for q in unique), limit=concurrency)
+        by_query = dict(zip(unique, resolved, strict=True))
+
+        items: list[dict[str, Any]] = []
+        for index, (raw, query) in enumerate(zip(queries, canonical, strict=True)):
+            if query:
+                res = by_query[query]
+            else:
+                res = {"error": {"errorCode": "EMPTY_QUERY", "errorMessage": "검색어가 비어있습니다."}}
+            items.append(
+                {
+                    "index": index,
+                    "query": raw,
+                    "normalized": res.get("best"),
+                    "candidates": res.get("candidates") or [],
+                    "message": res.get("message"),
+                    "error": res.get("error"),
+                }
+            )
+
+        meta = {
+            "total": len(items),
+            "unique": len(unique),
+            "errors": sum(1 for it in items if it["error"] is not None),
+            "elapsed_ms": _elapsed_ms(started),
+        }
+        return AddressBatchResult(items=items, meta=meta)
+
+    async def _run_stage(
+        self,
+        stage: str,
+        call: Awaitable[Mapping[str, Any]],
+        to_block: Callable[[Mapping[str, Any]], dict[str, Any]],
+        breaker: CircuitBreaker | None = None,
+    ) -> dict[str, Any]:
+        """
+        enrichment 단계 하나를 타임아웃과 함께 실행합니다 (소요시간은 stage 이름의 span으로 기록).
+        - 타임아웃은 provider의 circuit breaker에 실패로 기록 (연속되면 open → 이후 요청은 즉시 CIRCUIT_OPEN)
+        - upstream 실패는 예외 대신 에러 블록으로 반환 → 핵심 주소 검색 결과는 그대로 응답
+        """
+        try:
+            with span(stage):
+                payload = await asyncio.wait_for(call, timeout=self._stage_timeout_seconds)
+        except TimeoutError:
+            if breaker is not None:
+                breaker.record_failure()
+            return _stage_error(stage, "TIMEOUT", f"{stage} lookup exceeded {self._stage_timeout_seconds}s")
+        except UpstreamError as e:
+            return _upstream_stage_error(stage, e)
+        return to_block(payload)
+
+    def _run_stage_sync(
+        self,
+        stage: str,
+        call: Callable[[], Mapping[str, Any]],
+        to_block: Callable[[Mapping[str, Any]], dict[str, Any]],
+    ) -> dict[str, Any]:
+        """_run_stage의 sync 버전 (타임아웃은 HTTP 타임아웃에 맡김)."""
+        try:
+            with span(stage):
+                payload = call()
+        except UpstreamError as e:
+            return _upstream_stage_error(stage, e)
+        return to_block(payload)
+
+    def _detail_request(
+        self,
+        best: dict[str, Any] | None,
+        detail_search_type: str,
+        dong_nm: str | None,
+    ) -> tuple[DetailAddrRequest | None, dict[str, Any] | None]:
+        """
+        상세주소 조회 요청을 만듭니다.
+        조회할 수 없으면 (None, 에러 블록)을 반환합니다.
+        """
+        if self._detail_provider is None:
+            return None, {
+                "common": {"errorCode": "NO_DETAIL_PROVIDER", "errorMessage": "Detail API key/provider not configured"},
+                "items": [],
+            }
+        if not best:
+            return None, {
+                "common": {"errorCode": "NO_BEST", "errorMessage": "No best address to resolve detail"},
+                "items": [],
+            }
+
+        admCd = str(best.get("admCd") or "")
+        rnMgtSn = str(best.get("rnMgtSn") or "")
+        udrtYn = str(best.get("udrtYn") or "")
+        buldMnnm = str(best.get("buldMnnm") or "")
+        buldSlno = str(best.get("buldSlno") or "")
+
+        if all([admCd, rnMgtSn, udrtYn, buldMnnm]) and buldSlno != "":
+            req = DetailAddrRequest(
+                admCd=admCd,
+                rnMgtSn=rnMgtSn,
+                udrtYn=udrtYn,
+                buldMnnm=buldMnnm,
+                buldSlno=buldSlno,
+                searchType=detail_search_type,
+                dongNm=dong_nm,
+            )
+            return req, None
+
+        return None, {
+            "common": {
+                "errorCode": "MISSING_KEYS",
+                "errorMessage": "Best candidate lacks required keys for detail lookup (need admCd/rnMgtSn/udrtYn/buldMnnm/buldSlno)",
+            },
+            "items": [],
+        }
+
+    def _detail_block(self, payload: Mapping[str, Any]) -> dict[str, Any]:
+        assert self._detail_provider is not None
+        common, items = self._detail_provider.extract_items(payload)
+        return {"common": common, "items": items}
+
+    def _english_request(
+        self,
+        best: dict[str, Any] | None,
+        query: str,
+        english_count_per_page: int,
+    ) -> tuple[EngAddrRequest | None, dict[str, Any] | None]:
+        """
+        영문주소 조회 요청을 만듭니다.
+        조회할 수 없으면 (None, 에러 블록)을 반환합니다.
+        """
+        if self._english_provider is None:
+            return None, {
+                "common": {"errorCode": "NO_ENGLISH_PROVIDER", "errorMessage": "English API key/provider not configured"},
+                "best": None,
+                "candidates": [],
+            }
+
+        # 영문검색 입력: best의 road_addr가 있으면 그걸 우선, 없으면 query
+        eng_input = None
+        if isinstance(best, dict):
+            eng_input = (best.get("road_addr") or best.get("jibun_addr") or "").strip() or None
+        if not eng_input:
+            eng_input = query
+
+        return EngAddrRequest(keyword=eng_input, current_page=1, count_per_page=english_count_per_page), None
+
+    def _english_block(self, payload: Mapping[str, Any]) -> dict[str, Any]:
+        assert self._english_provider is not None
+        common, items = self._english_provider.extract_items(payload)
+        norm_items = [self._english_provider.normalize_item(it) for it in items]
+
+        english_best = norm_items[0] if norm_items else None
+        return {"common": common, "best": english_best, "candidates": norm_items}
+
+    @staticmethod
+    def _build_result(
+        base_dict: dict[str, Any],
+        *,
+        detail_block: dict[str, Any] | None,
+        english_block: dict[str, Any] | None,
+        include_detail: bool,
+        detail_search_type: str,
+        include_english: bool,
+    ) -> AddressResolveResult:
+        meta = base_dict.get("meta") or {}
         out_meta = {
             **meta,
             "include_detail": include_detail,
             "detail_search_type": detail_search_type,
             "include_english": include_english,
         }
+        # stale-while-revalidate로 stale 캐시 값을 사용한 단계 (없으면 빈 리스트)
+        trace = current_trace()
+        out_meta["stale"] = sorted(trace.stale) if trace is not None else []
+        # 이번 요청에서 실제로 나간 upstream HTTP 시도 수 (캐시 hit면 0)
+        out_meta["attempts"] = {
+            "total": trace.attempts if trace is not None else 0,
+            "retries": trace.retries if trace is not None else 0,
+        }
 
         return AddressResolveResult(
-            best=best,
-            candidates=candidates,
+            best=base_dict.get("best"),
+            candidates=base_dict.get("candidates") or [],
             detail=detail_block,
             english=english_block,
-            message=message,
+            message=base_dict.get("message"),
             meta=out_meta,
         )
+
+
+def _stage_error(stage: str, code: str, message: str) -> dict[str, Any]:
+    common = {"errorCode": code, "errorMessage": message}
+    if stage == "detail":
+        return {"common": common, "items": []}
+    return {"common": common, "best": None, "candidates": []}
+
+
+def _upstream_stage_error(stage: str, e: UpstreamError) -> dict[str, Any]:
+    if isinstance(e, CircuitOpenError):
+        return _stage_error(stage, "CIRCUIT_OPEN", f"{stage} lookup skipped: {e}")
+    return _stage_error(stage, "UPSTREAM_ERROR", str(e))
+
+
+def _batch_error(query: str, e: Exception) -> dict[str, str]:
+    if isinstance(e, ValidationError):
+        code = "VALIDATION_ERROR"
+    elif isinstance(e, UpstreamError):
+        code = "UPSTREAM_ERROR"
+    else:
+        code = "INTERNAL_ERROR"
+        log.exception("Batch row failed: %s", query)
+    return {"errorCode": code, "errorMessage": str(e)}
+
+
+def _elapsed_ms(t0: float) -> float:
+    return round((time.perf_counter() - t0) * 1000, 2)
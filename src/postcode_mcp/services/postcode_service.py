@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+from dataclasses import replace
+
+from rapidfuzz import fuzz, process, utils
+
 from postcode_mcp.core.models import AddressCandidate, ResolveResult
+from postcode_mcp.core.trace import span
 from postcode_mcp.infra.providers.juso import JusoProvider
 
+# _rank에서 후보 1개당 비교하는 필드 수 (road_addr, jibun_addr, building_name)
+_FIELDS_PER_CANDIDATE = 3
+
 
 class PostcodeService:
     def __init__(self, *, juso: JusoProvider) -> None:
@@ -24,7 +33,25 @@ class PostcodeService:
         """
         # JusoProvider를 통해 검색
         candidates = self._juso.search(query, max_results=max_candidates)
+        return self._finalize(candidates, query=query, hint_city=hint_city, max_candidates=max_candidates)
+
+    async def aresolve(
+        self, *, query: str, hint_city: str | None = None, max_candidates: int = 5
+    ) -> ResolveResult:
+        """
+        resolve()의 비동기 버전 (JusoProvider.asearch 사용).
+        """
+        candidates = await self._juso.asearch(query, max_results=max_candidates)
+        return self._finalize(candidates, query=query, hint_city=hint_city, max_candidates=max_candidates)
 
+    def _finalize(
+        self,
+        candidates: Sequence[AddressCandidate],
+        *,
+        query: str,
+        hint_city: str | None,
+        max_candidates: int,
+    ) -> ResolveResult:
         if not candidates:
             return ResolveResult(
                 best=None,
@@ -32,9 +59,9 @@ class PostcodeService:
                 message=f"'{query}'에 대한 검색 결과가 없습니다.",
             )
 
-        # hint_city가 있으면 스코어링 적용
-        if hint_city:
-            candidates = self._score_by_city(candidates, hint_city)
+        # 검색어 유사도 + hint_city로 confidence 산정 후 정렬
+        with span("search.rank"):
+            candidates = self._rank(candidates, query=query, hint_city=hint_city)
 
         # best는 첫 번째 후보
         best = candidates[0] if candidates else None
@@ -45,24 +72,41 @@ class PostcodeService:
             message=None,
         )
 
-    def _score_by_city(self, candidates: list[AddressCandidate], hint_city: str) -> list[AddressCandidate]:
+    def _rank(
+        self,
+        candidates: Sequence[AddressCandidate],
+        *,
+        query: str,
+        hint_city: str | None,
+    ) -> list[AddressCandidate]:
         """
-        hint_city를 기반으로 후보를 스코어링하고 정렬합니다.
+        후보마다 confidence를 계산하고 내림차순으로 정렬합니다 (동점이면 Juso 응답 순서 유지).
+
+        - 유사도: query vs (road_addr, jibun_addr, building_name) 중 최댓값 (0~1)
+          후보 N개 × 필드 3개를 rapidfuzz 한 번의 배치 호출로 계산 → 후보가 100개 이상이어도 저렴
+        - hint_city: road_addr/jibun_addr에 없으면 confidence 절반
         """
-        hint_city = hint_city.strip().lower()
-
-        def score(candidate: AddressCandidate) -> float:
-            # road_addr에서 도시명 매칭
-            road_addr_lower = candidate.road_addr.lower()
-            if hint_city in road_addr_lower:
-                # 도시명이 포함된 경우 원래 confidence 유지
-                return candidate.confidence
-            else:
-                # 도시명이 없는 경우 confidence 감소
-                return candidate.confidence * 0.5
+        choices: list[str] = []
+        for c in candidates:
+            choices.extend((c.road_addr, c.jibun_addr or "", c.building_name or ""))
 
-        # 스코어링 후 정렬
-        scored = [(score(c), c) for c in candidates]
-        scored.sort(key=lambda x: x[0], reverse=True)
+        best_scores = [0.0] * len(candidates)
+        for _, score, idx in process.extract(
+            query, choices, scorer=fuzz.WRatio, processor=utils.default_process, limit=None
+        ):
+            i = idx // _FIELDS_PER_CANDIDATE
+            if score > best_scores[i]:
+                best_scores[i] = score
+
+        hint = (hint_city or "").strip().lower()
+
+        def confidence(i: int, c: AddressCandidate) -> float:
+            score = best_scores[i] / 100.0
+            if hint and hint not in c.road_addr.lower() and hint not in (c.jibun_addr or "").lower():
+                # 도시명이 없는 경우 confidence 감소
+                score *= 0.5
+            return round(score, 4)
 
-        return [c for _, c in scored]
+        ranked = [replace(c, confidence=confidence(i, c)) for i, c in enumerate(candidates)]
+        ranked.sort(key=lambda c: c.confidence, reverse=True)
+        return ranked
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 
 from fastmcp import FastMCP
 from pydantic import BaseModel, Field, ValidationError as PydanticValidationError
 
-from postcode_mcp.app.container import Container
-from postcode_mcp.infra.providers.juso_eng import EngAddrRequest
+from postcode_mcp.app.container import Container, LazyContainer
+from postcode_mcp.core.concurrency import gather_limited
+from postcode_mcp.core.trace import span, trace_request
+from postcode_mcp.infra.compact import plain
 
 
 class ResolvePostcodeArgs(BaseModel):
@@ -38,6 +41,7 @@ class ResolvePostcodeAutoArgs(BaseModel):
 
     include_english: bool = Field(True, description="영문주소 조회 포함 여부")
     english_count_per_page: int = Field(5, ge=1, le=20, description="영문주소 후보 수")
+    include_timings: bool = Field(False, description="meta.timings에 단계별 소요시간/캐시 hit 여부 포함")
 
 class EnrichKakaoPlaceArgs(BaseModel):
     """
@@ -101,10 +105,67 @@ def _extract_road_address_from_kakao_payload(
 
 
 
-def register_postcode_tools(mcp: FastMCP, container: Container) -> None:
-    address_service = container.address_service
-    postcode_service = container.postcode_service
-    english_provider = container.juso_english
+def _kakao_place_no_address(picked: dict[str, Any] | None) -> dict[str, Any]:
+    return {
+        "normalized": None,
+        "postcode": None,
+        "english_address": None,
+        "candidates": [],
+        "detail": None,
+        "english": None,
+        "meta": {
+            "strategy": "kakao_place_no_address",
+            "message": "카카오 place에서 사용할 수 있는 주소를 찾지 못했습니다.",
+            "kakao_place_used": picked,
+        },
+    }
+
+
+def _kakao_place_result(
+    res: dict[str, Any],
+    addr_from_kakao: str,
+    picked: dict[str, Any] | None,
+) -> dict[str, Any]:
+    best = res.get("best")
+    postcode: str | None = None
+    if isinstance(best, dict):
+        postcode = best.get("postcode5")
+
+    english_address: str | None = None
+    english_block = res.get("english")
+    if isinstance(english_block, dict):
+        best_eng = english_block.get("best")
+        if isinstance(best_eng, dict):
+            raw = best_eng.get("_raw") or {}
+            if isinstance(raw, Mapping):
+                english_address = raw.get("engAddr")
+
+    meta = {
+        **(res.get("meta") or {}),
+        "strategy": "kakao_place",
+        "input_used": addr_from_kakao,
+        "kakao_place_used": picked,
+    }
+
+    return {
+        "normalized": best,
+        "postcode": postcode,
+        "english_address": english_address,
+        "candidates": res.get("candidates") or [],
+        "detail": res.get("detail"),
+        "english": english_block,
+        "meta": meta,
+    }
+
+
+def register_postcode_tools(mcp: FastMCP, container: Container | LazyContainer) -> None:
+    """
+    tool 등록. container가 LazyContainer면 의존성 그래프는 첫 tool 호출 때 만들어짐
+    (등록/initialize/tools/list는 container를 건드리지 않음).
+    """
+
+    def get() -> Container:
+        return container.get() if isinstance(container, LazyContainer) else container
 
     @mcp.tool(
         name="normalize_address",
@@ -113,7 +174,7 @@ def register_postcode_tools(mcp: FastMCP, container: Container) -> None:
             "배송지/회원가입 폼의 주소 문자열을 정제하거나, 데이터 파이프라인에서 주소를 표준화할 때 사용합니다."
         ),
     )
-    def normalize_address(
+    async def normalize_address(
         query: str,
         hint_city: str | None = None,
         max_candidates: int = 5,
@@ -124,7 +185,7 @@ def register_postcode_tools(mcp: FastMCP, container: Container) -> None:
         - query: 예) '서울 강남구 테헤란로 142'
         - hint_city: 예) '서울', '수원' (스코어링 힌트, 선택)
         """
-        base = address_service.resolve(
+        resolved = await get().address_service.aresolve(
             query=query,
             hint_city=hint_city,
             max_candidates=max_candidates,
@@ -133,13 +194,42 @@ def register_postcode_tools(mcp: FastMCP, container: Container) -> None:
             dong_nm=None,
             include_english=False,
             english_count_per_page=5,
-        ).to_dict()
+        )
+        base = resolved.to_dict()
 
         return NormalizeResult(
             normalized=base.get("best"),
             candidates=base.get("candidates") or [],
         )
 
+    @mcp.tool(
+        name="normalize_addresses_batch",
+        description=(
+            "주소 문자열 여러 개를 한 번의 호출로 표준 주소 후보로 정규화합니다. "
+            "회원가입/배송지 주소를 대량으로 정제하는 데이터 파이프라인용이며, 결과는 입력 순서대로 반환되고 "
+            "실패한 행은 해당 행의 error에만 기록됩니다."
+        ),
+    )
+    async def normalize_addresses_batch(
+        queries: list[str],
+        hint_city: str | None = None,
+        max_candidates: int = 5,
+    ) -> dict[str, Any]:
+        """
+        텍스트 주소 리스트 → 행별 정규화 결과 (normalize_address의 배치 버전).
+
+        - 같은 주소(공백/전각 문자 차이 포함)는 한 번만 조회
+        - 고유 주소들은 BATCH_CONCURRENCY 만큼 병렬로 조회
+        - items[i]는 queries[i]에 대응: { index, query, normalized, candidates, message, error }
+        """
+        result = await get().address_service.aresolve_batch(
+            queries,
+            hint_city=hint_city,
+            max_candidates=max_candidates,
+            concurrency=get().settings.batch_concurrency,
+        )
+        return result.to_dict()
+
     @mcp.tool(
         name="get_postcode",
         description=(
@@ -147,7 +237,7 @@ def register_postcode_tools(mcp: FastMCP, container: Container) -> None:
             "이미 정규화된 주소에서 우편번호만 추출할 때 사용합니다."
         ),
     )
-    def get_postcode(
+    async def get_postcode(
         road_addr: str | None = None,
         jibun_addr: str | None = None,
         hint_city: str | None = None,
@@ -169,7 +259,7 @@ def register_postcode_tools(mcp: FastMCP, container: Container) -> None:
 
         query = query_parts[0]
 
-        base = postcode_service.resolve(
+        base = await get().postcode_service.aresolve(
             query=query,
             hint_city=hint_city,
             max_candidates=max_candidates,
@@ -195,7 +285,7 @@ def register_postcode_tools(mcp: FastMCP, container: Container) -> None:
             "해외 배송지, 여권 정보, 글로벌 서비스용 주소 데이터 정리에 사용할 수 있습니다."
         ),
     )
-    def get_english_address(
+    async def get_english_address(
         road_addr: str,
         english_count_per_page: int = 5,
     ) -> dict[str, Any]:
@@ -204,6 +294,7 @@ def register_postcode_tools(mcp: FastMCP, container: Container) -> None:
 
         - road_addr: 예) '서울특별시 강남구 테헤란로 142'
         """
+        english_provider = get().juso_english
         if not english_provider:
             return {
                 "english_address": None,
@@ -215,12 +306,15 @@ def register_postcode_tools(mcp: FastMCP, container: Container) -> None:
                 "candidates": [],
             }
 
+        # provider 모듈은 container 생성 때 import되므로 여기서 (서버 import 시 provider를 읽지 않도록)
+        from postcode_mcp.infra.providers.juso_eng import EngAddrRequest
+
         req = EngAddrRequest(
             keyword=road_addr,
             current_page=1,
             count_per_page=english_count_per_page,
         )
-        payload = english_provider.search(req)
+        payload = await english_provider.asearch(req)
         common, items = english_provider.extract_items(payload)
         norm_items = [english_provider.normalize_item(it) for it in items]
         english_best = norm_items[0] if norm_items else None
@@ -228,13 +322,13 @@ def register_postcode_tools(mcp: FastMCP, container: Container) -> None:
         english_address: str | None = None
         if isinstance(english_best, dict):
             raw = english_best.get("_raw") or {}
-            if isinstance(raw, dict):
+            if isinstance(raw, Mapping):
                 english_address = raw.get("engAddr")
 
         return {
             "english_address": english_address,
-            "best": english_best,
-            "candidates": norm_items,
+            "best": plain(english_best),
+            "candidates": plain(norm_items),
             "common": common,
         }
 
@@ -245,7 +339,7 @@ def register_postcode_tools(mcp: FastMCP, container: Container) -> None:
             "카카오 검색 결과를 그대로 쓰지 않고, 배송지/회원가입/데이터 정제용 주소 데이터로 가공하는 보조 도구입니다."
         ),
     )
-    def resolve_from_kakao_place(
+    async def resolve_from_kakao_place(
         kakao_place: dict[str, Any],
         hint_city: str | None = None,
         max_candidates: int = 5,
@@ -265,21 +359,9 @@ def register_postcode_tools(mcp: FastMCP, container: Container) -> None:
             kakao_places=None,
         )
         if not addr_from_kakao:
-            return {
-                "normalized": None,
-                "postcode": None,
-                "english_address": None,
-                "candidates": [],
-                "detail": None,
-                "english": None,
-                "meta": {
-                    "strategy": "kakao_place_no_address",
-                    "message": "카카오 place에서 사용할 수 있는 주소를 찾지 못했습니다.",
-                    "kakao_place_used": picked,
-                },
-            }
+            return _kakao_place_no_address(picked)
 
-        res = address_service.resolve(
+        resolved = await get().address_service.aresolve(
             query=addr_from_kakao,
             hint_city=hint_city,
             max_candidates=max_candidates,
@@ -288,38 +370,8 @@ def register_postcode_tools(mcp: FastMCP, container: Container) -> None:
             dong_nm=dong_nm,
             include_english=include_english,
             english_count_per_page=english_count_per_page,
-        ).to_dict()
-
-        best = res.get("best")
-        postcode: str | None = None
-        if isinstance(best, dict):
-            postcode = best.get("postcode5")
-
-        english_address: str | None = None
-        english_block = res.get("english")
-        if isinstance(english_block, dict):
-            best_eng = english_block.get("best")
-            if isinstance(best_eng, dict):
-                raw = best_eng.get("_raw") or {}
-                if isinstance(raw, dict):
-                    english_address = raw.get("engAddr")
-
-        meta = {
-            **(res.get("meta") or {}),
-            "strategy": "kakao_place",
-            "input_used": addr_from_kakao,
-            "kakao_place_used": picked,
-        }
-
-        return {
-            "normalized": best,
-            "postcode": postcode,
-            "english_address": english_address,
-            "candidates": res.get("candidates") or [],
-            "detail": res.get("detail"),
-            "english": english_block,
-            "meta": meta,
-        }
+        )
+        return _kakao_place_result(resolved.to_dict(), addr_from_kakao, picked)
 
     @mcp.tool(
         name="resolve_from_kakao_places",
@@ -328,7 +380,7 @@ def register_postcode_tools(mcp: FastMCP, container: Container) -> None:
             "카카오 키워드 검색 결과 목록에 배송지/회원가입용 주소 정보를 일괄로 붙일 때 사용합니다."
         ),
     )
-    def resolve_from_kakao_places(
+    async def resolve_from_kakao_places(
         kakao_places: list[dict[str, Any]],
         hint_city: str | None = None,
         max_candidates: int = 5,
@@ -341,24 +393,41 @@ def register_postcode_tools(mcp: FastMCP, container: Container) -> None:
         """
         카카오 place JSON 여러 개 → 상위 N개 처리 (입력 리스트가 이미 상위 N개라고 가정).
 
-        각 place마다 resolve_from_kakao_place를 적용해, 주소 데이터/우편번호/영문주소를 보강합니다.
+        각 place마다 resolve_from_kakao_place와 같은 방식으로 주소 데이터/우편번호/영문주소를 보강합니다.
+        - 같은 주소(road_address_name)를 가진 place는 한 번만 조회하고 결과를 공유
+        - 고유 주소들은 KAKAO_PLACES_CONCURRENCY 만큼 병렬로 조회
+        - items 순서는 입력 순서와 동일
         """
-        items: list[dict[str, Any]] = []
+        places = [p for p in kakao_places or [] if isinstance(p, dict)]
+        extracted = [
+            _extract_road_address_from_kakao_payload(kakao_place=p, kakao_places=None) for p in places
+        ]
+        unique_addrs = list(dict.fromkeys(addr for addr, _ in extracted if addr))
+
+        resolved = await gather_limited(
+            (
+                get().address_service.aresolve(
+                    query=addr,
+                    hint_city=hint_city,
+                    max_candidates=max_candidates,
+                    include_detail=include_detail,
+                    detail_search_type=detail_search_type,
+                    dong_nm=dong_nm,
+                    include_english=include_english,
+                    english_count_per_page=english_count_per_page,
+                )
+                for addr in unique_addrs
+            ),
+            limit=get().settings.kakao_places_concurrency,
+        )
+        by_addr = {addr: r.to_dict() for addr, r in zip(unique_addrs, resolved, strict=True)}
 
-        for place in kakao_places or []:
-            if not isinstance(place, dict):
-                continue
-
-            item = resolve_from_kakao_place(
-                kakao_place=place,
-                hint_city=hint_city,
-                max_candidates=max_candidates,
-                include_detail=include_detail,
-                detail_search_type=detail_search_type,
-                dong_nm=dong_nm,
-                include_english=include_english,
-                english_count_per_page=english_count_per_page,
-            )
+        items: list[dict[str, Any]] = []
+        for place, (addr, picked) in zip(places, extracted, strict=True):
+            if addr:
+                item = _kakao_place_result(by_addr[addr], addr, picked)
+            else:
+                item = _kakao_place_no_address(picked)
             # 원본 place도 같이 반환해 LLM이 후처리/매칭하기 좋게 함.
             item["kakao_place"] = place
             items.append(item)
@@ -373,7 +442,7 @@ def register_postcode_tools(mcp: FastMCP, container: Container) -> None:
             "핵심 주소 정제/보강 로직은 normalize_address/get_postcode/get_english_address/resolve_from_kakao_place 등에 분리되어 있습니다."
         ),
     )
-    def resolve_postcode_auto(
+    async def resolve_postcode_auto(
         query: str | None = None,
         kakao_place: dict[str, Any] | None = None,
         kakao_places: list[dict[str, Any]] | None = None,
@@ -384,33 +453,44 @@ def register_postcode_tools(mcp: FastMCP, container: Container) -> None:
         dong_nm: str | None = None,
         include_english: bool = True,
         english_count_per_page: int = 5,
+        include_timings: bool = False,
     ) -> dict[str, Any]:
         """
         장소명/주소 또는 카카오 place JSON 입력 → best/candidates + detail(선택) + english(선택) 반환.
         - A 전략: kakao_place/kakao_places에 road_address_name이 있으면 우선 사용
         - B 전략: query 문자열만으로 Juso 검색
+        - include_timings: meta.timings에 span별 소요시간(카카오 payload 검증, 검색/상세/영문, 직렬화, 전체)과 단계별 캐시 hit/miss
         """
-        args = ResolvePostcodeAutoArgs(
-            query=query,
-            kakao_place=kakao_place,
-            kakao_places=kakao_places,
-            hint_city=hint_city,
-            max_candidates=max_candidates,
-            include_detail=include_detail,
-            detail_search_type=detail_search_type,
-            dong_nm=dong_nm,
-            include_english=include_english,
-            english_count_per_page=english_count_per_page,
-        )
+        with trace_request() as trace:
+            with span("total"):
+                res = await _resolve_postcode_auto(
+                    query=query,
+                    kakao_place=kakao_place,
+                    kakao_places=kakao_places,
+                    hint_city=hint_city,
+                    max_candidates=max_candidates,
+                    include_detail=include_detail,
+                    detail_search_type=detail_search_type,
+                    dong_nm=dong_nm,
+                    include_english=include_english,
+                    english_count_per_page=english_count_per_page,
+                )
+            if include_timings:
+                # 서비스 밖의 span(kakao.validate, serialize)까지 포함하도록 tool에서 한 번만 붙임
+                res["meta"] = {**(res.get("meta") or {}), "timings": trace.timings()}
+            return res
 
-        addr_from_kakao, picked_place = _extract_road_address_from_kakao_payload(
-            kakao_place=args.kakao_place,
-            kakao_places=args.kakao_places,
-        )
+    async def _resolve_postcode_auto(**kwargs: Any) -> dict[str, Any]:
+        with span("kakao.validate"):
+            args = ResolvePostcodeAutoArgs(**kwargs)
+            addr_from_kakao, picked_place = _extract_road_address_from_kakao_payload(
+                kakao_place=args.kakao_place,
+                kakao_places=args.kakao_places,
+            )
 
         # A: 카카오 우선
         if addr_from_kakao:
-            res = address_service.resolve(
+            resolved = await get().address_service.aresolve(
                 query=addr_from_kakao,
                 hint_city=args.hint_city,
                 max_candidates=args.max_candidates,
@@ -419,7 +499,9 @@ def register_postcode_tools(mcp: FastMCP, container: Container) -> None:
                 dong_nm=args.dong_nm,
                 include_english=args.include_english,
                 english_count_per_page=args.english_count_per_page,
-            ).to_dict()
+            )
+            with span("serialize"):
+                res = resolved.to_dict()
             res["meta"] = {
                 **(res.get("meta") or {}),
                 "strategy": "A_kakao_then_juso",
@@ -439,7 +521,7 @@ def register_postcode_tools(mcp: FastMCP, container: Container) -> None:
                 "meta": {"strategy": "B_juso_fallback_failed"},
             }
 
-        res = address_service.resolve(
+        resolved = await get().address_service.aresolve(
             query=args.query,
             hint_city=args.hint_city,
             max_candidates=args.max_candidates,
@@ -448,6 +530,8 @@ def register_postcode_tools(mcp: FastMCP, container: Container) -> None:
             dong_nm=args.dong_nm,
             include_english=args.include_english,
             english_count_per_page=args.english_count_per_page,
-        ).to_dict()
+        )
+        with span("serialize"):
+            res = resolved.to_dict()
         res["meta"] = {**(res.get("meta") or {}), "strategy": "B_juso_fallback", "input_used": args.query}
-        return res
\ No newline at end of file
+        return res
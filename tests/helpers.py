@@ -0,0 +1,84 @@
+"""테스트 공용 헬퍼: 가짜 Juso 응답/서버와 MockTransport로 연결한 Container."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import httpx
+
+
+def juso_item(n: int, **overrides: Any) -> dict[str, Any]:
+    """addrLinkApi 응답의 juso[] 항목 하나 (테스트용)."""
+    item = {
+        "roadAddr": f"경기도 수원시 팔달구 효원로 {n}",
+        "jibunAddr": f"경기도 수원시 팔달구 인계동 {n}",
+        "zipNo": "16490",
+        "bdNm": f"건물{n}",
+        "admCd": "4111514100",
+        "rnMgtSn": "411153180008",
+        "udrtYn": "0",
+        "buldMnnm": str(n),
+        "buldSlno": "0",
+        "bdMgtSn": f"41115141001{n:05d}",
+        "engAddr": f"{n} Hyowon-ro, Paldal-gu, Suwon-si, Gyeonggi-do",
+    }
+    item.update(overrides)
+    return item
+
+
+def juso_payload(items: list[dict[str, Any]], *, total_count: int | None = None, error_code: str = "0") -> dict[str, Any]:
+    return {
+        "results": {
+            "common": {
+                "errorCode": error_code,
+                "errorMessage": "정상" if error_code == "0" else "error",
+                "totalCount": str(len(items) if total_count is None else total_count),
+            },
+            "juso": items,
+        }
+    }
+
+
+class FakeJuso:
+    """
+    httpx.MockTransport용 가짜 Juso 서버.
+    - total: keyword당 전체 결과 개수
+    - 요청은 self.calls에 (path, params)로 기록
+    """
+
+    def __init__(self, total: int = 3) -> None:
+        self.total = total
+        self.calls: list[tuple[str, dict[str, str]]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        params = dict(request.url.params)
+        self.calls.append((request.url.path, params))
+        page = int(params.get("currentPage", "1"))
+        size = int(params.get("countPerPage", "10"))
+        start = (page - 1) * size
+        items = [juso_item(n + 1) for n in range(start, min(start + size, self.total))]
+        return httpx.Response(200, json=juso_payload(items, total_count=self.total))
+
+
+def make_container(monkeypatch: Any, handler: Any, **env: str) -> Any:
+    """
+    MockTransport(handler)로 연결된 Container를 만듭니다.
+    env로 Settings 환경변수를 덮어쓸 수 있습니다.
+    """
+    from postcode_mcp.app.container import build_container
+    from postcode_mcp.app.settings import get_settings
+
+    defaults = {
+        "JUSO_ROAD_KEY": "road",
+        "JUSO_DETAIL_KEY": "detail",
+        "JUSO_ENG_KEY": "eng",
+        "JUSO_ENG_API_URL": "https://business.juso.go.kr/addrlink/addrEngApi.do",
+    }
+    for name, value in {**defaults, **env}.items():
+        monkeypatch.setenv(name, value)
+
+    return build_container(
+        get_settings(),
+        transport=httpx.MockTransport(handler),
+        async_transport=httpx.MockTransport(handler),
+    )
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+from helpers import FakeJuso
+
+from postcode_mcp.core.trace import trace_request
+from postcode_mcp.infra.cache import Cache
+from postcode_mcp.infra.http import AsyncHttpClient, HttpClient
+from postcode_mcp.infra.providers.juso import JusoProvider
+from postcode_mcp.infra.providers.juso_detail import JusoDetailProvider
+from postcode_mcp.infra.providers.juso_eng import JusoEnglishProvider
+from postcode_mcp.services.address_service import AddressService
+from postcode_mcp.services.postcode_service import PostcodeService
+
+
+def _build(fake: FakeJuso, *, async_handler=None, stage_timeout_seconds=None) -> AddressService:
+    http = HttpClient(timeout_seconds=1.0, user_agent="test", transport=httpx.MockTransport(fake))
+    async_http = AsyncHttpClient(
+        timeout_seconds=1.0, user_agent="test", transport=httpx.MockTransport(async_handler or fake)
+    )
+    cache = Cache(maxsize=100, ttl_seconds=60)
+    common = {"count_per_page": 10, "first_sort": "none", "add_info_yn": "Y"}
+    juso = JusoProvider(http=http, confm_key="k", cache=cache, async_http=async_http, **common)
+    detail = JusoDetailProvider(http=http, confm_key="k", async_http=async_http)
+    english = JusoEnglishProvider(http=http, confm_key="k", cache=cache, async_http=async_http, **common)
+    return AddressService(
+        postcode_service=PostcodeService(juso=juso),
+        detail_provider=detail,
+        english_provider=english,
+        stage_timeout_seconds=stage_timeout_seconds,
+    )
+
+
+@pytest.mark.asyncio
+async def test_aresolve_matches_sync_resolve():
+    svc = _build(FakeJuso(total=3))
+    kwargs = {"query": "효원로", "max_candidates": 3, "include_detail": True, "include_english": True}
+
+    a = (await svc.aresolve(**kwargs)).to_dict()
+    s = svc.resolve(**kwargs).to_dict()
+
+    assert a["best"]["postcode5"] == "16490"
+    assert a["best"] == s["best"]
+    assert a["detail"]["items"]
+    assert a["english"]["best"]["road_addr"]
+
+
+@pytest.mark.asyncio
+async def test_aresolve_runs_concurrently():
+    fake = FakeJuso(total=1)
+    svc = _build(fake)
+
+    results = await asyncio.gather(
+        *(svc.aresolve(query=f"효원로 {i}", max_candidates=1) for i in range(50))
+    )
+
+    assert all(r.best is not None for r in results)
+    assert len(fake.calls) == 50
+
+
+class _SlowEnrichment:
+    """search는 즉시, detail/english는 delay만큼 늦게 응답하며 동시 실행 수를 기록."""
+
+    def __init__(self, fake: FakeJuso, delay: float) -> None:
+        self.fake = fake
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("addrLinkApi.do"):
+            return self.fake(request)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        return self.fake(request)
+
+
+@pytest.mark.asyncio
+async def test_detail_and_english_run_in_parallel():
+    fake = FakeJuso(total=1)
+    slow = _SlowEnrichment(fake, delay=0.05)
+    svc = _build(fake, async_handler=slow)
+
+    with trace_request() as trace:
+        await svc.aresolve(query="효원로 1", include_detail=True, include_english=True)
+
+    assert slow.max_in_flight == 2
+    # 단계별 소요시간은 span으로 (include_timings의 meta.timings와 같은 형식)
+    assert {"search", "detail", "english"} <= set(trace.timings())
+
+
+@pytest.mark.asyncio
+async def test_stage_timeout_returns_error_block():
+    fake = FakeJuso(total=1)
+    svc = _build(fake, async_handler=_SlowEnrichment(fake, delay=0.5), stage_timeout_seconds=0.05)
+
+    res = await svc.aresolve(query="효원로 1", include_detail=True, include_english=True)
+
+    assert res.best is not None
+    assert res.detail["common"]["errorCode"] == "TIMEOUT"
+    assert res.english["common"]["errorCode"] == "TIMEOUT"
+    assert res.english["candidates"] == []
+
+
+def _pager(fake: FakeJuso, async_handler=None) -> JusoProvider:
+    return JusoProvider(
+        http=HttpClient(timeout_seconds=1.0, user_agent="test", transport=httpx.MockTransport(fake)),
+        async_http=AsyncHttpClient(
+            timeout_seconds=1.0, user_agent="test", transport=httpx.MockTransport(async_handler or fake)
+        ),
+        confm_key="k",
+        count_per_page=10,
+        first_sort="none",
+        add_info_yn="Y",
+        cache=Cache(maxsize=100, ttl_seconds=60),
+    )
+
+
+def test_count_per_page_is_sized_to_need():
+    fake = FakeJuso(total=50)
+    juso = _pager(fake)
+
+    assert len(juso.search("효원로", max_results=1)) == 1
+    assert [p["countPerPage"] for _, p in fake.calls] == ["1"]
+
+    # 1건 페이지에 이어 붙이지 않고 더 큰 페이지로 새로 조회
+    assert len(juso.search("효원로", max_results=5)) == 5
+    assert [(p["currentPage"], p["countPerPage"]) for _, p in fake.calls[1:]] == [("1", "5")]
+
+
+@pytest.mark.asyncio
+async def test_remaining_pages_are_fetched_concurrently_in_order():
+    fake = FakeJuso(total=35)
+    in_flight = peak = 0
+
+    async def slow(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        return fake(request)
+
+    juso = _pager(fake, async_handler=slow)
+    result = await juso.asearch("효원로", max_results=40)
+
+    assert [c.road_addr for c in result] == [f"경기도 수원시 팔달구 효원로 {n}" for n in range(1, 36)]
+    assert [p["currentPage"] for _, p in fake.calls][0] == "1"
+    assert sorted(p["currentPage"] for _, p in fake.calls) == ["1", "2", "3", "4"]
+    # totalCount 확인 후 2~4페이지는 동시에 조회
+    assert peak == 3
+
+
+def test_sync_search_pages_past_count_per_page():
+    fake = FakeJuso(total=25)
+    juso = _pager(fake)
+
+    result = juso.search("효원로", max_results=20)
+
+    assert len(result) == 20
+    assert [c.road_addr for c in result][-1] == "경기도 수원시 팔달구 효원로 20"
+    assert sorted(p["currentPage"] for _, p in fake.calls) == ["1", "2"]
+    # 이어서 더 요청하면 남은 페이지만 조회
+    assert len(juso.search("효원로", max_results=30)) == 25
+    assert sorted(p["currentPage"] for _, p in fake.calls) == ["1", "2", "3"]
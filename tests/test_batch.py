@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import csv
+import json
+
+import pytest
+from helpers import FakeJuso, make_container
+
+from postcode_mcp.app.batch import run_batch
+
+
+def _write_jsonl(path, queries):
+    path.write_text("".join(json.dumps({"id": i, "query": q}, ensure_ascii=False) + "\n" for i, q in enumerate(queries)))
+
+
+@pytest.mark.asyncio
+async def test_batch_resumes_from_checkpoint(monkeypatch, tmp_path):
+    container = make_container(monkeypatch, FakeJuso(total=1))
+    src, dst = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    _write_jsonl(src, [f"효원로 {i}" for i in range(10)])
+
+    # 3번째 chunk에서 프로세스가 죽은 상황을 흉내
+    real = container.address_service.aresolve_batch
+    calls = 0
+
+    async def dying(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        if calls == 3:
+            raise RuntimeError("killed")
+        return await real(*args, **kwargs)
+
+    monkeypatch.setattr(container.address_service, "aresolve_batch", dying)
+    with pytest.raises(RuntimeError):
+        await run_batch(container, input_path=str(src), output_path=str(dst), chunk_size=3)
+    # checkpoint 이후에 쓰다 만 줄은 재개 시 잘려야 함
+    with open(dst, "a", encoding="utf-8") as f:
+        f.write('{"id": 6, "partial')
+
+    stats = await run_batch(container, input_path=str(src), output_path=str(dst), chunk_size=3)
+
+    assert stats.resumed_from == 6 and stats.rows == 4 and stats.errors == 0
+    rows = [json.loads(line) for line in dst.read_text(encoding="utf-8").splitlines()]
+    assert [r["id"] for r in rows] == list(range(10))
+    assert all(r["normalized"]["postcode5"] == "16490" for r in rows)
+    assert not (tmp_path / "out.jsonl.ckpt").exists()
+
+
+@pytest.mark.asyncio
+async def test_batch_csv_rerun_hits_cache(monkeypatch, tmp_path):
+    fake = FakeJuso(total=1)
+    container = make_container(monkeypatch, fake)
+    src, dst = tmp_path / "in.csv", tmp_path / "out.csv"
+    src.write_text("id,addr\n1,효원로 1\n2,효원로  1\n3,\n4,인계동 2\n", encoding="utf-8")
+
+    first = await run_batch(container, input_path=str(src), output_path=str(dst), query_field="addr")
+    second = await run_batch(container, input_path=str(src), output_path=str(dst), query_field="addr", restart=True)
+
+    with open(dst, encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [r["id"] for r in rows] == ["1", "2", "3", "4"]
+    assert rows[0]["norm_postcode5"] == "16490" and rows[0]["norm_road_addr"] == rows[1]["norm_road_addr"]
+    assert rows[2]["norm_error"] == "EMPTY_QUERY"
+    assert first.upstream_calls == 2 and first.errors == 1
+    assert second.upstream_calls == 0 and second.cache_hit_ratio == 1.0
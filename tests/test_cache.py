@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import httpx
+import pytest
+from helpers import FakeJuso, juso_payload, make_container
+
+from postcode_mcp.core.errors import UpstreamError
+from postcode_mcp.core.models import AddressCandidate
+from postcode_mcp.infra.cache import Cache
+from postcode_mcp.infra.disk_cache import SqliteCache
+from postcode_mcp.infra.http import HttpClient
+from postcode_mcp.infra.negative_cache import BloomFilter, NegativeCache
+from postcode_mcp.infra.providers.juso import JusoProvider
+
+
+def _candidate() -> AddressCandidate:
+    return AddressCandidate(
+        road_addr="경기도 수원시 팔달구 효원로 241",
+        jibun_addr=None,
+        postcode5="16490",
+        building_name=None,
+        confidence=1.0,
+    )
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+
+    first = Cache(maxsize=10, ttl_seconds=60, l2=SqliteCache(path=path, ttl_seconds=60))
+    first.set("juso:효원로", [_candidate()])
+    first.close()
+
+    second = Cache(maxsize=10, ttl_seconds=60, l2=SqliteCache(path=path, ttl_seconds=60))
+    assert second.get("juso:효원로") == [_candidate()]
+    # 두 번째 조회는 L1에서
+    assert second.get("juso:효원로") == [_candidate()]
+
+    stats = second.stats()
+    assert (stats["l1"]["hits"], stats["l1"]["misses"], stats["l1"]["size"]) == (1, 1, 1)
+    assert stats["l2"]["hits"] == 1
+
+
+def test_container_close_flushes_disk_tier(monkeypatch, tmp_path):
+    env = {"POSTCODE_CACHE_BACKEND": "sqlite", "POSTCODE_CACHE_SQLITE_PATH": str(tmp_path / "cache.sqlite3")}
+    first = make_container(monkeypatch, FakeJuso(), **env)
+    first.cache.set("juso:효원로", [_candidate()])
+    first.close()
+
+    second = make_container(monkeypatch, FakeJuso(), **env)
+    assert second.cache.get("juso:효원로") == [_candidate()]
+    second.close()
+
+
+def test_disk_tier_respects_ttl(tmp_path):
+    l2 = SqliteCache(path=str(tmp_path / "cache.sqlite3"), ttl_seconds=60)
+    l2.set("k", "v", expires_at=time.time() - 1)
+
+    cache = Cache(maxsize=10, ttl_seconds=60, l2=l2)
+    assert cache.get("k") is None
+    assert cache.stats()["l2"]["misses"] == 1
+
+
+def test_disk_tier_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    writer = Cache(maxsize=10, ttl_seconds=60, l2=SqliteCache(path=path, ttl_seconds=60))
+    reader = Cache(maxsize=10, ttl_seconds=60, l2=SqliteCache(path=path, ttl_seconds=60))
+
+    writer.set("k", {"a": 1})
+    assert reader.get("k") == {"a": 1}
+
+
+def test_bloom_filter_false_positive_rate():
+    bloom = BloomFilter(capacity=10_000, error_rate=0.001)
+    for i in range(10_000):
+        bloom.add(f"juso:miss-{i}")
+
+    assert all(f"juso:miss-{i}" in bloom for i in range(10_000))
+    false_positives = sum(f"juso:other-{i}" in bloom for i in range(10_000))
+    assert false_positives < 30
+    assert bloom.nbytes < 20_000
+
+
+def _juso(handler, cache: Cache) -> JusoProvider:
+    return JusoProvider(
+        http=HttpClient(timeout_seconds=1.0, user_agent="test", transport=httpx.MockTransport(handler)),
+        confm_key="k",
+        count_per_page=10,
+        first_sort="none",
+        add_info_yn="Y",
+        cache=cache,
+    )
+
+
+def _cache_with_negative() -> Cache:
+    negative = NegativeCache(ttl_seconds=60, capacity=1000, error_rate=0.0001)
+    return Cache(maxsize=10, ttl_seconds=60, negative=negative)
+
+
+def test_empty_result_is_negative_cached():
+    fake = FakeJuso(total=0)
+    juso = _juso(fake, _cache_with_negative())
+
+    assert juso.search("없는주소") == ()
+    assert juso.search("없는주소") == ()
+    assert len(fake.calls) == 1
+
+
+def test_upstream_error_code_is_not_negative_cached():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, json=juso_payload([], error_code="E0001"))
+
+    juso = _juso(handler, _cache_with_negative())
+
+    for _ in range(2):
+        with pytest.raises(UpstreamError):
+            juso.search("효원로")
+    assert len(calls) == 2
+
+
+def test_smaller_requests_are_sliced_from_cached_page():
+    fake = FakeJuso(total=8)
+    juso = _juso(fake, Cache(maxsize=10, ttl_seconds=60))
+
+    five = juso.search("효원로", max_results=5)
+    three = juso.search("효원로", max_results=3)
+
+    assert [c.road_addr for c in three] == [c.road_addr for c in five[:3]]
+    assert len(five) == 5
+    assert len(fake.calls) == 1
+
+
+def test_stale_entry_is_served_and_refreshed_once():
+    fake = FakeJuso(total=2)
+    gate = threading.Event()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if fake.calls:
+            gate.wait(2.0)
+        return fake(request)
+
+    cache = Cache(maxsize=10, ttl_seconds=0, stale_ttl_seconds=60)
+    juso = _juso(handler, cache)
+
+    juso.search("효원로")
+    # soft TTL(0초)이 지났으므로 stale 응답 + 백그라운드 갱신 (진행 중에는 중복 예약 안 함)
+    results = [juso.search("효원로") for _ in range(5)]
+    assert cache.stats()["l1"]["refreshing"] == 1
+    gate.set()
+
+    assert all(len(r) == 2 for r in results)
+    deadline = time.time() + 2
+    while cache.stats()["l1"]["refreshing"] and time.time() < deadline:
+        time.sleep(0.01)
+    assert len(fake.calls) == 2
+    assert cache.stats()["l1"]["stale_hits"] == 5
+
+
+def test_stale_entry_is_dropped_when_refresh_finds_nothing(tmp_path):
+    fake = FakeJuso(total=2)
+    negative = NegativeCache(ttl_seconds=60, capacity=1000, error_rate=0.0001)
+    l2 = SqliteCache(path=str(tmp_path / "cache.sqlite3"), ttl_seconds=60)
+    cache = Cache(maxsize=10, ttl_seconds=0, stale_ttl_seconds=60, l2=l2, negative=negative)
+    juso = _juso(fake, cache)
+
+    assert len(juso.search("효원로")) == 2
+    fake.total = 0  # 주소 폐지: 갱신 결과 0건
+    assert len(juso.search("효원로")) == 2  # stale 응답 + 백그라운드 갱신
+    deadline = time.time() + 2
+    while cache.stats()["l1"]["refreshing"] and time.time() < deadline:
+        time.sleep(0.01)
+
+    # 이전 결과(L1/L2 모두)는 지워지고 negative 캐시로 응답, 더 이상 갱신 예약도 없음
+    assert juso.search("효원로") == ()
+    assert l2.get("juso:v2:효원로:none") is None
+    assert len(fake.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_stale_result_is_reported_in_meta(monkeypatch):
+    fake = FakeJuso(total=1)
+    container = make_container(
+        monkeypatch, fake, POSTCODE_CACHE_TTL_SECONDS="0", POSTCODE_CACHE_STALE_TTL_SECONDS="60"
+    )
+    svc = container.address_service
+
+    first = await svc.aresolve(query="효원로 1")
+    second = await svc.aresolve(query="효원로 1")
+
+    assert first.meta["stale"] == []
+    assert second.meta["stale"] == ["search"]
+    assert second.best == first.best
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import pytest
+from helpers import FakeJuso, juso_item, juso_payload, make_container
+
+from postcode_mcp.core.errors import CircuitOpenError, UpstreamError, UpstreamUnavailableError
+from postcode_mcp.infra.circuit import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+def _fail() -> None:
+    raise UpstreamUnavailableError("down")
+
+
+def test_breaker_opens_probes_and_closes():
+    breaker = CircuitBreaker("t", failure_threshold=2, reset_timeout_seconds=0.05)
+
+    for _ in range(2):
+        with pytest.raises(UpstreamUnavailableError):
+            breaker.call_sync(_fail)
+    assert breaker.state == OPEN
+
+    calls = []
+    with pytest.raises(CircuitOpenError):
+        breaker.call_sync(lambda: calls.append(1))
+    assert calls == [] and breaker.stats()["rejected"] == 1
+
+    time.sleep(0.06)
+    assert breaker.state == HALF_OPEN
+    assert breaker.call_sync(lambda: "ok") == "ok"
+    assert breaker.state == CLOSED
+
+
+def test_upstream_error_responses_do_not_trip_breaker():
+    breaker = CircuitBreaker("t", failure_threshold=1)
+
+    def bad_request() -> None:
+        raise UpstreamError("E0006")
+
+    with pytest.raises(UpstreamError):
+        breaker.call_sync(bad_request)
+    assert breaker.state == CLOSED
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_skips_enrichment_and_serves_stale(monkeypatch):
+    fake = FakeJuso(total=1)
+    down = False
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if down and request.url.path.endswith(("addrDetailApi.do", "addrEngApi.do")):
+            raise httpx.ConnectError("connection refused")
+        if request.url.params.get("keyword") == "효원로 2":
+            # 다른 건물 → detail/english 캐시 miss
+            fake.calls.append((request.url.path, dict(request.url.params)))
+            return httpx.Response(200, json=juso_payload([juso_item(2)]))
+        return fake(request)
+
+    container = make_container(
+        monkeypatch,
+        handler,
+        CIRCUIT_FAILURE_THRESHOLD="1",
+        HTTP_MAX_ATTEMPTS="1",
+        POSTCODE_CACHE_TTL_SECONDS="0",
+        POSTCODE_CACHE_STALE_TTL_SECONDS="3600",
+    )
+    svc = container.address_service
+    kwargs = {"include_detail": True, "include_english": True, "max_candidates": 1}
+
+    warm = await svc.aresolve(query="효원로 1", **kwargs)
+    assert warm.detail["common"]["errorCode"] == "0"
+
+    down = True
+    # stale 값으로 응답 + 백그라운드 갱신 실패 → breaker open
+    await svc.aresolve(query="효원로 1", **kwargs)
+    await asyncio.sleep(0.05)
+    assert container.juso_detail.circuit_breaker.state == OPEN
+    assert container.juso_english.circuit_breaker.state == OPEN
+
+    calls_before = len(fake.calls)
+    fresh = await svc.aresolve(query="효원로 2", **kwargs)
+    assert fresh.best is not None
+    assert fresh.detail["common"]["errorCode"] == "CIRCUIT_OPEN"
+    assert fresh.english["common"]["errorCode"] == "CIRCUIT_OPEN"
+    # 검색만 upstream 호출, detail/english는 호출 없이 건너뜀
+    assert len(fake.calls) == calls_before + 1
+
+    cached = await svc.aresolve(query="효원로 1", **kwargs)
+    assert cached.detail["common"]["errorCode"] == "0"
+    assert {"detail", "english"} <= set(cached.meta["stale"])
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import time
+
+import httpx
+import pytest
+from helpers import FakeJuso, make_container
+
+from postcode_mcp.core.errors import UpstreamError, UpstreamUnavailableError
+from postcode_mcp.infra.fixtures import RECORD, REPLAY, HttpFixtures, fixture_key
+from postcode_mcp.infra.http import AsyncHttpClient, HttpClient
+
+URL = "http://juso.invalid/addrlink/addrLinkApi.do"
+
+
+def test_fixture_key_strips_key_and_sorts_params():
+    a = httpx.URL(URL, params={"keyword": " 효원로 1 ", "confmKey": "secret", "currentPage": "1"})
+    b = httpx.URL(URL, params={"currentPage": "1", "keyword": "효원로 1", "confmKey": "other"})
+    assert fixture_key(a) == fixture_key(b)
+    assert "secret" not in fixture_key(a)
+    assert fixture_key(a).startswith("addrLinkApi.do?")
+
+
+@pytest.mark.asyncio
+async def test_record_then_replay_without_network(tmp_path):
+    path = str(tmp_path / "fixtures.sqlite3")
+    fake = FakeJuso(total=2)
+    recorder = HttpFixtures(path=path, mode=RECORD)
+    http = HttpClient(timeout_seconds=1.0, user_agent="t", transport=httpx.MockTransport(fake), fixtures=recorder)
+    recorded = http.get_json(URL, params={"confmKey": "secret", "keyword": "효원로"})
+    http.close()
+    recorder.close()
+    assert recorder.stats()["recorded"] == 1
+    with open(path, "rb") as f:
+        assert b"secret" not in f.read()
+
+    # replay: transport 없이(=네트워크였다면 실패할 호스트) 기록된 응답 반환, 키가 달라도 같은 응답
+    replayer = HttpFixtures(path=path, mode=REPLAY)
+    ahttp = AsyncHttpClient(timeout_seconds=1.0, user_agent="t", fixtures=replayer)
+    try:
+        assert await ahttp.get_json(URL, params={"confmKey": "another", "keyword": "효원로"}) == recorded
+        # 기록에 없는 요청은 재시도/circuit 대상이 아닌 UpstreamError
+        with pytest.raises(UpstreamError) as exc:
+            await ahttp.get_json(URL, params={"confmKey": "another", "keyword": "없는길"})
+        assert not isinstance(exc.value, UpstreamUnavailableError)
+        assert replayer.stats() == {"recorded": 0, "replayed": 1, "misses": 1}
+        assert len(fake.calls) == 1
+    finally:
+        await ahttp.aclose()
+        replayer.close()
+
+
+def test_replay_latency_waits_for_recorded_duration(tmp_path):
+    fixtures = HttpFixtures(path=str(tmp_path / "f.sqlite3"), mode=REPLAY, replay_latency=True)
+    key = fixture_key(httpx.URL(URL, params={"keyword": "a"}))
+    fixtures.put(key, 200, b'{"ok": true}', elapsed_ms=50.0)
+    http = HttpClient(timeout_seconds=1.0, user_agent="t", fixtures=fixtures)
+    t0 = time.perf_counter()
+    assert http.get_json(URL, params={"keyword": "a"}) == {"ok": True}
+    assert time.perf_counter() - t0 >= 0.045
+    http.close()
+
+
+def test_container_replays_recorded_session(monkeypatch, tmp_path):
+    env = {"HTTP_FIXTURE_PATH": str(tmp_path / "f.sqlite3"), "HTTP_PREWARM": "false"}
+    live = make_container(monkeypatch, FakeJuso(total=1), HTTP_FIXTURE_MODE="record", **env)
+    expected = live.address_service.resolve(query="효원로 1", include_english=True).to_dict()
+    live.fixtures.close()
+
+    def offline(request: httpx.Request) -> httpx.Response:
+        raise AssertionError("replay must not reach the transport")
+
+    replay = make_container(monkeypatch, offline, HTTP_FIXTURE_MODE="replay", **env)
+    got = replay.address_service.resolve(query="효원로 1", include_english=True).to_dict()
+    assert got["best"] == expected["best"]
+    assert got["english"] == expected["english"]
+    assert replay.fixtures.stats()["misses"] == 0
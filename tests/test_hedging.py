@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from postcode_mcp.infra.hedging import Hedger, LatencyTracker
+from postcode_mcp.infra.http import AsyncHttpClient
+
+URL = "http://juso.test/addrLinkApi.do"
+
+
+def test_latency_tracker_percentiles():
+    tracker = LatencyTracker()
+    for ms in range(1, 101):
+        tracker.observe(ms / 1000)
+
+    assert tracker.percentile(0.5) == pytest.approx(0.051)
+    assert tracker.percentile(0.95) == pytest.approx(0.096)
+
+
+def _client(hedger: Hedger, slow_calls: set[int]):
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        n = calls
+        await asyncio.sleep(2.0 if n in slow_calls else 0.001)
+        return httpx.Response(200, json={"n": n})
+
+    return AsyncHttpClient(timeout_seconds=5.0, user_agent="t", transport=httpx.MockTransport(handler), hedger=hedger)
+
+
+@pytest.mark.asyncio
+async def test_slow_request_is_hedged_and_fast_answer_wins():
+    hedger = Hedger(max_ratio=0.5, min_delay_seconds=0.01, min_samples=5)
+    http = _client(hedger, slow_calls={6})
+    for _ in range(5):
+        await http.get_json(URL, params={})
+
+    started = asyncio.get_running_loop().time()
+    payload = await http.get_json(URL, params={})
+    elapsed = asyncio.get_running_loop().time() - started
+
+    assert payload == {"n": 7}  # hedge 요청이 응답
+    assert elapsed < 0.5
+    assert hedger.hedges == 1 and hedger.hedge_wins == 1
+    assert http.stats()["requests"] == 7
+
+
+@pytest.mark.asyncio
+async def test_hedge_share_is_capped():
+    hedger = Hedger(max_ratio=0.05, min_delay_seconds=0.01, min_samples=5)
+    http = _client(hedger, slow_calls=set())
+    for _ in range(5):
+        await http.get_json(URL, params={})
+
+    # 이후 모든 요청이 느려져도 hedge는 요청 수의 약 5%까지만
+    slow = _client(hedger, slow_calls=set(range(1, 1000)))
+    await asyncio.gather(*(asyncio.wait_for(slow.get_json(URL, params={}), 0.05) for _ in range(40)), return_exceptions=True)
+
+    assert 1 <= hedger.hedges <= 1 + 45 * 0.05
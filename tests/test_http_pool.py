@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import http.server
+import threading
+
+import httpx
+import pytest
+
+from postcode_mcp.infra.http import HttpClient
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_HEAD(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self) -> None:
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_prewarm_opens_idle_pooled_connection(local_server):
+    http = HttpClient(timeout_seconds=2.0, user_agent="t", limits=httpx.Limits(max_connections=4))
+    try:
+        assert http.pool_stats()["connections"] == 0
+        # 같은 origin의 endpoint 두 개 → 연결 하나
+        assert http.prewarm([f"{local_server}/a", f"{local_server}/b"]) == 1
+        stats = http.pool_stats()
+        assert stats["max_connections"] == 4
+        assert (stats["connections"], stats["idle"], stats["active"]) == (1, 1, 0)
+
+        # 실제 요청은 미리 맺은 연결을 재사용하고, prewarm은 호출 통계에 잡히지 않음
+        assert http.get_json(f"{local_server}/a", params={}) == {"ok": True}
+        assert http.pool_stats()["connections"] == 1
+        assert http.stats()["requests"] == 1
+    finally:
+        http.close()
+
+
+def test_prewarm_skips_mock_transport_and_http2_falls_back():
+    calls = []
+    transport = httpx.MockTransport(lambda r: calls.append(r) or httpx.Response(200, json={}))
+    # h2가 없는 환경이어도 생성 시 에러 없이 HTTP/1.1로 동작
+    http = HttpClient(timeout_seconds=1.0, user_agent="t", transport=transport, http2=True)
+
+    assert http.prewarm(["http://juso.test/api"]) == 0
+    assert calls == []
+    assert http.pool_stats() == {}
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import time
+
+import pytest
+from helpers import FakeJuso, make_container
+
+from postcode_mcp.infra.providers.juso_detail import DetailAddrRequest
+from postcode_mcp.infra.providers.juso_eng import EngAddrRequest
+from postcode_mcp.infra.providers.juso_local import LocalJusoIndex, ingest
+
+# 전체분 파일과 같은 형식('|' 구분, cp949)의 합성 데이터
+ROAD_ROWS = [
+    "41115131000112100024100000|4111514100|경기도|수원시 팔달구|인계동||0|1111|0|411153180008|효원로|0|241|0|4111556000|인계동|16490||20200101|0||수원시청|수원시청|",
+    "41115131000112100024300000|4111514100|경기도|수원시 팔달구|인계동||0|1112|3|411153180008|효원로|0|243|0|4111556000|인계동|16490||20200101|1||효원아파트|효원아파트|",
+]
+ENG_ROWS = [
+    "41115131000112100024100000|4111514100|Gyeonggi-do|Paldal-gu, Suwon-si|Ingye-dong||0|1111|0|411153180008|Hyowon-ro|0|241|0",
+]
+DETAIL_ROWS = [
+    "41115131000112100024300000|4111514100|경기도|수원시 팔달구|인계동||0|1112|3|411153180008|효원로|0|243|0|101동|1층|101호",
+    "41115131000112100024300000|4111514100|경기도|수원시 팔달구|인계동||0|1112|3|411153180008|효원로|0|243|0|101동|1층|102호",
+    "41115131000112100024300000|4111514100|경기도|수원시 팔달구|인계동||0|1112|3|411153180008|효원로|0|243|0|102동|1층|101호",
+]
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    files = {}
+    for name, rows in (("road", ROAD_ROWS), ("eng", ENG_ROWS), ("detail", DETAIL_ROWS)):
+        path = tmp_path / f"{name}.txt"
+        path.write_bytes(("\r\n".join(rows) + "\r\n").encode("cp949"))
+        files[name] = [str(path)]
+
+    db = str(tmp_path / "juso.sqlite3")
+    counts = ingest(
+        db, road_files=files["road"], eng_files=files["eng"], detail_files=files["detail"], batch_size=2
+    )
+    assert counts == {"road": 2, "eng": 1, "detail": 3}
+    return db
+
+
+def test_local_search_formats_like_juso(index_path):
+    index = LocalJusoIndex(index_path)
+
+    rows = index.search("경기 수원시 팔달구 효원로 241", limit=5)
+    assert [r["road_addr"] for r in rows] == ["경기도 수원시 팔달구 효원로 241 (인계동)"]
+    assert rows[0]["zip_no"] == "16490"
+    assert rows[0]["jibun_addr"] == "경기도 수원시 팔달구 인계동 1111"
+    assert rows[0]["eng_road_addr"] == "241 Hyowon-ro, Paldal-gu, Suwon-si, Gyeonggi-do"
+
+    # 공동주택은 참고항목에 건물명 포함, 건물명/지번으로도 조회
+    assert index.search("효원아파트", limit=5)[0]["road_addr"] == "경기도 수원시 팔달구 효원로 243 (인계동, 효원아파트)"
+    assert index.search("수원시 팔달구 인계동 1112-3", limit=5)
+
+    started = time.perf_counter()
+    for _ in range(1000):
+        index.search("효원로 241", limit=5)
+    assert (time.perf_counter() - started) / 1000 < 0.001
+
+
+def test_local_detail_lookup(index_path):
+    index = LocalJusoIndex(index_path)
+    req = DetailAddrRequest(admCd="4111514100", rnMgtSn="411153180008", udrtYn="0", buldMnnm="243", buldSlno="0")
+
+    assert index.detail(req) == [{"dongNm": "101동"}, {"dongNm": "102동"}]
+    floorho = DetailAddrRequest(**{**req.__dict__, "searchType": "floorho", "dongNm": "101동"})
+    assert [d["hoNm"] for d in index.detail(floorho)] == ["101호", "102호"]
+
+
+def test_reingest_does_not_duplicate_detail_rows(index_path):
+    detail_file = os.path.join(os.path.dirname(index_path), "detail.txt")
+    ingest(index_path, detail_files=[detail_file])
+
+    with sqlite3.connect(index_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM detail").fetchone()[0] == 3
+
+
+def test_reingest_replaces_search_keys_of_changed_roads(index_path, tmp_path):
+    # 월별 갱신분: 241번 건물의 도로명이 효원로 → 인계로로 변경
+    updated = tmp_path / "road_update.txt"
+    updated.write_bytes((ROAD_ROWS[0].replace("효원로", "인계로") + "\r\n").encode("cp949"))
+    ingest(index_path, road_files=[str(updated)])
+
+    index = LocalJusoIndex(index_path)
+    assert [r["road_addr"] for r in index.search("인계로 241", limit=5)] == ["경기도 수원시 팔달구 인계로 241 (인계동)"]
+    assert index.search("효원로 241", limit=5) == []
+    # 바뀌지 않은 주소와 지번 key는 그대로
+    assert index.search("효원로 243", limit=5)
+    assert index.search("수원시 팔달구 인계동 1111", limit=5)
+
+
+@pytest.mark.asyncio
+async def test_container_uses_local_index_then_falls_back(monkeypatch, index_path):
+    fake = FakeJuso(total=1)
+    container = make_container(monkeypatch, fake, JUSO_LOCAL_DB=index_path)
+    svc = container.address_service
+
+    local = await svc.aresolve(query="경기도 수원시 팔달구 효원로 241", include_english=True)
+    assert local.best["postcode5"] == "16490"
+    assert local.english["best"]["road_addr"] == "241 Hyowon-ro, Paldal-gu, Suwon-si, Gyeonggi-do"
+    apt = await svc.aresolve(query="효원아파트", include_detail=True)
+    assert [it["dongNm"] for it in apt.detail["items"]] == ["101동", "102동"]
+    assert fake.calls == []
+
+    remote = await svc.aresolve(query="서울 강남구 테헤란로 142")
+    assert remote.best is not None
+    assert len(fake.calls) == 1
+
+    eng = await container.juso_english.asearch(EngAddrRequest(keyword="효원로 241"))
+    assert eng["results"]["juso"][0]["zipNo"] == "16490"
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from postcode_mcp.app.loadtest import UpstreamProfile, compare, percentile, run_loadtest
+
+
+@pytest.mark.asyncio
+async def test_loadtest_drives_tools_over_http_against_fake_upstream(monkeypatch, tmp_path):
+    monkeypatch.setenv("HTTP_PREWARM", "false")
+
+    report = await run_loadtest(
+        tools=("normalize_address", "resolve_postcode_auto"),
+        requests=12,
+        concurrency=3,
+        distinct_queries=4,
+        profile=UpstreamProfile(latency_ms=1.0, latency_sigma=0.0, seed=1),
+    )
+
+    normalize, resolve = report.tools
+    assert (normalize.requests, normalize.errors) == (12, 0)
+    # 검색어 4개 → 나머지는 캐시/single-flight로 처리
+    assert normalize.upstream_calls == {"addrLinkApi.do": 4}
+    assert resolve.upstream_calls == {"addrDetailApi.do": 4, "addrEngApi.do": 4, "addrLinkApi.do": 4}
+    assert 0 < normalize.latency_ms["p50"] <= normalize.latency_ms["p99"] <= normalize.latency_ms["max"]
+    assert normalize.throughput_rps > 0
+    assert "juso_road_key" not in report.config["settings"]
+
+    path = tmp_path / "results.json"
+    report.save(str(path))
+    saved = json.loads(path.read_text(encoding="utf-8"))
+    assert saved["tools"][0]["tool"] == "normalize_address"
+    assert compare(saved, saved) == []
+
+
+def test_compare_flags_latency_throughput_and_upstream_regressions():
+    def report(p95: float, rps: float, calls: float) -> dict:
+        latency = {"p50": 10.0, "p95": p95, "p99": p95}
+        return {"tools": [{"tool": "t", "latency_ms": latency, "throughput_rps": rps, "upstream_calls_per_request": calls}]}
+
+    assert compare(report(52.0, 95.0, 1.0), report(50.0, 100.0, 1.0)) == []
+    regressions = compare(report(80.0, 60.0, 2.0), report(50.0, 100.0, 1.0))
+    assert len(regressions) == 4  # p95, p99, throughput, upstream calls
+    assert percentile([1.0, 2.0, 3.0, 4.0], 0.5) == 2.0
+    assert percentile([1.0, 2.0, 3.0, 4.0], 0.99) == 4.0
@@ -0,0 +1,127 @@
+"""
+캐시 엔트리 메모리 벤치마크: 원본 layout(JSON dict / dict 기반 dataclass) vs compact layout, 20k 엔트리.
+  python -m pytest tests/test_memory_layout.py -s  → 엔트리당 byte 수 출력
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import pickle
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from helpers import juso_item
+
+from postcode_mcp.core.models import AddressCandidate
+from postcode_mcp.infra.compact import Record, compact, plain
+from postcode_mcp.infra.providers.juso import _SearchEntry, _to_candidate
+from postcode_mcp.infra.providers.juso_eng import _INTERN_FIELDS, JusoEnglishProvider
+
+N = 20_000
+
+# 변경 전 AddressCandidate (slots 없는 frozen dataclass)
+_DictCandidate = dataclasses.make_dataclass(
+    "_DictCandidate", [(f.name, f.type, f) for f in dataclasses.fields(AddressCandidate)], frozen=True
+)
+
+
+def _eng_response(n: int) -> str:
+    """addrEngApi 응답 1건 (JSON 텍스트: 파싱할 때마다 새 문자열 객체가 생기는 실제 상황과 같게)."""
+    item = {
+        "roadAddr": f"{n % 300 + 1}, Hyowon-ro {n % 50}beon-gil, Paldal-gu, Suwon-si, Gyeonggi-do",
+        "jibunAddr": f"{n}-3, Ingye-dong, Paldal-gu, Suwon-si, Gyeonggi-do",
+        "zipNo": f"16{n % 40:03d}",
+        "admCd": f"41115141{n % 20:02d}",
+        "rnMgtSn": f"4111531800{n % 60:02d}",
+        "bdMgtSn": f"4111514100{n:015d}",
+        "bdKdcd": "0",
+        "siNm": "Gyeonggi-do",
+        "sggNm": "Paldal-gu, Suwon-si",
+        "emdNm": "Ingye-dong",
+        "liNm": "",
+        "rn": f"Hyowon-ro {n % 50}beon-gil",
+        "emdNo": "01",
+        "udrtYn": "0",
+        "buldMnnm": str(n % 300 + 1),
+        "buldSlno": "0",
+        "mtYn": "0",
+        "lnbrMnnm": str(n % 900),
+        "lnbrSlno": "3",
+        "korAddr": f"경기도 수원시 팔달구 효원로{n % 50}번길 {n % 300 + 1}",
+    }
+    common = {"errorCode": "0", "errorMessage": "정상", "totalCount": "1", "currentPage": "1", "countPerPage": "5"}
+    return json.dumps({"results": {"common": common, "juso": [item]}}, ensure_ascii=False)
+
+
+def _bytes_per_entry(build: Callable[[int], Any]) -> float:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        entries = [build(i) for i in range(N)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert len(entries) == N
+    return (after - before) / N
+
+
+def test_english_payload_layout_is_3x_smaller():
+    texts = [_eng_response(i) for i in range(N)]
+    raw = _bytes_per_entry(lambda i: json.loads(texts[i]))
+    packed = _bytes_per_entry(lambda i: compact(json.loads(texts[i]), intern_keys=_INTERN_FIELDS))
+    print(f"english: dict {raw:.0f} B/entry, compact {packed:.0f} B/entry ({raw / packed:.1f}x)")
+    assert raw / packed >= 3
+
+
+def test_search_entry_layout_is_smaller():
+    texts = [
+        json.dumps(juso_item(i % 300 + 1, bdMgtSn=f"{i:025d}", jibunAddr=f"경기도 수원시 팔달구 인계동 {i}-3"))
+        for i in range(N)
+    ]
+
+    def dict_entry(i: int) -> _SearchEntry:
+        # 변경 전: 파싱된 문자열 그대로(intern 없음) + dict 기반 dataclass
+        it = json.loads(texts[i])
+        candidate = _DictCandidate(
+            road_addr=it["roadAddr"],
+            jibun_addr=it["jibunAddr"],
+            postcode5=it["zipNo"],
+            building_name=it["bdNm"],
+            confidence=1.0,
+            admCd=it["admCd"],
+            rnMgtSn=it["rnMgtSn"],
+            udrtYn=it["udrtYn"],
+            buldMnnm=it["buldMnnm"],
+            buldSlno=it["buldSlno"],
+            bdMgtSn=it["bdMgtSn"],
+            engAddr=it["engAddr"],
+        )
+        return _SearchEntry((candidate,), 1, True, 10, 1)
+
+    def slotted_entry(i: int) -> _SearchEntry:
+        return _SearchEntry((_to_candidate(json.loads(texts[i])),), 1, True, 10, 1)
+
+    before = _bytes_per_entry(dict_entry)
+    after = _bytes_per_entry(slotted_entry)
+    print(f"search: dict {before:.0f} B/entry, slotted {after:.0f} B/entry ({before / after:.1f}x)")
+    assert after < before
+
+
+def test_compact_record_reads_like_the_original_payload():
+    payload = json.loads(_eng_response(7))
+    packed = compact(payload, intern_keys=_INTERN_FIELDS)
+
+    assert isinstance(packed["results"], Record)
+    assert plain(packed) == payload
+    common, items = JusoEnglishProvider.extract_items(packed)
+    assert common == payload["results"]["common"] and type(common) is dict
+    # 후보의 _raw는 복사 없이 캐시의 Record 그대로, 응답으로 내보낼 때만 dict로
+    raw = JusoEnglishProvider.normalize_item(items[0])["_raw"]
+    assert raw is items[0]
+    assert plain({"best": {"_raw": raw}}) == {"best": {"_raw": payload["results"]["juso"][0]}}
+    # 같은 key 구성의 Record끼리 key 표를 공유
+    other = compact(json.loads(_eng_response(8)), intern_keys=_INTERN_FIELDS)
+    assert other["results"]["juso"][0]._index() is items[0]._index()
+    assert pickle.loads(pickle.dumps(packed)) == packed
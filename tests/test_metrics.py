@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import json
+import logging
+
+import httpx
+import pytest
+from fastmcp import Client, FastMCP
+from helpers import FakeJuso, make_container
+
+from postcode_mcp.app.metrics import render_metrics
+from postcode_mcp.app.middleware import MetricsMiddleware, SlowRequestLog
+from postcode_mcp.tools.postcode_tools import register_postcode_tools
+
+
+def _mcp(container) -> FastMCP:
+    mcp = FastMCP("postcode-mcp-test")
+    register_postcode_tools(mcp, container)
+    mcp.add_middleware(MetricsMiddleware(container.tool_metrics))
+    return mcp
+
+
+def _samples(text: str) -> dict[str, float]:
+    return {
+        line.rsplit(" ", 1)[0]: float(line.rsplit(" ", 1)[1])
+        for line in text.splitlines()
+        if line and not line.startswith("#")
+    }
+
+
+@pytest.mark.asyncio
+async def test_metrics_cover_tools_upstream_and_cache(monkeypatch):
+    fake = FakeJuso(total=1)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("addrEngApi.do"):
+            return httpx.Response(503)
+        return fake(request)
+
+    container = make_container(monkeypatch, handler, HTTP_MAX_ATTEMPTS="1")
+    args = {"query": "효원로 1", "include_detail": False}
+    async with Client(_mcp(container)) as client:
+        await client.call_tool("resolve_postcode_auto", args)
+        await client.call_tool("resolve_postcode_auto", args)
+
+    text = render_metrics(container)
+    samples = _samples(text)
+
+    assert "# TYPE postcode_tool_duration_seconds histogram" in text
+    assert samples['postcode_tool_duration_seconds_count{tool="resolve_postcode_auto"}'] == 2
+    assert samples['postcode_tool_duration_seconds_bucket{tool="resolve_postcode_auto",le="+Inf"}'] == 2
+    assert samples["postcode_tool_in_flight"] == 0
+
+    assert samples['postcode_upstream_duration_seconds_count{client="async",endpoint="addrLinkApi.do"}'] == 1
+    assert samples['postcode_upstream_errors_total{client="async",endpoint="addrEngApi.do"}'] == 2
+
+    # 두 번째 호출의 검색은 캐시 hit, 영문은 실패 응답이라 캐시되지 않음
+    assert samples['postcode_cache_hits_total{namespace="juso:"}'] == 1
+    assert samples['postcode_cache_misses_total{namespace="juso:"}'] == 1
+    assert samples['postcode_cache_misses_total{namespace="juso:road:"}'] == 2
+    assert samples['postcode_cache_entries{tier="l1"}'] == 1
+    assert samples['postcode_circuit_state{provider="english"}'] == 0
+
+
+@pytest.mark.asyncio
+async def test_timings_and_slow_request_log(monkeypatch, caplog):
+    container = make_container(monkeypatch, FakeJuso(total=1))
+    mcp = FastMCP("postcode-mcp-test")
+    register_postcode_tools(mcp, container)
+    mcp.add_middleware(MetricsMiddleware(container.tool_metrics, SlowRequestLog(threshold_ms=0.001)))
+    args = {"query": "효원로 1", "include_detail": False, "include_timings": True}
+
+    with caplog.at_level(logging.WARNING, logger="postcode_mcp.slow_request"):
+        async with Client(mcp) as client:
+            first = (await client.call_tool("resolve_postcode_auto", args)).structured_content
+            second = (await client.call_tool("resolve_postcode_auto", args)).structured_content
+
+    timings = first["meta"]["timings"]
+    assert timings["search"]["cache"] == "miss"
+    assert timings["english"]["cache"] == "miss"
+    for name in ("kakao.validate", "search", "search.fetch", "search.rank", "english", "english.fetch", "serialize", "total"):
+        assert timings[name]["ms"] >= 0
+    # 두 번째 호출은 캐시 hit이라 upstream fetch span이 없음
+    assert second["meta"]["timings"]["search"]["cache"] == "hit"
+    assert "search.fetch" not in second["meta"]["timings"]
+
+    records = [json.loads(r.getMessage()) for r in caplog.records if r.name == "postcode_mcp.slow_request"]
+    assert len(records) == 2
+    assert records[0]["event"] == "slow_request"
+    assert records[0]["tool"] == "resolve_postcode_auto"
+    assert records[0]["attempts"] == 2
+    assert records[0]["timings"]["search"]["cache"] == "miss"
+    assert "효원로" not in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_concurrent_resolves_report_their_own_attempts(monkeypatch, caplog):
+    fake = FakeJuso(total=1)
+    failures = {"효원로 1": 2}  # 이 주소만 2번 실패 후 성공 (재시도 2회)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        keyword = request.url.params.get("keyword", "")
+        for addr, left in failures.items():
+            if keyword.endswith(addr) and left:
+                failures[addr] -= 1
+                return httpx.Response(503)
+        return fake(request)
+
+    container = make_container(
+        monkeypatch, handler, HTTP_RETRY_BASE_DELAY_SECONDS="0.001", HTTP_RETRY_MAX_DELAY_SECONDS="0.001"
+    )
+    mcp = FastMCP("postcode-mcp-test")
+    register_postcode_tools(mcp, container)
+    mcp.add_middleware(MetricsMiddleware(container.tool_metrics, SlowRequestLog(threshold_ms=0.001)))
+    places = [
+        {"place_name": "A", "road_address_name": "경기 수원시 팔달구 효원로 1"},
+        {"place_name": "B", "road_address_name": "경기 수원시 팔달구 효원로 2"},
+    ]
+
+    with caplog.at_level(logging.WARNING, logger="postcode_mcp.slow_request"):
+        async with Client(mcp) as client:
+            res = await client.call_tool(
+                "resolve_from_kakao_places",
+                {"kakao_places": places, "include_detail": False, "include_english": False},
+            )
+
+    # item별 meta는 자기 조회의 시도 수만, tool 전체(slow log)는 합계
+    items = res.data["items"]
+    assert items[0]["meta"]["attempts"] == {"total": 3, "retries": 2}
+    assert items[1]["meta"]["attempts"] == {"total": 1, "retries": 0}
+    records = [json.loads(r.getMessage()) for r in caplog.records if r.name == "postcode_mcp.slow_request"]
+    assert records[0]["attempts"] == 4 and records[0]["retries"] == 2
+
+
+def test_slow_request_log_threshold_and_sampling():
+    from postcode_mcp.core.trace import RequestTrace
+
+    assert not SlowRequestLog(threshold_ms=0).observe("t", 10.0, RequestTrace(), error=False)
+    log = SlowRequestLog(threshold_ms=100, sample_rate=0.5, rng=iter([0.9, 0.1]).__next__)
+    assert not log.observe("t", 0.05, RequestTrace(), error=False)
+    assert not log.observe("t", 0.2, RequestTrace(), error=False)  # 샘플링에서 제외
+    assert log.observe("t", 0.2, RequestTrace(), error=True)
+
+
+@pytest.mark.asyncio
+async def test_metrics_scrape_does_not_build_the_container():
+    import postcode_mcp.server as server
+
+    app = server.mcp.http_app()
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        res = await client.get("/metrics")
+
+    assert res.status_code == 200
+    # 첫 tool 호출 전: tool 통계만 내고 HTTP 클라이언트/provider/캐시는 만들지 않음
+    assert "postcode_tool_in_flight 0" in res.text
+    assert "postcode_cache_" not in res.text
+    assert not server._container.built
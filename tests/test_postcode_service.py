@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import time
+
+from postcode_mcp.core.models import AddressCandidate
+from postcode_mcp.services.postcode_service import PostcodeService
+
+
+class _StaticJuso:
+    def __init__(self, candidates: list[AddressCandidate]) -> None:
+        self._candidates = candidates
+
+    def search(self, keyword: str, *, max_results: int | None = None) -> list[AddressCandidate]:
+        return list(self._candidates)
+
+
+def _c(road: str, jibun: str | None = None, building: str | None = None) -> AddressCandidate:
+    return AddressCandidate(road_addr=road, jibun_addr=jibun, postcode5="00000", building_name=building, confidence=1.0)
+
+
+def test_rank_prefers_closest_match_and_fills_confidence():
+    svc = PostcodeService(
+        juso=_StaticJuso(
+            [
+                _c("서울특별시 강남구 테헤란로 142", "서울특별시 강남구 역삼동 737"),
+                _c("경기도 수원시 팔달구 효원로 241", "경기도 수원시 팔달구 인계동 1111", "수원시청"),
+            ]
+        )
+    )
+
+    res = svc.resolve(query="수원시청", max_candidates=2)
+
+    assert res.best is not None and res.best.building_name == "수원시청"
+    assert res.best.confidence == 1.0
+    assert 0.0 <= res.candidates[1].confidence < res.best.confidence
+
+
+def test_rank_applies_hint_city_penalty():
+    svc = PostcodeService(
+        juso=_StaticJuso([_c("서울특별시 중구 세종대로 110"), _c("경기도 수원시 팔달구 효원로 241")])
+    )
+
+    res = svc.resolve(query="시청", hint_city="수원", max_candidates=2)
+
+    assert res.best is not None and "수원" in res.best.road_addr
+    assert res.candidates[1].confidence <= res.best.confidence * 0.5 + 1e-9
+
+
+def test_rank_is_cheap_for_many_candidates():
+    many = [_c(f"경기도 수원시 팔달구 효원로 {i}", f"경기도 수원시 팔달구 인계동 {i}", f"건물{i}") for i in range(300)]
+    svc = PostcodeService(juso=_StaticJuso(many))
+
+    started = time.perf_counter()
+    res = svc.resolve(query="효원로 241", max_candidates=5)
+    elapsed = time.perf_counter() - started
+
+    assert res.best is not None and res.best.road_addr.endswith("효원로 241")
+    assert elapsed < 0.05
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import pytest
+from helpers import juso_payload
+
+from postcode_mcp.infra.http import AsyncHttpClient, HttpClient
+from postcode_mcp.infra.ratelimit import AdaptiveConcurrency, Outcome, RateLimiter
+
+
+def test_token_bucket_queues_instead_of_failing():
+    limiter = RateLimiter(rate_per_second=50, burst=5, max_concurrency=8)
+    http = HttpClient(
+        timeout_seconds=1.0,
+        user_agent="test",
+        transport=httpx.MockTransport(lambda r: httpx.Response(200, json=juso_payload([]))),
+        limiter=limiter,
+    )
+
+    started = time.monotonic()
+    for _ in range(15):
+        http.get_json("http://juso.test/addrLinkApi.do", params={"confmKey": "a"})
+    elapsed = time.monotonic() - started
+
+    # burst 5개 이후 10개는 50/s로 → 약 0.2s
+    assert 0.15 <= elapsed < 1.0
+    assert http.stats() == {"requests": 15, "retries": 0, "errors": 0}
+
+
+def test_aimd_backs_off_and_recovers():
+    conc = AdaptiveConcurrency(initial=8, min_limit=1, max_limit=8)
+
+    conc.acquire_sync()
+    conc.release(Outcome.OVERLOAD)
+    assert conc.limit == 4
+    # cooldown 안의 연속 과부하는 한 번만 반영
+    conc.acquire_sync()
+    conc.release(Outcome.OVERLOAD)
+    assert conc.limit == 4
+
+    for _ in range(30):
+        conc.acquire_sync()
+        conc.release(Outcome.OK)
+    assert 7 < conc.limit <= 8
+
+
+@pytest.mark.asyncio
+async def test_async_concurrency_is_capped_per_endpoint_and_key():
+    limiter = RateLimiter(rate_per_second=0, burst=1, max_concurrency=3)
+    in_flight = peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        code = "-999" if request.url.params["confmKey"] == "busy" else "0"
+        return httpx.Response(200, json=juso_payload([], error_code=code))
+
+    http = AsyncHttpClient(
+        timeout_seconds=1.0, user_agent="test", transport=httpx.MockTransport(handler), limiter=limiter
+    )
+    await asyncio.gather(
+        *(http.get_json("http://juso.test/addrLinkApi.do", params={"confmKey": "a"}) for _ in range(12))
+    )
+    assert peak == 3
+
+    await http.get_json("http://juso.test/addrLinkApi.do", params={"confmKey": "busy"})
+    stats = limiter.stats()
+    assert len(stats) == 2
+    busy = next(s for s in stats.values() if s["overloads"])
+    assert busy["concurrency_limit"] == 1.5 and busy["decreases"] == 1
+    assert "busy" not in "".join(stats)
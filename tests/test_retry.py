@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+from helpers import FakeJuso, make_container
+
+from postcode_mcp.core.errors import UpstreamError
+from postcode_mcp.infra.http import HttpClient
+from postcode_mcp.infra.retry import RetryBudget, RetryPolicy
+
+_FAST = RetryPolicy(max_attempts=3, base_delay_seconds=0.001, max_delay_seconds=0.002)
+
+
+def _flaky(fail_times: int, error: Exception | int):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) <= fail_times:
+            if isinstance(error, int):
+                return httpx.Response(error)
+            raise error
+        return httpx.Response(200, json={"ok": True})
+
+    return handler, calls
+
+
+@pytest.mark.parametrize(
+    "error",
+    [httpx.ConnectError("reset"), httpx.ReadTimeout("slow"), 503],
+)
+def test_retryable_failures_are_retried(error):
+    handler, calls = _flaky(2, error)
+    http = HttpClient(timeout_seconds=1.0, user_agent="t", transport=httpx.MockTransport(handler), retry=_FAST)
+
+    assert http.get_json("http://juso.test/api", params={}) == {"ok": True}
+    assert len(calls) == 3
+    assert http.stats() == {"requests": 3, "retries": 2, "errors": 2}
+
+
+def test_non_retryable_failure_is_not_retried():
+    handler, calls = _flaky(1, 404)
+    http = HttpClient(timeout_seconds=1.0, user_agent="t", transport=httpx.MockTransport(handler), retry=_FAST)
+
+    with pytest.raises(UpstreamError):
+        http.get_json("http://juso.test/api", params={})
+    assert len(calls) == 1
+
+
+def test_retry_budget_caps_amplification():
+    handler, calls = _flaky(10_000, 503)
+    budget = RetryBudget(ratio=0.1, max_tokens=2)
+    http = HttpClient(
+        timeout_seconds=1.0,
+        user_agent="t",
+        transport=httpx.MockTransport(handler),
+        retry=_FAST,
+        retry_budget=budget,
+    )
+
+    for _ in range(50):
+        with pytest.raises(UpstreamError):
+            http.get_json("http://juso.test/api", params={})
+
+    # 장애 중: 최초 2토큰 + 요청당 0.1토큰 → 재시도는 요청 수의 약 10%
+    assert http.stats()["retries"] <= 2 + 50 * 0.1
+    assert len(calls) < 50 * 1.2
+    assert budget.exhausted > 0
+
+
+@pytest.mark.asyncio
+async def test_attempts_are_reported_in_meta(monkeypatch):
+    fake = FakeJuso(total=1)
+    failed = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if not failed:
+            failed.append(request)
+            raise httpx.ConnectError("connection reset")
+        return fake(request)
+
+    container = make_container(
+        monkeypatch, handler, HTTP_RETRY_BASE_DELAY_SECONDS="0.001", HTTP_RETRY_MAX_DELAY_SECONDS="0.001"
+    )
+    first = await container.address_service.aresolve(query="효원로 1", max_candidates=1)
+    second = await container.address_service.aresolve(query="효원로 1", max_candidates=1)
+
+    assert first.best is not None
+    assert first.meta["attempts"] == {"total": 2, "retries": 1}
+    # 캐시 hit → upstream 시도 없음
+    assert second.meta["attempts"] == {"total": 0, "retries": 0}
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+from helpers import FakeJuso
+
+from postcode_mcp.core.errors import UpstreamError
+from postcode_mcp.infra.cache import Cache
+from postcode_mcp.infra.http import AsyncHttpClient, HttpClient
+from postcode_mcp.infra.providers.juso import JusoProvider
+from postcode_mcp.infra.singleflight import SingleFlight
+
+
+def _provider(handler) -> JusoProvider:
+    return JusoProvider(
+        http=HttpClient(timeout_seconds=1.0, user_agent="test", transport=httpx.MockTransport(handler)),
+        async_http=AsyncHttpClient(timeout_seconds=1.0, user_agent="test", transport=httpx.MockTransport(handler)),
+        confm_key="k",
+        count_per_page=10,
+        first_sort="none",
+        add_info_yn="Y",
+        cache=Cache(maxsize=100, ttl_seconds=60),
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_upstream_call():
+    fake = FakeJuso(total=2)
+
+    async def slow(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05)
+        return fake(request)
+
+    juso = _provider(slow)
+    results = await asyncio.gather(*(juso.asearch("효원로", max_results=2) for _ in range(20)))
+
+    assert len(fake.calls) == 1
+    assert all(len(r) == 2 for r in results)
+    assert juso.singleflight.stats() == {"leaders": 1, "coalesced": 19, "in_flight": 0}
+
+
+@pytest.mark.asyncio
+async def test_waiters_receive_leader_error():
+    async def failing(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05)
+        return httpx.Response(503)
+
+    juso = _provider(failing)
+    results = await asyncio.gather(
+        *(juso.asearch("효원로") for _ in range(5)), return_exceptions=True
+    )
+
+    assert all(isinstance(r, UpstreamError) for r in results)
+    assert juso.singleflight.stats()["coalesced"] == 4
+
+
+def test_do_sync_coalesces_threads():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fn() -> int:
+        calls.append(1)
+        release.wait(1.0)
+        return 42
+
+    out: list[int] = []
+    threads = [threading.Thread(target=lambda: out.append(flight.do_sync("k", fn))) for _ in range(5)]
+    for t in threads:
+        t.start()
+    while flight.stats()["leaders"] + flight.stats()["coalesced"] < 5:
+        pass
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert out == [42] * 5
+    assert len(calls) == 1
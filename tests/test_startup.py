@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+from fastmcp import Client, FastMCP
+from helpers import FakeJuso, make_container
+
+from postcode_mcp.app.container import LazyContainer
+from postcode_mcp.app.startup import measure_startup
+from postcode_mcp.tools.postcode_tools import register_postcode_tools
+
+
+@pytest.mark.asyncio
+async def test_lazy_container_is_built_once_on_first_tool_call(monkeypatch):
+    builds = []
+    lock = threading.Lock()
+
+    def factory():
+        with lock:
+            builds.append(1)
+        return make_container(monkeypatch, FakeJuso(total=1))
+
+    lazy = LazyContainer(factory)
+    mcp = FastMCP("postcode-mcp-test")
+    register_postcode_tools(mcp, lazy)
+
+    async with Client(mcp) as client:
+        assert len(await client.list_tools()) == 7
+        assert not lazy.built
+        result = await client.call_tool("normalize_address", {"query": "효원로 1"})
+        assert result.structured_content["normalized"] is not None
+
+    threads = [threading.Thread(target=lazy.get) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert lazy.built and len(builds) == 1
+
+
+def test_server_startup_defers_heavy_work():
+    # 시간 예산(startup_ms)은 부하에 따라 흔들리므로 여기서는 구조만 확인
+    # (예산 검사는 python -m postcode_mcp startup-bench)
+    result = measure_startup(runs=1)
+
+    assert result["tools"] == 7
+    # tools/list까지 HTTP 클라이언트/provider를 만들거나 rapidfuzz를 읽지 않음
+    assert result["container_built"] is False
+    assert "rapidfuzz" not in result["loaded"]
+    # warm-up/Prometheus 렌더링/provider 모듈도 쓰일 때 import
+    assert not {"postcode_mcp.app.metrics", "postcode_mcp.app.warmup", "postcode_mcp.infra.providers.juso_eng"} & set(
+        result["loaded"]
+    )
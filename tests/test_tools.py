@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+from fastmcp import Client, FastMCP
+from helpers import FakeJuso, juso_payload, make_container
+
+from postcode_mcp.tools.postcode_tools import register_postcode_tools
+
+
+def _mcp(container) -> FastMCP:
+    mcp = FastMCP("postcode-mcp-test")
+    register_postcode_tools(mcp, container)
+    return mcp
+
+
+@pytest.mark.asyncio
+async def test_kakao_places_keeps_order_and_dedupes(monkeypatch):
+    fake = FakeJuso(total=1)
+    container = make_container(monkeypatch, fake, KAKAO_PLACES_CONCURRENCY="2")
+    places = [
+        {"place_name": "A", "road_address_name": "경기 수원시 팔달구 효원로 1"},
+        {"place_name": "B", "road_address_name": "경기 수원시 팔달구 효원로 2"},
+        {"place_name": "C", "road_address_name": "경기 수원시 팔달구 효원로 1"},
+        {"place_name": "D"},
+    ]
+
+    async with Client(_mcp(container)) as client:
+        res = await client.call_tool(
+            "resolve_from_kakao_places",
+            {"kakao_places": places, "include_detail": False, "include_english": False},
+        )
+
+    items = res.data["items"]
+    assert [it["kakao_place"]["place_name"] for it in items] == ["A", "B", "C", "D"]
+    assert items[0]["normalized"] == items[2]["normalized"]
+    assert items[3]["meta"]["strategy"] == "kakao_place_no_address"
+    # 고유 주소 2개만 upstream 조회
+    assert len(fake.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_normalize_addresses_batch_dedupes_and_isolates_errors(monkeypatch):
+    fake = FakeJuso(total=1)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("keyword") == "broken":
+            fake.calls.append((request.url.path, dict(request.url.params)))
+            return httpx.Response(200, json=juso_payload([], error_code="E0001"))
+        return fake(request)
+
+    container = make_container(monkeypatch, handler, BATCH_CONCURRENCY="2")
+    queries = ["효원로 241", "  효원로   241 ", "broken", "", "효원로 ２４１", "인계동 1111"]
+
+    async with Client(_mcp(container)) as client:
+        res = await client.call_tool("normalize_addresses_batch", {"queries": queries})
+
+    items = res.data["items"]
+    assert [it["index"] for it in items] == list(range(len(queries)))
+    assert [it["query"] for it in items] == queries
+    assert items[0]["normalized"] == items[1]["normalized"] == items[4]["normalized"]
+    assert items[0]["error"] is None and items[5]["normalized"] is not None
+    assert items[2]["error"]["errorCode"] == "UPSTREAM_ERROR"
+    assert items[3]["error"]["errorCode"] == "EMPTY_QUERY"
+    assert res.data["meta"] == {**res.data["meta"], "total": 6, "unique": 3, "errors": 2}
+    # 고유 검색어 3개만 upstream 조회
+    assert len(fake.calls) == 3
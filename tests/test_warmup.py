@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+from helpers import FakeJuso, make_container
+
+from postcode_mcp.app.metrics import render_metrics
+from postcode_mcp.app.warmup import WarmUp, export_snapshot, load_snapshot
+from postcode_mcp.infra.cache import Cache
+from postcode_mcp.infra.providers.juso import JUSO_API_URL
+from postcode_mcp.infra.providers.juso_detail import DetailAddrRequest
+from postcode_mcp.infra.providers.juso_eng import EngAddrRequest
+from postcode_mcp.infra.ratelimit import Outcome
+
+DETAIL = DetailAddrRequest(admCd="4111", rnMgtSn="1", udrtYn="0", buldMnnm="1", buldSlno="0")
+
+
+def test_hot_keys_are_ranked_by_hits_and_dropped_on_eviction():
+    cache = Cache(maxsize=2, ttl_seconds=60)
+    cache.set("juso:v2:a:none", 1)
+    cache.set("juso:v2:b:none", 2)
+    cache.get("juso:v2:a:none")
+    for _ in range(3):
+        cache.get("juso:v2:b:none")
+    assert cache.hot_keys(5) == [("juso:v2:b:none", 4), ("juso:v2:a:none", 2)]
+
+    cache.set("juso:v2:c:none", 3)  # L1 용량 초과 → 가장 오래 안 쓴 a가 밀려남
+    assert [key for key, _ in cache.hot_keys(5)] == ["juso:v2:b:none", "juso:v2:c:none"]
+    assert cache.peek("juso:v2:b:none") and not cache.peek("juso:v2:a:none")
+
+
+def test_snapshot_round_trip_keeps_carried_keys(tmp_path):
+    cache = Cache(maxsize=10, ttl_seconds=60)
+    cache.set("juso:v2:a:none", 1)
+    cache.get("juso:v2:a:none")
+    path = str(tmp_path / "snap" / "hot.json")
+
+    assert export_snapshot(cache, path, top_n=10, carry=[("juso:v2:b:none", 7), ("juso:v2:a:none", 1)]) == 2
+    assert load_snapshot(path) == [("juso:v2:b:none", 7), ("juso:v2:a:none", 2)]
+    assert load_snapshot(str(tmp_path / "missing.json")) == []
+
+    (tmp_path / "bad.json").write_text(json.dumps({"version": 99, "keys": []}))
+    assert load_snapshot(str(tmp_path / "bad.json")) == []
+
+
+@pytest.mark.asyncio
+async def test_warm_up_refills_cache_from_previous_snapshot(monkeypatch, tmp_path):
+    path = str(tmp_path / "hot.json")
+    before = make_container(monkeypatch, FakeJuso(total=2))
+    await before.juso.asearch("효원로 1")
+    await before.juso_english.asearch(EngAddrRequest(keyword="Hyowon-ro 1"))
+    await before.juso_detail.asearch(DETAIL)
+    await before.juso_detail.asearch(DETAIL)
+    before.cache.set("kakao:unknown", {})  # provider로 다시 만들 수 없는 key
+    export_snapshot(before.cache, path, top_n=10)
+
+    # 재배포 후: 빈 캐시
+    fake = FakeJuso(total=2)
+    after = make_container(monkeypatch, fake)
+    warmup = WarmUp(rate_per_second=0)
+    result = await warmup.run(after, load_snapshot(path))
+
+    assert result == {"total": 4, "done": 4, "warmed": 3, "skipped": 1, "failed": 0, "running": False}
+    assert len(fake.calls) == 3
+    assert after.cache.hot_keys(1) == [("juso:detail:4111:1:0:1:0:dong:", 2)]
+    assert warmup.pending() == []
+    text = render_metrics(after, warmup)
+    assert 'postcode_warmup_keys{state="warmed"} 3' in text
+    assert "postcode_warmup_running 0" in text
+
+    # 이미 채워진 key는 다시 호출하지 않음
+    again = await WarmUp(rate_per_second=0).run(after, load_snapshot(path))
+    assert again["skipped"] == 4 and len(fake.calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_warm_up_waits_while_requests_hold_the_limiter(monkeypatch):
+    fake = FakeJuso(total=1)
+    container = make_container(monkeypatch, fake)
+    # 처리 중인 실제 요청 1건
+    permit = await container.rate_limiter.acquire(JUSO_API_URL, {"confmKey": "road"})
+
+    warmup = WarmUp(rate_per_second=0, idle_poll_seconds=0.01)
+    task = asyncio.create_task(warmup.run(container, [("juso:v2:효원로 1:none", 5)]))
+    await asyncio.sleep(0.1)
+    assert warmup.progress()["running"] and fake.calls == []
+
+    permit.release(Outcome.OK)
+    result = await asyncio.wait_for(task, timeout=2)
+    assert result["warmed"] == 1 and len(fake.calls) == 1